@@ -28,6 +28,7 @@ def create_app() -> Litestar:
         cors,
         db,
         exceptions,
+        http_client,
         log,
         repository,
         settings,
@@ -37,12 +38,18 @@ def create_app() -> Litestar:
         create_collection_dependencies,
     )
 
-    dependencies = {constants.USER_DEPENDENCY_KEY: Provide(provide_user)}
+    dependencies = {
+        constants.USER_DEPENDENCY_KEY: Provide(provide_user),
+        constants.HTTP_CLIENT_DEPENDENCY_KEY: Provide(http_client.provide_http_client, sync_to_thread=False),
+    }
     dependencies.update(create_collection_dependencies())
 
     return Litestar(
         response_cache_config=cache.config,
-        stores=StoreRegistry(default_factory=cache.redis_store_factory),
+        stores=StoreRegistry(
+            stores={cache.config.store: cache.response_cache_store},
+            default_factory=cache.redis_store_factory,
+        ),
         cors_config=cors.config,
         dependencies=dependencies,
         exception_handlers={
@@ -56,8 +63,13 @@ def create_app() -> Litestar:
         type_encoders={pgproto.UUID: str, SecretStr: str},
         route_handlers=[*domain.routes],
         plugins=[db.plugin, domain.plugins.aiosql],
-        on_shutdown=[cache.redis.close],
-        on_startup=[lambda: log.configure(log.default_processors)],  # type: ignore[arg-type]
+        after_exception=[cache.release_failed_flights],
+        on_shutdown=[cache.on_shutdown, http_client.on_shutdown],
+        on_startup=[
+            lambda: log.configure(log.default_processors),  # type: ignore[arg-type]
+            cache.on_startup,
+            http_client.on_startup,
+        ],
         on_app_init=[domain.security.auth.on_app_init, repository.on_app_init],
         static_files_config=static_files.config,
         template_config=template_config,  # type: ignore[arg-type]
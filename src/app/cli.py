@@ -162,20 +162,38 @@ def run_all_app(
     required=False,
     show_default=True,
 )
+@click.option(
+    "--worker-processes",
+    help="The number of worker processes, each running the workers of all the queues.",
+    type=click.IntRange(min=1),
+    default=settings.worker.PROCESSES,
+    required=False,
+    show_default=True,
+)
+@click.option(
+    "-q",
+    "--queue",
+    help="A queue to run the worker of, can be repeated. Defaults to all the queues.",
+    type=click.Choice(list(worker.queues)),
+    multiple=True,
+)
 @click.option("-v", "--verbose", help="Enable verbose logging.", is_flag=True, default=False, type=bool)
 @click.option("-d", "--debug", help="Enable debugging.", is_flag=True, default=False, type=bool)
 def run_worker(
     worker_concurrency: int | None,
+    worker_processes: int | None,
+    queue: tuple[str, ...],
     verbose: bool | None,
     debug: bool | None,
 ) -> None:
     """Run the API server."""
     log.config.configure()
     settings.worker.CONCURRENCY = worker_concurrency or settings.worker.CONCURRENCY
+    settings.worker.PROCESSES = worker_processes or settings.worker.PROCESSES
     settings.app.DEBUG = debug or settings.app.DEBUG
     settings.log.LEVEL = 10 if verbose or settings.app.DEBUG else settings.log.LEVEL
     logger.info("starting Background worker processes.")
-    worker.run_worker()
+    worker.run_worker(queue)
 
 
 @user_management_app.command(name="create-user", help="Create a user")
@@ -4,24 +4,48 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from uuid import UUID
 
+from httpx import AsyncClient
 from litestar.contrib.jwt import OAuth2Login
-from litestar.contrib.repository.filters import FilterTypes
 from litestar.dto.factory import DTOData
-from litestar.pagination import OffsetPagination
+from litestar.pagination import CursorPagination, OffsetPagination
 from litestar.types import TypeEncodersMap
 from pydantic import UUID4
 from saq.types import QueueInfo
 
 from app.domain.accounts.dtos import AccountLogin, AccountRegister, UserCreate, UserUpdate
 from app.domain.accounts.models import User
-from app.domain.analytics.dtos import NewUsersByWeek
+from app.domain.analytics.dtos import (
+    BacklogsBySprint,
+    NewUsersByWeek,
+    PointsBurnedByWeek,
+    SprintBurndown,
+    SprintBurnup,
+    Velocity,
+)
 from app.domain.tags.models import Tag
 from app.domain.teams.models import Team
 from app.lib import settings, worker
+from app.lib.dependencies import ArrayFilter, FilterTypes
 from app.lib.service.generic import Service
 from app.lib.worker.controllers import WorkerController
+from app.plugins import zulip
 
-from . import accounts, analytics, backlogs, openapi, plugins, projects, room, security, system, tags, teams, urls, web
+from . import (
+    accounts,
+    analytics,
+    backlogs,
+    openapi,
+    outbox,
+    plugins,
+    projects,
+    room,
+    security,
+    system,
+    tags,
+    teams,
+    urls,
+    web,
+)
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
@@ -61,6 +85,7 @@ __all__ = [
     "routes",
     "openapi",
     "analytics",
+    "outbox",
     "plugins",
     "backlogs",
     "projects",
@@ -70,24 +95,36 @@ tasks: dict[worker.Queue, list[worker.WorkerFunction]] = {
     worker.queues.get("system-tasks"): [  # type: ignore[dict-item]
         worker.tasks.system_task,
         worker.tasks.system_upkeep,
+        analytics.tasks.fold_rollups,
     ],
     worker.queues.get("background-tasks"): [  # type: ignore[dict-item]
         worker.tasks.background_worker_task,
+        outbox.tasks.deliver_outbox,
+        zulip.update_backlog_message,
     ],
 }
 scheduled_tasks: dict[worker.Queue, list[worker.CronJob]] = {
     worker.queues.get("system-tasks"): [  # type: ignore[dict-item]
         worker.CronJob(function=worker.tasks.system_upkeep, unique=True, cron="0 * * * *", timeout=500),
+        worker.CronJob(function=analytics.tasks.fold_rollups, unique=True, cron="* * * * *", timeout=300),
     ],
     worker.queues.get("background-tasks"): [  # type: ignore[dict-item]
         worker.CronJob(function=worker.tasks.background_worker_task, unique=True, cron="* * * * *", timeout=300),
+        worker.CronJob(
+            function=outbox.tasks.deliver_outbox,
+            unique=True,
+            cron="* * * * *",
+            timeout=settings.worker.OUTBOX_TIMEOUT,
+        ),
     ],
 }
 
 
 signature_namespace: Mapping[str, Any] = {
+    "AsyncClient": AsyncClient,
     "Service": Service,
     "FilterTypes": FilterTypes,
+    "ArrayFilter": ArrayFilter,
     "UUID": UUID,
     "UUID4": UUID4,
     "User": User,
@@ -97,9 +134,15 @@ signature_namespace: Mapping[str, Any] = {
     "AccountLogin": AccountLogin,
     "AccountRegister": AccountRegister,
     "NewUsersByWeek": NewUsersByWeek,
+    "BacklogsBySprint": BacklogsBySprint,
+    "PointsBurnedByWeek": PointsBurnedByWeek,
+    "SprintBurndown": SprintBurndown,
+    "SprintBurnup": SprintBurnup,
+    "Velocity": Velocity,
     "Tag": Tag,
     "OAuth2Login": OAuth2Login,
     "OffsetPagination": OffsetPagination,
+    "CursorPagination": CursorPagination,
     "UserService": accounts.services.UserService,
     "TeamService": teams.services.TeamService,
     "TagService": tags.services.TagService,
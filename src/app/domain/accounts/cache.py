@@ -0,0 +1,196 @@
+"""Cache of the authenticated user."""
+from __future__ import annotations
+
+from functools import partial
+from typing import TYPE_CHECKING, Any, cast
+
+import msgspec
+from redis.exceptions import RedisError
+from sqlalchemy import inspect
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.domain.accounts.models import User
+from app.lib import cache, db, log, serialization, settings
+from app.lib.db.orm import column_python_type
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from uuid import UUID
+
+    from redis.asyncio import Redis
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.orm import Mapper
+
+__all__ = ["UserCache", "user_cache"]
+
+logger = log.get_logger()
+# untyped in SQLAlchemy
+_set_committed_value = cast("Callable[[object, str, Any], None]", set_committed_value)
+
+_EXCLUDED_USER_COLUMNS = frozenset({"hashed_password"})
+USER_CACHE_IDS_SESSION_KEY = "user_cache_ids"
+
+
+class UserCache:
+    """Two tier cache of the users looked up by `current_user_from_token`.
+
+    Entries are keyed by the token subject, the user email, and hold the user columns and team memberships.  They
+    are kept in process for a few seconds and in Redis for longer, along with a user id to email index so that
+    services can invalidate them by user id.  Redis errors are logged and treated as a miss.
+
+    Invalidations are published on [`INVALIDATION_CHANNEL`][app.lib.cache.INVALIDATION_CHANNEL], for the other
+    processes to drop their in process entries too.
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        namespace: str,
+        expiration: int,
+        local_expiration: int,
+        maxsize: int,
+    ) -> None:
+        self.redis = redis
+        self.namespace = namespace
+        self.expiration = expiration
+        self.local: cache.LRUCache[str, dict[str, Any]] = cache.LRUCache(maxsize=maxsize, expiration=local_expiration)
+        cache.local_caches[namespace] = self.local
+
+    def _email_key(self, email: str) -> str:
+        return f"{self.namespace}:email:{email}"
+
+    def _id_key(self, user_id: UUID | str) -> str:
+        return f"{self.namespace}:id:{user_id}"
+
+    async def get(self, email: str) -> User | None:
+        """Get the cached user.
+
+        Args:
+            email: The token subject.
+
+        Returns:
+            A detached user with its team memberships, or `None` on a cache miss.
+        """
+        payload = self.local.get(email)
+        if payload is None:
+            try:
+                raw = await self.redis.get(self._email_key(email))
+            except RedisError:
+                logger.warning("user cache unavailable", exc_info=True)
+                return None
+            if raw is None:
+                return None
+            payload = serialization.from_json(raw)
+            self.local.set(email, payload)
+        return _user_from_payload(payload)
+
+    async def set(self, user: User) -> None:
+        """Cache `user`, which must have its team memberships loaded."""
+        payload = _user_to_payload(user)
+        self.local.set(user.email, payload)
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.set(self._email_key(user.email), serialization.to_json(payload), ex=self.expiration)
+                pipe.set(self._id_key(user.id), user.email, ex=self.expiration)
+                await pipe.execute()
+        except RedisError:
+            logger.warning("user cache unavailable", exc_info=True)
+
+    async def invalidate(self, *user_ids: UUID, session: AsyncSession | None = None) -> None:
+        """Remove users from the cache, e.g. after their account or team membership changed.
+
+        With `session`, the users are removed again once it commits, to drop the entries that concurrent requests
+        cached from the data as it was before the commit.
+
+        Args:
+            *user_ids: Identifiers of the users.
+            session: Session the change is made in.
+        """
+        if not user_ids:
+            return
+        if session is not None:
+            pending: set[UUID] = session.info.setdefault(USER_CACHE_IDS_SESSION_KEY, set())
+            if not pending:
+                db.after_commit(session, partial(self._invalidate_committed, session))
+            pending.update(user_ids)
+        ids = {str(user_id) for user_id in user_ids}
+        emails = {email for email, payload in self.local.items() if payload["id"] in ids}
+        for email in emails:
+            self.local.pop(email)
+        try:
+            id_keys = [self._id_key(user_id) for user_id in ids]
+            emails.update(email.decode() for email in await self.redis.mget(id_keys) if email is not None)
+            await self.redis.delete(*id_keys, *(self._email_key(email) for email in emails))
+            await cache.publish_local_invalidation(self.namespace, sorted(emails))
+        except RedisError:
+            logger.warning("user cache unavailable", exc_info=True)
+
+    async def _invalidate_committed(self, session: AsyncSession) -> None:
+        await self.invalidate(*session.info.pop(USER_CACHE_IDS_SESSION_KEY, ()))
+
+    def clear(self) -> None:
+        """Clear the in process tier."""
+        self.local.clear()
+
+
+def _mapper(model: type[Any]) -> Mapper[Any]:
+    return cast("Mapper[Any]", inspect(model))
+
+
+def _columns_to_dict(instance: object, exclude: frozenset[str] = frozenset()) -> dict[str, Any]:
+    return {
+        attr.key: getattr(instance, attr.key)
+        for attr in _mapper(type(instance)).column_attrs
+        if attr.key not in exclude and not attr.key.startswith("_")
+    }
+
+
+def _columns_from_dict(model: type[Any], values: dict[str, Any]) -> dict[str, Any]:
+    column_attrs = _mapper(model).column_attrs
+    converted = {}
+    for key, value in values.items():
+        python_type = column_python_type(column_attrs[key].columns[0].type)
+        converted[key] = value if value is None or python_type is None else msgspec.convert(value, python_type)
+    return converted
+
+
+def _user_to_payload(user: User) -> dict[str, Any]:
+    payload = _columns_to_dict(user, _EXCLUDED_USER_COLUMNS)
+    payload["teams"] = [
+        {**_columns_to_dict(membership), "team": _columns_to_dict(membership.team)} for membership in user.teams
+    ]
+    # round trip through JSON once so that the local tier holds the same values as Redis
+    return serialization.from_json(serialization.to_json(payload))  # type: ignore[no-any-return]
+
+
+def _user_from_payload(payload: dict[str, Any]) -> User:
+    """Rebuild a detached user, so that it is never inserted if it ends up added to a session."""
+    # resolved through the mappers, as importing the teams domain here would be circular
+    membership_model = _mapper(User).relationships["teams"].mapper.class_
+    team_model = _mapper(membership_model).relationships["team"].mapper.class_
+    values = {key: value for key, value in payload.items() if key != "teams"}
+    user = User(**_columns_from_dict(User, values))
+    memberships = []
+    for membership_payload in payload["teams"]:
+        membership_values = {key: value for key, value in membership_payload.items() if key != "team"}
+        team = team_model(**_columns_from_dict(team_model, membership_payload["team"]))
+        membership = membership_model(**_columns_from_dict(membership_model, membership_values))
+        _set_committed_value(membership, "team", team)
+        _set_committed_value(membership, "user", user)
+        make_transient_to_detached(team)
+        make_transient_to_detached(membership)
+        memberships.append(membership)
+    _set_committed_value(user, "teams", memberships)
+    make_transient_to_detached(user)
+    return user
+
+
+user_cache = UserCache(
+    redis=cache.redis,
+    namespace=f"{settings.app.slug}:users",
+    expiration=settings.api.USER_CACHE_EXPIRATION,
+    local_expiration=settings.api.USER_CACHE_LOCAL_EXPIRATION,
+    maxsize=settings.api.USER_CACHE_SIZE,
+)
+"""Authenticated user cache."""
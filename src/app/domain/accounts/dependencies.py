@@ -26,11 +26,14 @@ async def provides_user_service(db_session: AsyncSession) -> AsyncGenerator[User
     """Construct repository and service objects for the request."""
     async with UserService.new(
         session=db_session,
-        statement=select(User)
-        .order_by(User.email)
-        .options(
-            noload("*"),
-            selectinload(User.teams).options(joinedload(TeamMember.team, innerjoin=True).options(noload("*"))),
+        statement=UserService.cached_statement(
+            "list",
+            lambda: select(User)
+            .order_by(User.email)
+            .options(
+                noload("*"),
+                selectinload(User.teams).options(joinedload(TeamMember.team, innerjoin=True).options(noload("*"))),
+            ),
         ),
     ) as service:
         try:
@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime  # noqa: TCH003
 from typing import TYPE_CHECKING
 
-from sqlalchemy import String
+from sqlalchemy import Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.lib import dto
@@ -19,7 +19,10 @@ class User(orm.TimestampedDatabaseModel):
     """User Model."""
 
     __tablename__ = "user_account"  # type: ignore[assignment]
-    __table_args__ = {"comment": "User accounts for application access"}
+    __table_args__ = (
+        Index("ix_user_account_created_at", "created_at"),
+        {"comment": "User accounts for application access"},
+    )
     email: Mapped[str] = mapped_column(unique=True)
     name: Mapped[str | None]
     hashed_password: Mapped[str | None] = mapped_column(String(length=255), info=dto.dto_field("private"))
@@ -5,7 +5,8 @@ from typing import Any
 from litestar.exceptions import PermissionDeniedException
 from pydantic import SecretStr
 
-from app.lib import crypt
+from app.domain.accounts.cache import user_cache
+from app.lib import cache, crypt
 from app.lib.repository import SQLAlchemyAsyncRepository
 from app.lib.service.sqlalchemy import SQLAlchemyAsyncRepositoryService
 
@@ -29,6 +30,25 @@ class UserService(SQLAlchemyAsyncRepositoryService[User]):
         self.repository: UserRepository = self.repository_type(**repo_kwargs)
         self.model_type = self.repository.model_type
 
+    async def update(self, item_id: Any, data: User | dict[str, Any]) -> User:
+        """Update a user and drop it from the authenticated user cache."""
+        db_obj = await super().update(item_id, data)
+        await self._invalidate_cache(db_obj)
+        return db_obj
+
+    async def delete(self, item_id: Any) -> User:
+        """Delete a user and drop it from the authenticated user cache."""
+        db_obj = await super().delete(item_id)
+        await self._invalidate_cache(db_obj)
+        return db_obj
+
+    async def _invalidate_cache(self, db_obj: User) -> None:
+        """Invalidate the cached user, and the cached responses showing it as backlog assignee or project owner."""
+        await user_cache.invalidate(db_obj.id, session=self.repository.session)
+        await cache.invalidate_response_cache(
+            self.repository.session, "backlogs", "backlogs:details", "projects", "projects:details"
+        )
+
     async def authenticate(self, username: str, password: SecretStr | str) -> User:
         """Authenticate a user.
 
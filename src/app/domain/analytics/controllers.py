@@ -11,10 +11,18 @@ from pydantic import parse_obj_as
 from app.domain import urls
 from app.domain.accounts.guards import requires_active_user
 from app.domain.analytics.dependencies import provides_analytic_queries
-from app.domain.analytics.dtos import NewUsersByWeekDTO
-from app.lib import log
+from app.domain.analytics.dtos import (
+    BacklogsBySprintDTO,
+    NewUsersByWeekDTO,
+    PointsBurnedByWeekDTO,
+    SprintBurndownDTO,
+    SprintBurnupDTO,
+    VelocityDTO,
+)
+from app.domain.backlogs.models import StatusEnum
+from app.lib import cache, log, settings
 
-from .dtos import NewUsersByWeek
+from .dtos import BacklogsBySprint, NewUsersByWeek, PointsBurnedByWeek, SprintBurndown, SprintBurnup, Velocity
 
 if TYPE_CHECKING:
     from app.lib.aiosql import AiosqlQueryManager
@@ -50,3 +58,98 @@ class StatsController(Controller):
         return OffsetPagination[NewUsersByWeek](
             items=parse_obj_as(list[NewUsersByWeek], results), total=len(results), limit=len(results), offset=0
         )
+
+    @get(
+        operation_id="StatsSprintBacklogs",
+        name="stats:sprint-backlogs",
+        path=urls.STATS_SPRINT_BACKLOGS,
+        summary="Sprint Backlogs",
+        description="List Backlogs Created and Completed by Project Sprint.",
+        cache=1000,
+        return_dto=BacklogsBySprintDTO,
+    )
+    async def sprint_backlogs(self, analytic_queries: AiosqlQueryManager) -> OffsetPagination[BacklogsBySprint]:
+        """Backlogs created and completed by project sprint."""
+        results = await analytic_queries.select("backlogs_by_sprint")
+        return OffsetPagination[BacklogsBySprint](
+            items=parse_obj_as(list[BacklogsBySprint], results), total=len(results), limit=len(results), offset=0
+        )
+
+    @get(
+        operation_id="StatsWeeklyPointsBurned",
+        name="stats:weekly-points-burned",
+        path=urls.STATS_WEEKLY_POINTS_BURNED,
+        summary="Weekly Points Burned",
+        description="List Points Burned by Project and Week.",
+        cache=1000,
+        return_dto=PointsBurnedByWeekDTO,
+    )
+    async def weekly_points_burned(self, analytic_queries: AiosqlQueryManager) -> OffsetPagination[PointsBurnedByWeek]:
+        """Points burned by project and week."""
+        results = await analytic_queries.select("points_burned_by_week")
+        return OffsetPagination[PointsBurnedByWeek](
+            items=parse_obj_as(list[PointsBurnedByWeek], results), total=len(results), limit=len(results), offset=0
+        )
+
+    @get(
+        operation_id="StatsSprintBurndown",
+        name="stats:sprint-burndown",
+        path=urls.STATS_SPRINT_BURNDOWN,
+        summary="Sprint Burndown",
+        description="List the Remaining Points of a Sprint by Day, along with the Ideal Burndown.",
+        cache=settings.api.TAGGED_CACHE_EXPIRATION,
+        cache_key_builder=cache.tagged_cache_key_builder("sprint:{project_slug}:{sprint_number}"),
+        return_dto=SprintBurndownDTO,
+    )
+    async def sprint_burndown(
+        self, analytic_queries: AiosqlQueryManager, project_slug: str, sprint_number: int
+    ) -> OffsetPagination[SprintBurndown]:
+        """Remaining points of a sprint by day."""
+        results = await analytic_queries.select(
+            "sprint_burn", project_slug=project_slug, sprint_number=sprint_number, completed=StatusEnum.completed.value
+        )
+        return OffsetPagination[SprintBurndown](
+            items=parse_obj_as(list[SprintBurndown], results), total=len(results), limit=len(results), offset=0
+        )
+
+    @get(
+        operation_id="StatsSprintBurnup",
+        name="stats:sprint-burnup",
+        path=urls.STATS_SPRINT_BURNUP,
+        summary="Sprint Burnup",
+        description="List the Scope and Completed Points of a Sprint by Day.",
+        cache=settings.api.TAGGED_CACHE_EXPIRATION,
+        cache_key_builder=cache.tagged_cache_key_builder("sprint:{project_slug}:{sprint_number}"),
+        return_dto=SprintBurnupDTO,
+    )
+    async def sprint_burnup(
+        self, analytic_queries: AiosqlQueryManager, project_slug: str, sprint_number: int
+    ) -> OffsetPagination[SprintBurnup]:
+        """Scope and completed points of a sprint by day."""
+        results = await analytic_queries.select(
+            "sprint_burn", project_slug=project_slug, sprint_number=sprint_number, completed=StatusEnum.completed.value
+        )
+        return OffsetPagination[SprintBurnup](
+            items=parse_obj_as(list[SprintBurnup], results), total=len(results), limit=len(results), offset=0
+        )
+
+    @get(
+        operation_id="StatsProjectVelocity",
+        name="stats:project-velocity",
+        path=urls.STATS_PROJECT_VELOCITY,
+        summary="Project Velocity",
+        description="List the Committed and Completed Points of each Sprint of a Project.",
+        cache=settings.api.TAGGED_CACHE_EXPIRATION,
+        cache_key_builder=cache.tagged_cache_key_builder("sprints:{project_slug}"),
+        return_dto=VelocityDTO,
+    )
+    async def project_velocity(
+        self, analytic_queries: AiosqlQueryManager, project_slug: str
+    ) -> OffsetPagination[Velocity]:
+        """Committed and completed points by sprint."""
+        results = await analytic_queries.select(
+            "project_velocity", project_slug=project_slug, completed=StatusEnum.completed.value
+        )
+        return OffsetPagination[Velocity](
+            items=parse_obj_as(list[Velocity], results), total=len(results), limit=len(results), offset=0
+        )
@@ -1,11 +1,24 @@
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import date, datetime
 
 from litestar.dto.factory.stdlib.dataclass import DataclassDTO
 
 from app.lib import dto
 
-__all__ = ["NewUsersByWeek", "NewUsersByWeekDTO"]
+__all__ = [
+    "BacklogsBySprint",
+    "BacklogsBySprintDTO",
+    "NewUsersByWeek",
+    "NewUsersByWeekDTO",
+    "PointsBurnedByWeek",
+    "PointsBurnedByWeekDTO",
+    "SprintBurndown",
+    "SprintBurndownDTO",
+    "SprintBurnup",
+    "SprintBurnupDTO",
+    "Velocity",
+    "VelocityDTO",
+]
 
 
 @dataclass
@@ -18,3 +31,70 @@ class NewUsersByWeekDTO(DataclassDTO[NewUsersByWeek]):
     """NewUsersByWeek."""
 
     config = dto.config()
+
+
+@dataclass
+class BacklogsBySprint:
+    project_slug: str
+    sprint_number: int
+    created: int
+    completed: int
+
+
+class BacklogsBySprintDTO(DataclassDTO[BacklogsBySprint]):
+    """BacklogsBySprint."""
+
+    config = dto.config()
+
+
+@dataclass
+class PointsBurnedByWeek:
+    project_slug: str
+    week: datetime
+    points: int
+
+
+class PointsBurnedByWeekDTO(DataclassDTO[PointsBurnedByWeek]):
+    """PointsBurnedByWeek."""
+
+    config = dto.config()
+
+
+@dataclass
+class SprintBurndown:
+    day: date
+    remaining: int | None
+    ideal: float
+
+
+class SprintBurndownDTO(DataclassDTO[SprintBurndown]):
+    """SprintBurndown."""
+
+    config = dto.config()
+
+
+@dataclass
+class SprintBurnup:
+    day: date
+    scope: int | None
+    completed: int | None
+
+
+class SprintBurnupDTO(DataclassDTO[SprintBurnup]):
+    """SprintBurnup."""
+
+    config = dto.config()
+
+
+@dataclass
+class Velocity:
+    sprint_number: int
+    committed: int
+    completed: int
+    average: float
+
+
+class VelocityDTO(DataclassDTO[Velocity]):
+    """Velocity."""
+
+    config = dto.config()
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from datetime import datetime  # noqa: TCH003
+
+import sqlalchemy as sa
+from litestar.contrib.sqlalchemy.types import DateTimeUTC
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.lib.db.orm import TimestampedDatabaseModel
+
+__all__ = ["RollupWatermark", "SprintRollup", "WeeklyRollup"]
+
+
+class WeeklyRollup(TimestampedDatabaseModel):
+    """Weekly buckets of an analytics series, e.g. the new users or the points burned per project."""
+
+    __tablename__ = "analytics_weekly_rollup"  # type: ignore[assignment]
+    __table_args__ = (sa.UniqueConstraint("series", "dimension", "week"),)
+    series: Mapped[str] = mapped_column(sa.String(length=50))
+    dimension: Mapped[str] = mapped_column(sa.String(length=100), default="")
+    week: Mapped[datetime] = mapped_column(DateTimeUTC(timezone=True))
+    value: Mapped[float] = mapped_column(default=0)
+
+
+class SprintRollup(TimestampedDatabaseModel):
+    """Sprint buckets of an analytics series per project, e.g. the backlogs created or completed."""
+
+    __tablename__ = "analytics_sprint_rollup"  # type: ignore[assignment]
+    __table_args__ = (sa.UniqueConstraint("series", "project_slug", "sprint_number"),)
+    series: Mapped[str] = mapped_column(sa.String(length=50))
+    project_slug: Mapped[str] = mapped_column(default="")
+    sprint_number: Mapped[int]
+    value: Mapped[float] = mapped_column(default=0)
+
+
+class RollupWatermark(TimestampedDatabaseModel):
+    """Creation time up to which the rows of a source table are folded into the rollups."""
+
+    __tablename__ = "analytics_rollup_watermark"  # type: ignore[assignment]
+    source: Mapped[str] = mapped_column(sa.String(length=50), unique=True)
+    watermark: Mapped[datetime] = mapped_column(DateTimeUTC(timezone=True))
@@ -1,8 +1,21 @@
 --name: users-by-week
-select a.week, count(a.user_id) as new_users
-from (
-    select date_trunc('week', user_account.created_at) as week, user_account.id as user_id
-    from user_account
-) a
-group by a.week
-order by a.week
+select week, value::bigint as new_users
+from analytics_weekly_rollup
+where series = 'new-users' and dimension = ''
+order by week
+
+--name: backlogs-by-sprint
+select project_slug,
+       sprint_number,
+       coalesce(sum(value) filter (where series = 'backlogs-created'), 0)::bigint as created,
+       coalesce(sum(value) filter (where series = 'backlogs-completed'), 0)::bigint as completed
+from analytics_sprint_rollup
+where series in ('backlogs-created', 'backlogs-completed')
+group by project_slug, sprint_number
+order by project_slug, sprint_number
+
+--name: points-burned-by-week
+select dimension as project_slug, week, value::bigint as points
+from analytics_weekly_rollup
+where series = 'points-burned'
+order by dimension, week
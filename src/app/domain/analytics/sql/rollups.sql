@@ -0,0 +1,74 @@
+--name: lock-rollups$
+-- Serializes the folds, which would otherwise count the same rows twice.
+select pg_try_advisory_xact_lock(hashtext('analytics_rollup'))
+
+--name: get-rollup-watermark$
+select watermark
+from analytics_rollup_watermark
+where source = :source
+
+--name: set-rollup-watermark!
+insert into analytics_rollup_watermark (id, source, watermark, created_at, updated_at)
+values (gen_random_uuid(), :source, :watermark, now(), now())
+on conflict (source) do update set watermark = excluded.watermark, updated_at = excluded.updated_at
+
+--name: fold-new-users!
+-- Folds the users created in [since, until) into the weekly new users.
+insert into analytics_weekly_rollup (id, series, dimension, week, value, created_at, updated_at)
+select gen_random_uuid(), 'new-users', '', date_trunc('week', created_at), count(*), now(), now()
+from user_account
+where created_at >= :since and created_at < :until
+group by date_trunc('week', created_at)
+on conflict (series, dimension, week)
+do update set value = analytics_weekly_rollup.value + excluded.value, updated_at = excluded.updated_at
+
+--name: fold-backlogs-created!
+-- Folds the backlogs created in [since, until) into the backlogs created per sprint.
+insert into analytics_sprint_rollup (id, series, project_slug, sprint_number, value, created_at, updated_at)
+select gen_random_uuid(), 'backlogs-created', coalesce(project_slug, ''), sprint_number, count(*), now(), now()
+from backlog
+where created_at >= :since and created_at < :until
+group by coalesce(project_slug, ''), sprint_number
+on conflict (series, project_slug, sprint_number)
+do update set value = analytics_sprint_rollup.value + excluded.value, updated_at = excluded.updated_at
+
+--name: fold-backlogs-completed!
+-- Folds the status changes made in [since, until) into the backlogs completed per sprint: a change into completed
+-- counts one, a change out of it takes one back, in the sprint the backlog was in when it was changed.
+insert into analytics_sprint_rollup (id, series, project_slug, sprint_number, value, created_at, updated_at)
+select gen_random_uuid(),
+       'backlogs-completed',
+       coalesce(project_slug, ''),
+       sprint_number,
+       sum(case when new_value = :completed then 1 else -1 end),
+       now(),
+       now()
+from backlog_audit
+where field_name = 'status'
+  and (new_value = :completed) is distinct from (old_value = :completed)
+  and sprint_number is not null
+  and created_at >= :since
+  and created_at < :until
+group by coalesce(project_slug, ''), sprint_number
+on conflict (series, project_slug, sprint_number)
+do update set value = analytics_sprint_rollup.value + excluded.value, updated_at = excluded.updated_at
+
+--name: fold-points-burned!
+-- Folds the status changes made in [since, until) into the weekly points burned per project: a change into
+-- completed burns the points the backlog had when it was changed, a change out of it takes them back.
+insert into analytics_weekly_rollup (id, series, dimension, week, value, created_at, updated_at)
+select gen_random_uuid(),
+       'points-burned',
+       coalesce(project_slug, ''),
+       date_trunc('week', created_at),
+       sum(case when new_value = :completed then coalesce(points, 0) else -coalesce(points, 0) end),
+       now(),
+       now()
+from backlog_audit
+where field_name = 'status'
+  and (new_value = :completed) is distinct from (old_value = :completed)
+  and created_at >= :since
+  and created_at < :until
+group by coalesce(project_slug, ''), date_trunc('week', created_at)
+on conflict (series, dimension, week)
+do update set value = analytics_weekly_rollup.value + excluded.value, updated_at = excluded.updated_at
@@ -0,0 +1,65 @@
+--name: sprint-burn
+-- Daily scope, completed and remaining points of a sprint, replayed from the status changes of its backlogs.
+-- Backlogs are counted at their current points, from the day they were created.
+with sprint as (
+    select id, points, created_at::date as created_on, beg_date, due_date
+    from backlog
+    where project_slug = :project_slug and sprint_number = :sprint_number
+),
+changes as (
+    select created_on as day, points as scope_delta, 0 as completed_delta
+    from sprint
+    union all
+    select backlog_audit.created_at::date,
+           0,
+           case when backlog_audit.new_value = :completed then sprint.points else -sprint.points end
+    from backlog_audit
+    join sprint on sprint.id = backlog_audit.backlog_id
+    where backlog_audit.field_name = 'status'
+      and (backlog_audit.new_value = :completed) is distinct from (backlog_audit.old_value = :completed)
+),
+daily as (
+    select day, sum(scope_delta) as scope_delta, sum(completed_delta) as completed_delta
+    from changes
+    group by day
+),
+bounds as (
+    select min(least(sprint.beg_date, sprint.created_on)) as first_day,
+           greatest(max(sprint.due_date), (select max(day) from daily)) as last_day,
+           coalesce(sum(sprint.points), 0) as scope
+    from sprint
+),
+burn as (
+    select days.day::date as day,
+           sum(coalesce(daily.scope_delta, 0)) over (order by days.day) as scope,
+           sum(coalesce(daily.completed_delta, 0)) over (order by days.day) as completed
+    from bounds
+    cross join generate_series(bounds.first_day, bounds.last_day, interval '1 day') as days (day)
+    left join daily on daily.day = days.day::date
+)
+select burn.day,
+       case when burn.day <= current_date then burn.scope end::bigint as scope,
+       case when burn.day <= current_date then burn.completed end::bigint as completed,
+       case when burn.day <= current_date then burn.scope - burn.completed end::bigint as remaining,
+       round(
+           bounds.scope * (bounds.last_day - burn.day)::numeric / greatest(bounds.last_day - bounds.first_day, 1), 1
+       )::float as ideal
+from burn
+cross join bounds
+order by burn.day
+
+--name: project-velocity
+-- Committed and completed points per sprint of a project, with the completed points averaged over the last three sprints.
+select sprint_number,
+       committed,
+       completed,
+       round(avg(completed) over (order by sprint_number rows between 2 preceding and current row), 1)::float as average
+from (
+    select sprint_number,
+           coalesce(sum(points), 0)::bigint as committed,
+           coalesce(sum(points) filter (where status = :completed), 0)::bigint as completed
+    from backlog
+    where project_slug = :project_slug
+    group by sprint_number
+) as sprints
+order by sprint_number
@@ -0,0 +1,48 @@
+"""Analytics background tasks."""
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from app.domain.analytics.queries import analytics_queries
+from app.domain.backlogs.models import StatusEnum
+from app.lib import db, log, settings
+from app.lib.aiosql import AiosqlQueryManager
+
+__all__ = ["fold_rollups"]
+
+
+logger = log.get_logger()
+
+ROLLUP_FOLDS: dict[str, list[tuple[str, dict[str, Any]]]] = {
+    "user_account": [("fold_new_users", {})],
+    "backlog": [("fold_backlogs_created", {})],
+    "backlog_audit": [
+        ("fold_backlogs_completed", {"completed": StatusEnum.completed.value}),
+        ("fold_points_burned", {"completed": StatusEnum.completed.value}),
+    ],
+}
+"""Rollup queries to run for the rows of each source table created since its watermark."""
+
+
+async def fold_rollups(_: dict) -> None:
+    """Fold the rows created since the last run into the analytics rollups.
+
+    Each source table is only read from its watermark up to `WORKER_ROLLUP_LAG` seconds ago, so that the rows of
+    transactions still in flight are not skipped, and the rollups and watermarks are committed together.
+    """
+    until = datetime.now(UTC) - timedelta(seconds=settings.worker.ROLLUP_LAG)
+    async with db.session() as session:
+        async with AiosqlQueryManager.from_session(analytics_queries, session) as queries:
+            if not await queries.execute("lock_rollups"):
+                await logger.ainfo("Analytics rollups are already being folded.")
+                return
+            for source, folds in ROLLUP_FOLDS.items():
+                since = await queries.execute("get_rollup_watermark", source=source) or datetime.min.replace(tzinfo=UTC)
+                if since >= until:
+                    continue
+                for fold, binds in folds:
+                    await queries.execute(fold, since=since, until=until, **binds)
+                await queries.execute("set_rollup_watermark", source=source, watermark=until)
+        await session.commit()
+    await logger.ainfo("Analytics rollups folded.", until=until.isoformat())
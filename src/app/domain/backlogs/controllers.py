@@ -1,8 +1,9 @@
 # ruff: noqa: B008
 from collections.abc import Sequence
+from dataclasses import asdict
 from typing import TYPE_CHECKING, Any
 
-from litestar import Controller, delete, get, post, put
+from litestar import Controller, delete, get, patch, post, put
 from litestar.di import Provide
 from litestar.exceptions import HTTPException
 from litestar.params import Dependency
@@ -12,14 +13,16 @@ from app.domain.accounts.guards import requires_active_user
 from app.domain.accounts.models import User
 from app.domain.backlogs.dependencies import provides_service
 from app.domain.backlogs.models import Backlog as Model
-from app.domain.backlogs.models import PriorityEnum, ProgressEnum, ReadDTO, Service, StatusEnum, WriteDTO
+from app.domain.backlogs.models import BoardItem, BulkUpdate, BulkUpdateDTO, ReadDTO, SearchHit, Service, WriteDTO
+from app.lib import cache, settings
 
 if TYPE_CHECKING:
     from uuid import UUID
 
-    from litestar.contrib.repository import FilterTypes
-    from litestar.contrib.repository.filters import LimitOffset
-from litestar.pagination import OffsetPagination
+    from litestar.dto.factory import DTOData
+
+    from app.lib.dependencies import ArrayFilter, FilterTypes, LimitOffset
+from litestar.pagination import CursorPagination, OffsetPagination
 
 __all__ = [
     "ApiController",
@@ -40,9 +43,57 @@ class ApiController(Controller):
     slug_route = "/slug/{slug:str}"
     guards = [requires_active_user]
 
-    @get()
-    async def filter(self, service: "Service", filters: list["FilterTypes"] = validation_skip) -> Sequence[Model]:
-        return await service.list(*filters)
+    @get(
+        cache=settings.api.TAGGED_CACHE_EXPIRATION,
+        cache_key_builder=cache.tagged_cache_key_builder("backlogs"),
+    )
+    async def filter(
+        self,
+        service: "Service",
+        filters: list["FilterTypes"] = validation_skip,
+        label_filter: "ArrayFilter" = validation_skip,
+    ) -> Sequence[Model]:
+        return await service.list(*filters, label_filter)
+
+    @get(
+        "/cursor",
+        cache=settings.api.TAGGED_CACHE_EXPIRATION,
+        cache_key_builder=cache.tagged_cache_key_builder("backlogs"),
+    )
+    async def filter_by_cursor(
+        self,
+        service: "Service",
+        cursor_filters: list["FilterTypes"] = validation_skip,
+        label_filter: "ArrayFilter" = validation_skip,
+    ) -> "CursorPagination[str, Model]":
+        results = await service.list(*cursor_filters, label_filter)
+        return service.to_cursor_dto(results, *cursor_filters)
+
+    @get(
+        "/board",
+        return_dto=None,
+        cache=settings.api.TAGGED_CACHE_EXPIRATION,
+        cache_key_builder=cache.tagged_cache_key_builder("backlogs"),
+    )
+    async def board(
+        self,
+        service: "Service",
+        project_slug: str | None = None,
+        filters: list["FilterTypes"] = validation_skip,
+        label_filter: "ArrayFilter" = validation_skip,
+    ) -> list[BoardItem]:
+        if project_slug:
+            return await service.list_board(*filters, label_filter, project_slug=project_slug)
+        return await service.list_board(*filters, label_filter)
+
+    @get(
+        "/search",
+        return_dto=None,
+        cache=settings.api.TAGGED_CACHE_EXPIRATION,
+        cache_key_builder=cache.tagged_cache_key_builder("backlogs"),
+    )
+    async def search(self, service: "Service", q: str, limit_offset: "LimitOffset") -> list[SearchHit]:
+        return await service.search(q, limit_offset)
 
     @post()
     async def create(self, data: Model, current_user: User, service: "Service") -> Model:
@@ -52,7 +103,11 @@ class ApiController(Controller):
             data.assignee_id = current_user.id
         return await service.create(data)
 
-    @get(detail_route)
+    @get(
+        detail_route,
+        cache=settings.api.TAGGED_CACHE_EXPIRATION,
+        cache_key_builder=cache.tagged_cache_key_builder("backlogs:details", "backlog:{row_id}"),
+    )
     async def retrieve(self, service: "Service", row_id: "UUID") -> Model:
         return await service.get(row_id)
 
@@ -64,18 +119,40 @@ class ApiController(Controller):
             data.assignee_id = current_user.id
         return await service.update(row_id, data)
 
+    @patch("/bulk", dto=BulkUpdateDTO)
+    async def bulk_update(self, data: "DTOData[BulkUpdate]", service: "Service") -> Sequence[Model]:
+        bulk = data.create_instance()
+        values = {
+            key: value for key, value in asdict(bulk).items() if key not in {"ids", "slugs"} and value is not None
+        }
+        if not values:
+            raise HTTPException(status_code=400, detail="No backlog field to update")
+        return await service.bulk_update(values, ids=bulk.ids, slugs=bulk.slugs)
+
     @delete(detail_route, status_code=HTTP_200_OK)
     async def delete(self, service: "Service", row_id: "UUID") -> Model:
         return await service.delete(row_id)
 
-    @get(project_route)
+    @get(
+        project_route,
+        cache=settings.api.TAGGED_CACHE_EXPIRATION,
+        cache_key_builder=cache.tagged_cache_key_builder("backlogs"),
+    )
     async def filter_by_project_type(
-        self, service: "Service", project_type: str, limit_offset: "LimitOffset"
+        self,
+        service: "Service",
+        project_type: str,
+        limit_offset: "LimitOffset",
+        label_filter: "ArrayFilter" = validation_skip,
     ) -> "OffsetPagination[Model]":
-        results, total = await service.list_and_count(limit_offset, project_type=project_type)
+        results, total = await service.list_and_count(limit_offset, label_filter, project_type=project_type)
         return OffsetPagination(items=results, total=total, limit=limit_offset.limit, offset=limit_offset.offset)
 
-    @get(slug_route)
+    @get(
+        slug_route,
+        cache=settings.api.TAGGED_CACHE_EXPIRATION,
+        cache_key_builder=cache.tagged_cache_key_builder("backlogs:details", "backlog:{slug}"),
+    )
     async def retrieve_by_slug(self, service: "Service", slug: str) -> Model:
         obj = await service.repository.get_by_slug(slug)
         if obj:
@@ -83,21 +160,9 @@ class ApiController(Controller):
         raise HTTPException(status_code=404, detail=f"Backlog.slug {slug} not available")
 
     async def _update_progress(self, service: "Service", slug: str, delta: int) -> Model:
-        obj = await service.repository.get_by_slug(slug)
-        progress_list = list(ProgressEnum)
+        obj = await service.transition(slug, "progress", delta)
         if obj:
-            current_idx = progress_list.index(obj.progress)
-            next_idx = current_idx + delta
-            if next_idx < 0:
-                next_idx = 0
-            elif next_idx >= len(progress_list):
-                next_idx = len(progress_list) - 1
-            obj.progress = ProgressEnum(progress_list[next_idx])
-            if obj.progress != ProgressEnum.full:
-                obj.status = StatusEnum.started
-            else:
-                obj.status = StatusEnum.checked_in
-            return await service.update(obj.id, obj)
+            return obj
         raise HTTPException(status_code=404, detail=f"Backlog.slug {slug} not available")
 
     @put(f"progress/up{slug_route}")
@@ -113,17 +178,9 @@ class ApiController(Controller):
         return await self._update_progress(service, slug, 0)
 
     async def _update_priority(self, service: "Service", slug: str, delta: int) -> Model:
-        obj = await service.repository.get_by_slug(slug)
-        priority_list = list(PriorityEnum)
+        obj = await service.transition(slug, "priority", delta)
         if obj:
-            current_idx = priority_list.index(obj.priority)
-            next_idx = current_idx + delta
-            if next_idx < 0:
-                next_idx = 0
-            elif next_idx >= len(priority_list):
-                next_idx = len(priority_list) - 1
-            obj.priority = PriorityEnum(priority_list[next_idx])
-            return await service.update(obj.id, obj)
+            return obj
         raise HTTPException(status_code=404, detail=f"Backlog.slug {slug} not available")
 
     @put(f"priority/circle{slug_route}")
@@ -131,17 +188,9 @@ class ApiController(Controller):
         return await self._update_priority(service, slug, 0)
 
     async def update_status(self, service: "Service", slug: str, delta: int) -> Model:
-        obj = await service.repository.get_by_slug(slug)
-        status_list = list(StatusEnum)
+        obj = await service.transition(slug, "status", delta)
         if obj:
-            current_idx = status_list.index(obj.status)
-            next_idx = current_idx + delta
-            if next_idx < 0:
-                next_idx = 0
-            elif next_idx >= len(status_list):
-                next_idx = len(status_list) - 1
-            obj.status = StatusEnum(status_list[next_idx])
-            return await service.update(obj.id, obj)
+            return obj
         raise HTTPException(status_code=404, detail=f"Backlog.slug {slug} not available")
 
     @put(f"status/circle{slug_route}")
@@ -10,7 +10,7 @@ from sqlalchemy.orm import joinedload
 import app.plugins
 from app.domain.backlogs.models import Backlog, Service
 from app.lib import log
-from app.lib.plugin import BacklogPlugin
+from app.lib.plugin import BacklogPlugin, PluginDispatcher
 
 __all__ = ["provides_service"]
 
@@ -20,22 +20,29 @@ logger = log.get_logger()
 if TYPE_CHECKING:
     from collections.abc import AsyncGenerator
 
+    from httpx import AsyncClient
     from sqlalchemy.ext.asyncio import AsyncSession
 
 
-async def provides_service(db_session: AsyncSession) -> AsyncGenerator[Service, None]:
+async def provides_service(db_session: AsyncSession, http_client: AsyncClient) -> AsyncGenerator[Service, None]:
     plugins = []
     for _, name, _ in pkgutil.iter_modules([app.plugins.__path__[0]]):
         module = __import__(f"{app.plugins.__name__}.{name}", fromlist=["*"])
         for obj_name in dir(module):
             obj = getattr(module, obj_name)
             if isinstance(obj, type) and issubclass(obj, BacklogPlugin) and obj is not BacklogPlugin:
-                plugins.append(obj())
+                plugin = obj()
+                plugin.db_session = db_session
+                plugin.http_client = http_client
+                plugins.append(plugin)
     async with Service.new(
         session=db_session,
-        statement=select(Backlog).order_by(Backlog.due_date).options(joinedload(Backlog.project)),
+        statement=Service.cached_statement(
+            "list",
+            lambda: select(Backlog).order_by(Backlog.due_date).options(joinedload(Backlog.project)),
+        ),
     ) as service:
-        service.plugins = set(plugins)
+        service.plugins = PluginDispatcher(plugins)
         try:
             yield service
         finally:
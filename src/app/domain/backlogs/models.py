@@ -1,29 +1,72 @@
-import secrets
+import asyncio
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass, field
 from datetime import UTC, date, datetime, timedelta
 from enum import StrEnum
-from typing import Annotated, Any, cast
-from uuid import UUID
+from itertools import compress
+from typing import TYPE_CHECKING, Annotated, Any, Literal, cast
+from uuid import UUID, uuid4
 
+import msgspec
 from litestar.contrib.sqlalchemy.dto import SQLAlchemyDTO
+from litestar.contrib.sqlalchemy.repository._util import wrap_sqlalchemy_exception
 from litestar.dto.factory import DTOConfig, Mark, dto_field
-from sqlalchemy import ARRAY, ForeignKey, SQLColumnExpression, String
+from litestar.dto.factory.stdlib.dataclass import DataclassDTO
+from sqlalchemy import (
+    ARRAY,
+    DDL,
+    Case,
+    Column,
+    ColumnElement,
+    Computed,
+    ForeignKey,
+    Index,
+    Select,
+    SQLColumnExpression,
+    String,
+    any_,
+    case,
+    func,
+    insert,
+    inspect,
+    literal,
+    literal_column,
+    or_,
+    select,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.event import listen, listens_for
 from sqlalchemy.ext.associationproxy import AssociationProxy, association_proxy
 from sqlalchemy.ext.hybrid import hybrid_property
-from sqlalchemy.orm import Mapped, relationship
+from sqlalchemy.orm import Mapped, Session, aliased, relationship
 from sqlalchemy.orm import mapped_column as m_col
+from sqlalchemy.orm.base import NO_VALUE
 
 from app.domain.accounts.models import User
 from app.domain.projects.models import Project
+from app.lib import cache, serialization
 from app.lib.db import orm
-from app.lib.plugin import BacklogPlugin
-from app.lib.repository import SQLAlchemyAsyncSlugRepository
+from app.lib.filters import FilterTypes, LimitOffset
+from app.lib.plugin import BacklogPlugin, PluginDispatcher
+from app.lib.repository import SQLAlchemyAsyncSlugRepository, statement_cache
 from app.lib.service.sqlalchemy import SQLAlchemyAsyncRepositoryService
 
+if TYPE_CHECKING:
+    from sqlalchemy import Subquery
+
 __all__ = [
     "Backlog",
+    "BacklogAudit",
+    "BoardItem",
+    "BulkUpdate",
+    "BulkUpdateDTO",
     "ReadDTO",
     "Repository",
+    "SearchHit",
     "Service",
+    "TransitionField",
     "WriteDTO",
 ]
 
@@ -76,7 +119,34 @@ class ItemType(StrEnum):
     self = "self"
 
 
+# untyped in SQLAlchemy
+_DDL = cast("Callable[[str], DDL]", DDL)
+
+SEARCH_CONFIG = "english"
+"""Text search configuration of the backlog search vector and queries."""
+TRIGRAM_QUERY_MAX_LENGTH = 3
+"""Length up to which search queries are matched by trigram similarity instead of full text search."""
+
+# `array_to_string` is only stable, so the labels are joined by an immutable wrapper for the generated column
+_SEARCH_VECTOR = (
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(slug, '')), 'B') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(immutable_array_to_string(labels, ' '), '')), 'B') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'C')"
+)
+
+
 class Backlog(orm.TimestampedDatabaseModel):
+    __table_args__ = (
+        Index("ix_backlog_created_at", "created_at"),
+        Index("ix_backlog_project_slug_sprint_number", "project_slug", "sprint_number"),
+        Index("ix_backlog_labels", "labels", postgresql_using="gin"),
+        # only read by the search, so it isn't mapped, which keeps the instances from loading it or writing it back
+        Column("search_vector", TSVECTOR, Computed(_SEARCH_VECTOR, persisted=True)),
+        Index("ix_backlog_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_backlog_title_trgm", "title", postgresql_using="gin", postgresql_ops={"title": "gin_trgm_ops"}),
+    )
+    __mapper_args__ = {"exclude_properties": ["search_vector"]}
     title: Mapped[str] = m_col(String(length=200), index=True)
     description: Mapped[str | None]
     slug: Mapped[str] = m_col(String(length=50), unique=True, index=True, info=dto_field(Mark.READ_ONLY))
@@ -93,7 +163,7 @@ class Backlog(orm.TimestampedDatabaseModel):
     end_date: Mapped[date] = m_col(default=datetime.now(tz=UTC).date)
     due_date: Mapped[date] = m_col(default=datetime.now(tz=UTC).date)
     labels: Mapped[list[str]] = m_col(ARRAY(String), nullable=True)
-    plugin_meta: Mapped[dict] = m_col(default=lambda: dict, info=dto_field(Mark.READ_ONLY))  # Relationships
+    plugin_meta: Mapped[dict] = m_col(default=dict, info=dto_field(Mark.READ_ONLY))  # Relationships
     assignee_id: Mapped[UUID | None] = m_col(ForeignKey(User.id))
     owner_id: Mapped[UUID | None] = m_col(ForeignKey(User.id))
     project_slug: Mapped[str] = m_col(ForeignKey(Project.slug), nullable=True)
@@ -128,34 +198,337 @@ class Backlog(orm.TimestampedDatabaseModel):
     def _project_type_expression(cls) -> SQLColumnExpression[String | None]:
         return cast("SQLColumnExpression[String | None]", cls.project_slug + "_" + cls.type)
 
+    def to_dict(self, exclude: set[str] | None = None) -> dict[str, Any]:
+        return super().to_dict({"search_vector", *(exclude or ())})
+
 
 Backlog.registry.update_type_annotation_map(
     {TagEnum: String, PriorityEnum: String, ProgressEnum: String, ItemType: String}
 )
+# also created by the migrations, for the tables created from the metadata
+listen(Backlog.__table__, "before_create", _DDL("create extension if not exists pg_trgm"))
+listen(
+    Backlog.__table__,
+    "before_create",
+    _DDL(
+        "create or replace function immutable_array_to_string(text[], text) returns text "
+        "language sql immutable parallel safe as $$ select array_to_string($1, $2) $$"
+    ),
+)
 
 
 class BacklogAudit(orm.TimestampedDatabaseModel):
-    backlog_id: Mapped[UUID] = m_col(ForeignKey(Backlog.id))
+    __table_args__ = (Index("ix_backlog_audit_created_at", "created_at"),)
+    backlog_id: Mapped[UUID] = m_col(ForeignKey(Backlog.id), index=True)
     field_name: Mapped[str]
     old_value: Mapped[str]
     new_value: Mapped[str]
+    # the sprint and points of the backlog once changed, so that the analytics count changes where they were made
+    project_slug: Mapped[str | None]
+    sprint_number: Mapped[int | None]
+    points: Mapped[int | None]
+
+
+BACKLOG_AUDIT_SESSION_KEY = "backlog_audits"
+_UNAUDITED_COLUMNS = frozenset({"id", "_sentinel", "created_at", "updated_at", "plugin_meta", "search_vector"})
+_AUDITED_COLUMNS = frozenset(column.key for column in Backlog.__table__.columns) - _UNAUDITED_COLUMNS
+
+
+def _audit_value(value: Any) -> str:
+    """Format a column value for the audit, e.g. `"✅"` for `StatusEnum.completed` and `""` for `None`."""
+    if value is None:
+        return ""
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, list | dict):
+        return serialization.to_json(value).decode()
+    return str(value)
+
+
+@listens_for(Session, "after_flush")
+def record_backlog_audits(session: Session, *_: Any) -> None:
+    """Record the columns changed on the backlogs updated by the flush.
+
+    The changes are read from the committed state of the instances, i.e. the values their changed attributes had when
+    loaded, which the flush hasn't reset yet.  The rows are kept in the session until it commits, see
+    [`insert_backlog_audits`][app.domain.backlogs.models.insert_backlog_audits].
+    """
+    now = datetime.now(UTC)
+    rows = []
+    for instance in session.dirty:
+        if not isinstance(instance, Backlog):
+            continue
+        state = inspect(instance, raiseerr=True)
+        for key in _AUDITED_COLUMNS.intersection(state.committed_state):
+            old_value, new_value = state.committed_state[key], state.dict.get(key)
+            if old_value is NO_VALUE:
+                old_value = None
+            # compared as the attribute history does, SQL expressions compare to an expression
+            if (old_value == new_value) is not True:
+                rows.append(
+                    {
+                        "id": uuid4(),
+                        "backlog_id": instance.id,
+                        "field_name": key,
+                        "old_value": _audit_value(old_value),
+                        "new_value": _audit_value(new_value),
+                        "project_slug": instance.project_slug,
+                        "sprint_number": instance.sprint_number,
+                        "points": instance.points,
+                        "created_at": now,
+                        "updated_at": now,
+                    }
+                )
+    if rows:
+        session.info.setdefault(BACKLOG_AUDIT_SESSION_KEY, []).extend(rows)
+
+
+@listens_for(Session, "before_commit")
+def insert_backlog_audits(session: Session) -> None:
+    """Insert the audit rows recorded in the transaction of `session`, with one statement.
+
+    Inserting them once per transaction rather than after every flush keeps the updates to a single round trip each.
+    The session is flushed first, so that the changes the commit would flush are recorded too.
+    """
+    session.flush()
+    rows = session.info.pop(BACKLOG_AUDIT_SESSION_KEY, None)
+    if rows:
+        session.connection().execute(insert(BacklogAudit), rows)
+
+
+@listens_for(Session, "after_soft_rollback")
+def drop_backlog_audits(session: Session, _: Any) -> None:
+    """Drop the audit rows recorded in the transaction of `session` once it rolls back."""
+    if not session.in_transaction():
+        session.info.pop(BACKLOG_AUDIT_SESSION_KEY, None)
+
+
+TransitionField = Literal["progress", "priority", "status"]
+_TRANSITION_ENUMS: dict[str, type[StrEnum]] = {
+    "progress": ProgressEnum,
+    "priority": PriorityEnum,
+    "status": StatusEnum,
+}
+
+
+def _step(column: Any, members: list[StrEnum], delta: int) -> Case[Any]:
+    """`CASE` moving `column` `delta` members along `members`, clamped to the first and last one."""
+    last = len(members) - 1
+    return case(
+        {member.value: members[min(max(index + delta, 0), last)].value for index, member in enumerate(members)},
+        value=column,
+        else_=column,
+    )
 
 
 WriteDTO = SQLAlchemyDTO[Annotated[Backlog, DTOConfig(exclude={"id", "created_at", "updated_at"})]]
 ReadDTO = SQLAlchemyDTO[Annotated[Backlog, DTOConfig(exclude={"project", "audits"})]]
 
 
+@dataclass
+class BulkUpdate:
+    """Change applied to the backlogs with `ids` or `slugs`, the fields left to `None` are kept."""
+
+    ids: list[UUID] = field(default_factory=list)
+    slugs: list[str] = field(default_factory=list)
+    sprint_number: int | None = None
+    assignee_id: UUID | None = None
+    priority: PriorityEnum | None = None
+    status: StatusEnum | None = None
+
+
+BulkUpdateDTO = DataclassDTO[BulkUpdate]
+
+
+class BoardItem(msgspec.Struct):
+    """Backlog as shown on the board, with only the columns and related names the board needs."""
+
+    id: UUID
+    slug: str
+    title: str
+    status: str
+    priority: str
+    progress: str
+    type: str
+    category: str
+    order: int
+    sprint_number: int
+    points: int
+    est_days: float
+    due_date: date
+    labels: list[str] | None
+    project_slug: str | None
+    project_name: str | None
+    assignee_id: UUID | None
+    assignee_name: str | None
+    owner_name: str | None
+
+
+class SearchHit(msgspec.Struct):
+    """Backlog matching a search, with the matched terms of its title and description highlighted."""
+
+    id: UUID
+    slug: str
+    title: str
+    status: str
+    project_slug: str | None
+    rank: float
+    headline: str
+
+
+def _board_statement() -> Select[Any]:
+    assignee, owner = aliased(User), aliased(User)
+    columns: dict[str, Any] = {
+        **{key: Backlog.__table__.c[key] for key in BoardItem.__struct_fields__ if key in Backlog.__table__.c},
+        "project_name": Project.name,
+        "assignee_name": assignee.name,
+        "owner_name": owner.name,
+    }
+    return (
+        select(*(columns[key].label(key) for key in BoardItem.__struct_fields__))
+        .outerjoin(Project, Project.slug == Backlog.project_slug)
+        .outerjoin(assignee, assignee.id == Backlog.assignee_id)
+        .outerjoin(owner, owner.id == Backlog.owner_id)
+    )
+
+
+def _html_escape(text: SQLColumnExpression[str]) -> SQLColumnExpression[str]:
+    """SQL expression escaping `text` for HTML, as `html.escape` does."""
+    for char, entity in (("&", "&amp;"), ("<", "&lt;"), (">", "&gt;"), ('"', "&quot;"), ("'", "&#x27;")):
+        text = func.replace(text, char, entity)
+    return text
+
+
+def _trigram_search_statement(query: str, limit_offset: LimitOffset) -> Select[Any]:
+    rank = func.word_similarity(query, Backlog.title)
+    return (
+        select(
+            Backlog.id,
+            Backlog.slug,
+            Backlog.title,
+            Backlog.status,
+            Backlog.project_slug,
+            rank,
+            _html_escape(Backlog.title),
+        )
+        .where(Backlog.title.bool_op("%>")(query))
+        .order_by(rank.desc(), Backlog.id)
+        .limit(limit_offset.limit)
+        .offset(limit_offset.offset)
+    )
+
+
+def _text_search_statement(query: str, limit_offset: LimitOffset) -> Select[Any]:
+    config = literal_column(f"'{SEARCH_CONFIG}'", String)
+    tsquery = func.websearch_to_tsquery(config, query)
+    search_vector = Backlog.__table__.c.search_vector
+    rank = func.ts_rank_cd(search_vector, tsquery)
+    # the page is selected first, so that the headlines are only computed for it
+    matches = (
+        select(
+            Backlog.id,
+            Backlog.slug,
+            Backlog.title,
+            Backlog.status,
+            Backlog.project_slug,
+            Backlog.description,
+            rank.label("rank"),
+        )
+        .where(search_vector.bool_op("@@")(tsquery))
+        .order_by(rank.desc(), Backlog.id)
+        .limit(limit_offset.limit)
+        .offset(limit_offset.offset)
+        .subquery()
+    )
+    # the text is escaped first, so that the only markup of the headline is the highlighting
+    headline = func.ts_headline(
+        config,
+        _html_escape(func.concat_ws(" ", matches.c.title, matches.c.description)),
+        tsquery,
+        "StartSel=<mark>, StopSel=</mark>, MaxFragments=2",
+    )
+    return select(
+        matches.c.id,
+        matches.c.slug,
+        matches.c.title,
+        matches.c.status,
+        matches.c.project_slug,
+        matches.c.rank,
+        headline,
+    ).order_by(matches.c.rank.desc(), matches.c.id)
+
+
 class Repository(SQLAlchemyAsyncSlugRepository[Backlog]):
     model_type = Backlog
 
-    async def get_available_backlog_slug(self, backlog: Backlog) -> str | None:
-        project_slug: str | None = backlog.project_slug
-        if not backlog.slug:
-            token = secrets.token_hex(2)
-            slug = f"{project_slug}-S{backlog.sprint_number}-{token}"
-            if await self._is_slug_unique(slug):
-                return slug
-        return backlog.slug
+    def get_available_backlog_slug(self, backlog: Backlog) -> ColumnElement[str]:
+        """Unique slug of a new backlog, e.g. `"proj-S1-1000a"`, evaluated by its `INSERT`."""
+        return orm.unique_slug(f"{backlog.project_slug}-S{backlog.sprint_number}-")
+
+    async def list_board(self, *filters: FilterTypes, **kwargs: Any) -> list[BoardItem]:
+        """List the backlogs as board items.
+
+        Only the board columns are selected, with the project and user names joined in, and the rows are not
+        loaded as ORM instances, so there are no relationships to load and nothing is added to the identity map.
+
+        Args:
+            *filters: Types for specific filtering operations.
+            **kwargs: Instance attribute value filters.
+
+        Returns:
+            The board items, after filtering applied.
+        """
+        statement = statement_cache.get((type(self), "board"), _board_statement)
+        statement = self._apply_filters(*filters, statement=statement)
+        statement = self._filter_select_by_kwargs(statement, **kwargs)
+        with wrap_sqlalchemy_exception():
+            result = await self._execute(statement)
+            return [BoardItem(*row) for row in result]
+
+    async def search(self, query: str, limit_offset: LimitOffset) -> list[SearchHit]:
+        """Search the backlogs, best match first.
+
+        The query is parsed by `websearch_to_tsquery`, so quoted phrases, `or` and `-` exclusions work, and matched
+        against the GIN indexed `search_vector`.  The headlines are only computed for the returned page.  Queries of
+        up to `TRIGRAM_QUERY_MAX_LENGTH` characters are matched by trigram word similarity against the title
+        instead, as they are often partial words, and their headline is the title.
+
+        Args:
+            query: Search query.
+            limit_offset: Page of results.
+
+        Returns:
+            The matching backlogs.
+        """
+        query = query.strip()
+        if not query:
+            return []
+        if len(query) <= TRIGRAM_QUERY_MAX_LENGTH:
+            statement = _trigram_search_statement(query, limit_offset)
+        else:
+            statement = _text_search_statement(query, limit_offset)
+        with wrap_sqlalchemy_exception():
+            result = await self._execute(statement)
+            return [SearchHit(*row) for row in result]
+
+    async def update_with_previous_sprint(self, data: Backlog) -> tuple[Backlog, tuple[str | None, int]]:
+        """Update a backlog, as `update`, and also return the project slug and sprint number it had before.
+
+        `update` already loads the stored backlog to check that it exists, so the previous sprint is read from it
+        instead of by another query.
+
+        Args:
+            data: Backlog with the identifier of the stored one and the values to update.
+
+        Returns:
+            The updated backlog, and the project slug and sprint number it had before.
+        """
+        with wrap_sqlalchemy_exception():
+            previous = await self.get(self.get_id_attribute_value(data))
+            instance = await self._attach_to_session(data, strategy="merge")
+            await self.session.flush()
+            self.session.expunge(instance)
+            return instance, (previous.project_slug, previous.sprint_number)
 
     async def _get_due_date(self, beg_date: date, est_days: float = 3.0) -> date:
         return beg_date + timedelta(days=est_days)
@@ -163,7 +536,7 @@ class Repository(SQLAlchemyAsyncSlugRepository[Backlog]):
 
 class Service(SQLAlchemyAsyncRepositoryService[Backlog]):
     repository_type = Repository
-    plugins: set[BacklogPlugin] = set()
+    plugins: PluginDispatcher[BacklogPlugin] = PluginDispatcher()
 
     def __init__(self, **repo_kwargs: Any) -> None:
         self.repository: Repository = self.repository_type(**repo_kwargs)
@@ -172,49 +545,234 @@ class Service(SQLAlchemyAsyncRepositoryService[Backlog]):
         super().__init__(**repo_kwargs)
 
     async def to_model(self, data: Backlog | dict[str, Any], operation: str | None = None) -> Backlog:
+        obj = await super().to_model(data, operation)
+        if operation == "create" and not obj.slug:
+            obj.slug = self.repository.get_available_backlog_slug(backlog=obj)
         if isinstance(data, Backlog):
-            slug = await self.repository.get_available_backlog_slug(backlog=data)
-            if isinstance(slug, str):
-                data.slug = slug
-            data.due_date = await self.repository._get_due_date(data.beg_date, data.est_days)
+            obj.due_date = await self.repository._get_due_date(obj.beg_date, obj.est_days)
+        return obj
 
-        return await super().to_model(data, operation)
+    async def to_insert_values(
+        self, data: list[Backlog | dict[str, Any]] | list[dict[str, Any]] | list[Backlog]
+    ) -> list[dict[str, Any]]:
+        values = self.to_values(data, validate=True)
+        if not values:
+            return values
+        suffixes = await self.repository.get_slug_suffixes(len(values))
+        for row, suffix in zip(values, suffixes, strict=True):
+            row.setdefault("slug", f"{row.get('project_slug')}-S{row.get('sprint_number')}-{suffix}")
+            if "due_date" not in row and "beg_date" in row:
+                row["due_date"] = await self.repository._get_due_date(row["beg_date"], row.get("est_days", 3.0))
+        return values
+
+    async def list_board(self, *filters: FilterTypes, **kwargs: Any) -> list[BoardItem]:
+        """Wrap repository board listing, see `Repository.list_board`."""
+        return await self.repository.list_board(*filters, **kwargs)
+
+    async def search(self, query: str, limit_offset: LimitOffset) -> list[SearchHit]:
+        """Wrap repository search, see `Repository.search`."""
+        return await self.repository.search(query, limit_offset)
 
     async def create(self, data: Backlog | dict[str, Any]) -> Backlog:
-        # Call the before_create hook for each registered plugin
-        for plugin in self.plugins:
-            data = await plugin.before_create(data=data)
+        data = await self.plugins.before_create(data)
 
         obj = await super().create(data)
-        # Call the after_create hook for each
-        for plugin in self.plugins:
-            after = await plugin.after_create(data=obj)
-            obj = await super().update(obj.id, after)
+        if await self.plugins.after_create(obj):
+            obj = await self.repository.update(obj)
+
+        await cache.invalidate_response_cache(
+            self.repository.session,
+            "backlogs",
+            cache.entity_tag("sprint", obj.project_slug, obj.sprint_number),
+            cache.entity_tag("sprints", obj.project_slug),
+        )
+        return obj
 
+    async def transition(self, slug: str, field: TransitionField, delta: int) -> Backlog | None:
+        """Move the `field` of a backlog `delta` members along its enum, clamped to the first and last one.
+
+        Stepping the progress also sets the status, to checked in once the progress is full and to started before.
+        The row is locked, updated and audited by a single statement, so concurrent transitions can't overwrite each
+        other.  Unlike `update`, the `before_update` plugin hooks aren't called, as there is no data to pass them.
+
+        Args:
+            slug: Slug of the backlog.
+            field: Enum field to step.
+            delta: Number of members to step by, negative to step back.
+
+        Returns:
+            The updated backlog, or `None` if there is no backlog with `slug`.
+        """
+        step = _step(getattr(Backlog, field), list(_TRANSITION_ENUMS[field]), delta)
+        values: dict[str, Any] = {field: step}
+        if field == "progress":
+            values["status"] = case(
+                (step == ProgressEnum.full.value, StatusEnum.checked_in.value), else_=StatusEnum.started.value
+            )
+        updated = await self._update_returning(Backlog.slug == slug, values)
+        if not updated:
+            return None
+        obj, _ = updated[0]
+
+        if await self.plugins.after_update(obj):
+            obj = await self.repository.update(obj)
+
+        await self._invalidate_cache(obj)
         return obj
 
+    async def bulk_update(
+        self, values: dict[str, Any], ids: Sequence[UUID] = (), slugs: Sequence[str] = ()
+    ) -> list[Backlog]:
+        """Apply the same change to many backlogs, e.g. to move them to another sprint or reassign them.
+
+        The rows are locked, updated and audited by a single statement.  As for `transition`, the `before_update`
+        plugin hooks aren't called.
+
+        Args:
+            values: Column values to set.
+            ids: Identifiers of the backlogs.
+            slugs: Slugs of the backlogs.
+
+        Returns:
+            The updated backlogs, ids or slugs matching no backlog are ignored.
+        """
+        if not values or not (ids or slugs):
+            return []
+        updated = await self._update_returning(
+            or_(
+                Backlog.id == any_(literal(list(ids), ARRAY(Backlog.id.type))),
+                Backlog.slug == any_(literal(list(slugs), ARRAY(String))),
+            ),
+            values,
+        )
+        objs = [obj for obj, _ in updated]
+        changed = await asyncio.gather(*(self.plugins.after_update(obj) for obj in objs))
+        for obj in compress(objs, changed):
+            await self.repository.update(obj)
+        if objs:
+            await self._invalidate_cache(*objs, sprints=[previous_sprint for _, previous_sprint in updated])
+        return objs
+
+    async def _update_returning(
+        self, where: ColumnElement[bool], values: dict[str, Any]
+    ) -> list[tuple[Backlog, tuple[str | None, int]]]:
+        """Update the backlogs matching `where` with `values` and audit the changed columns, in one statement.
+
+        The rows are locked by the CTE reading their old values, so that the audit is consistent with concurrent
+        updates, and the loaded instances are refreshed.
+
+        Returns:
+            The updated backlogs, each with the project slug and sprint number it had before.
+        """
+        now = datetime.now(UTC)
+        columns = Backlog.__table__.c
+        old = (
+            select(*(columns[key] for key in dict.fromkeys(["id", "project_slug", "sprint_number", *values])))
+            .where(where)
+            .with_for_update()
+            .cte("old")
+        )
+        updated = (
+            update(Backlog)
+            .where(Backlog.id == old.c.id)
+            .values(**values, updated_at=now)
+            .returning(*columns)
+            .cte("updated")
+        )
+        changes = union_all(
+            *(
+                select(
+                    func.gen_random_uuid(),
+                    updated.c.id,
+                    literal(key),
+                    func.coalesce(old.c[key].cast(String), ""),
+                    func.coalesce(updated.c[key].cast(String), ""),
+                    updated.c.project_slug,
+                    updated.c.sprint_number,
+                    updated.c.points,
+                    literal(now),
+                    literal(now),
+                )
+                .join_from(updated, old, old.c.id == updated.c.id)
+                .where(old.c[key].is_distinct_from(updated.c[key]))
+                for key in values
+            )
+        )
+        audited = (
+            insert(BacklogAudit)
+            .from_select(
+                [
+                    "id",
+                    "backlog_id",
+                    "field_name",
+                    "old_value",
+                    "new_value",
+                    "project_slug",
+                    "sprint_number",
+                    "points",
+                    "created_at",
+                    "updated_at",
+                ],
+                changes,
+            )
+            .returning(BacklogAudit.id)
+            .cte("audited")
+        )
+        # a CTE is aliased as a subquery is, which the stubs don't cover
+        backlog = aliased(Backlog, cast("Subquery", updated))
+        # selected for the audit CTE to be rendered, as ORM selects ignore `add_cte`
+        audit_count = select(func.count()).select_from(audited).scalar_subquery()
+        statement = (
+            select(backlog, old.c.project_slug, old.c.sprint_number, audit_count)
+            .join(old, old.c.id == backlog.id)
+            .order_by(backlog.slug)
+            .execution_options(populate_existing=True)
+        )
+        rows = (await self.repository.session.execute(statement)).all()
+        return [(obj, (project_slug, sprint_number)) for obj, project_slug, sprint_number, _ in rows]
+
     async def update(self, item_id: Any, data: Backlog | dict[str, Any]) -> Backlog:
-        # Call the before_update hook for each registered plugin
-        for plugin in self.plugins:
-            data = await plugin.before_update(item_id=item_id, data=data)
+        data = await self.plugins.before_update(item_id, data)
 
-        obj: Backlog = await super().update(item_id, data)
+        data = self.repository.set_id_attribute_value(item_id, await self.to_model(data, "update"))
+        # the sprint the backlog is moved out of, if any, has to be invalidated too
+        obj, previous_sprint = await self.repository.update_with_previous_sprint(data)
 
-        # Call the after_update hook for each registered plugin
-        for plugin in self.plugins:
-            await plugin.after_update(data=obj)
+        if await self.plugins.after_update(obj):
+            obj = await self.repository.update(obj)
 
+        await self._invalidate_cache(obj, sprints=[previous_sprint])
         return obj
 
     async def delete(self, item_id: Any) -> Backlog:
-        # Call the before_delete hook for each registered plugin
-        for plugin in self.plugins:
-            await plugin.before_delete(item_id=item_id)
+        await self.plugins.before_delete(item_id)
 
         obj: Backlog = await self.repository.delete(item_id)
 
-        # Call the after_delete hook for each registered plugin
-        for plugin in self.plugins:
-            await plugin.after_delete(data=obj)
+        await self.plugins.after_delete(obj)
 
+        await self._invalidate_cache(obj)
         return obj
+
+    async def _invalidate_cache(self, *objs: Backlog, sprints: Iterable[tuple[str | None, int]] = ()) -> None:
+        """Invalidate the cached responses that include `objs`, and the analytics of their sprints and of `sprints`."""
+        sprint_tags = [
+            tag
+            for project_slug, sprint_number in dict.fromkeys(
+                [*((obj.project_slug, obj.sprint_number) for obj in objs), *sprints]
+            )
+            for tag in (
+                cache.entity_tag("sprint", project_slug, sprint_number),
+                cache.entity_tag("sprints", project_slug),
+            )
+        ]
+        await cache.invalidate_response_cache(
+            self.repository.session,
+            "backlogs",
+            *(
+                tag
+                for obj in objs
+                for tag in (cache.entity_tag("backlog", obj.id), cache.entity_tag("backlog", obj.slug))
+            ),
+            *sprint_tags,
+        )
@@ -0,0 +1,3 @@
+from . import models, services, tasks
+
+__all__ = ["models", "services", "tasks"]
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from datetime import datetime  # noqa: TCH003
+
+import sqlalchemy as sa
+from litestar.contrib.sqlalchemy.types import DateTimeUTC
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.lib.db.orm import TimestampedDatabaseModel
+
+__all__ = ["OutboxMessage"]
+
+
+class OutboxMessage(TimestampedDatabaseModel):
+    """Side effect of a change, e.g. a Zulip message, delivered by `deliver_outbox` once the change commits."""
+
+    __tablename__ = "outbox_message"  # type: ignore[assignment]
+    __table_args__ = (
+        # the pending messages the delivery task claims, the delivered ones are only kept to be pruned
+        sa.Index("ix_outbox_message_pending", "available_at", postgresql_where=sa.text("delivered_at IS NULL")),
+    )
+    topic: Mapped[str] = mapped_column(sa.String(length=100))
+    key: Mapped[str] = mapped_column(sa.String(length=255), unique=True)
+    """Idempotency key, a message with the key of one already in the outbox is never added again."""
+    payload: Mapped[dict]
+    attempts: Mapped[int] = mapped_column(default=0)
+    available_at: Mapped[datetime] = mapped_column(DateTimeUTC(timezone=True))
+    delivered_at: Mapped[datetime | None] = mapped_column(DateTimeUTC(timezone=True))
+    last_error: Mapped[str | None] = mapped_column(sa.Text)
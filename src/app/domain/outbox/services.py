@@ -0,0 +1,115 @@
+"""Transactional outbox.
+
+Side effects of a change that call out to other services, e.g. the Zulip messages of the backlogs, are added to the
+outbox in the transaction of the change, and delivered by the `deliver_outbox` task once it commits.  So they don't
+hold the request, are retried when the service is unavailable, and are never delivered for changes that roll back.
+"""
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.event import listens_for
+from sqlalchemy.orm import Session
+
+from app.domain.outbox.models import OutboxMessage
+from app.lib import db, settings, worker
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+__all__ = [
+    "OutboxHandler",
+    "add_message",
+    "drop_messages",
+    "enqueue_delivery",
+    "handler",
+    "handlers",
+    "insert_messages",
+]
+
+OutboxHandler = Callable[[OutboxMessage], Awaitable[None]]
+
+handlers: dict[str, OutboxHandler] = {}
+"""Delivery function of each message topic."""
+
+DELIVERY_JOB_KEY = "deliver_outbox"
+OUTBOX_SESSION_KEY = "outbox"
+
+
+def handler(topic: str) -> Callable[[OutboxHandler], OutboxHandler]:
+    """Register the decorated function to deliver the messages of `topic`.
+
+    The function is called outside of any transaction, so that the calls to the service don't hold database
+    connections nor locks, and opens its own sessions to read and write, e.g. to store the id the message got in the
+    service.  It must raise to have the message retried.  Messages can be delivered more than once, if the task dies
+    before marking them delivered, so it should skip the ones it already delivered.
+    """
+
+    def decorator(fn: OutboxHandler) -> OutboxHandler:
+        handlers[topic] = fn
+        return fn
+
+    return decorator
+
+
+def add_message(session: AsyncSession, topic: str, payload: dict[str, Any], key: str | None = None) -> None:
+    """Add a message to the outbox, in the transaction of `session`.
+
+    The messages are inserted together when the session commits, so that e.g. the plugin hooks running concurrently
+    don't have to share the session connection to add them.
+
+    Args:
+        session: Session the change is made in.
+        topic: Topic of the message, see [`handler`][app.domain.outbox.services.handler].
+        payload: JSON serializable arguments of the delivery.
+        key: Idempotency key, the message is dropped if one with the same key is already in the outbox.  Defaults to
+            a random key.
+    """
+    if not session.in_transaction():
+        # a rollback before the session runs a statement is a no-op, so it would keep the message
+        session.sync_session.begin()
+    now = datetime.now(UTC)
+    session.info.setdefault(OUTBOX_SESSION_KEY, []).append(
+        {
+            "id": uuid4(),
+            "topic": topic,
+            "key": key or f"{topic}:{uuid4()}",
+            "payload": payload,
+            "attempts": 0,
+            "available_at": now,
+            "created_at": now,
+            "updated_at": now,
+        }
+    )
+    db.after_commit(session, enqueue_delivery)
+
+
+@listens_for(Session, "before_commit")
+def insert_messages(session: Session) -> None:
+    """Insert the messages added to the outbox of `session` as one multi-row `INSERT`."""
+    rows = session.info.pop(OUTBOX_SESSION_KEY, None)
+    if rows:
+        session.execute(
+            postgresql.Insert(OutboxMessage).values(rows).on_conflict_do_nothing(index_elements=[OutboxMessage.key])
+        )
+
+
+@listens_for(Session, "after_soft_rollback")
+def drop_messages(session: Session, _: Any) -> None:
+    """Drop the messages added to the outbox of `session` once its transaction rolls back."""
+    if not session.in_transaction():
+        session.info.pop(OUTBOX_SESSION_KEY, None)
+
+
+async def enqueue_delivery() -> None:
+    """Enqueue the delivery task, unless it is already queued.
+
+    The task also runs every minute, so that messages are still delivered if this fails.
+    """
+    await worker.queues["background-tasks"].enqueue(
+        "deliver_outbox", key=DELIVERY_JOB_KEY, timeout=settings.worker.OUTBOX_TIMEOUT
+    )
@@ -0,0 +1,130 @@
+"""Outbox background tasks."""
+from __future__ import annotations
+
+import importlib
+import pkgutil
+from datetime import UTC, datetime, timedelta
+from functools import cache
+from typing import Any
+
+from sqlalchemy import and_, delete, func, or_, select, update
+
+import app.plugins
+from app.domain.outbox.models import OutboxMessage
+from app.domain.outbox.services import handlers
+from app.lib import db, log, settings
+
+__all__ = ["deliver_outbox"]
+
+
+logger = log.get_logger()
+
+
+@cache
+def _import_plugins() -> None:
+    """Import the plugins, so that the outbox handlers they define are registered."""
+    for _, name, _ in pkgutil.iter_modules(app.plugins.__path__):
+        importlib.import_module(f"{app.plugins.__name__}.{name}")
+
+
+def _retry_delay(attempts: int) -> timedelta:
+    return timedelta(
+        seconds=min(settings.worker.OUTBOX_RETRY_DELAY * 2 ** (attempts - 1), settings.worker.OUTBOX_RETRY_BACKOFF)
+    )
+
+
+async def _claim_batch(now: datetime) -> list[OutboxMessage]:
+    """Claim a batch of pending messages, in a transaction of its own.
+
+    The messages are locked with `FOR UPDATE SKIP LOCKED` only until they are leased for `WORKER_OUTBOX_TIMEOUT`
+    seconds, so that concurrent runs claim different messages, and the messages of a run that dies are delivered
+    again once the task would have timed out.
+    """
+    async with db.session() as session:
+        messages = (
+            await session.scalars(
+                select(OutboxMessage)
+                .where(
+                    OutboxMessage.delivered_at.is_(None),
+                    OutboxMessage.available_at <= now,
+                    OutboxMessage.attempts < settings.worker.OUTBOX_MAX_ATTEMPTS,
+                )
+                .order_by(OutboxMessage.available_at, OutboxMessage.created_at)
+                .limit(settings.worker.OUTBOX_BATCH_SIZE)
+                .with_for_update(skip_locked=True)
+            )
+        ).all()
+        for message in messages:
+            message.attempts += 1
+            message.available_at = now + timedelta(seconds=settings.worker.OUTBOX_TIMEOUT)
+        await session.commit()
+    return list(messages)
+
+
+async def _deliver(message: OutboxMessage) -> dict[str, Any]:
+    """Deliver a claimed message, and return the values to update it with."""
+    try:
+        await handlers[message.topic](message)
+    except Exception as e:  # noqa: BLE001
+        log_method = logger.error if message.attempts >= settings.worker.OUTBOX_MAX_ATTEMPTS else logger.warning
+        log_method(
+            "outbox message delivery failed",
+            topic=message.topic,
+            key=message.key,
+            attempts=message.attempts,
+            error=repr(e),
+        )
+        return {
+            "id": message.id,
+            "available_at": datetime.now(UTC) + _retry_delay(message.attempts),
+            "last_error": repr(e),
+        }
+    return {"id": message.id, "delivered_at": datetime.now(UTC), "last_error": None}
+
+
+async def deliver_outbox(_: dict) -> None:
+    """Deliver the pending outbox messages, in batches of `WORKER_OUTBOX_BATCH_SIZE`.
+
+    The messages are delivered outside of the transaction that claims them, and the outcomes of a batch written
+    together.  Failed messages are retried with an exponential backoff, up to `WORKER_OUTBOX_MAX_ATTEMPTS` times, and
+    both the delivered and the failed ones are pruned after `WORKER_OUTBOX_RETENTION` seconds.
+    """
+    _import_plugins()
+    delivered = failed = 0
+    while messages := await _claim_batch(datetime.now(UTC)):
+        outcomes = [await _deliver(message) for message in messages]
+        succeeded = [outcome for outcome in outcomes if "delivered_at" in outcome]
+        retried = [outcome for outcome in outcomes if "delivered_at" not in outcome]
+        delivered, failed = delivered + len(succeeded), failed + len(retried)
+        async with db.session() as session:
+            # by separate statements, as the delivered and the failed messages are updated with other columns
+            for rows in (succeeded, retried):
+                if rows:
+                    await session.execute(update(OutboxMessage), rows)
+            await session.commit()
+    async with db.session() as session:
+        retained_since = datetime.now(UTC) - timedelta(seconds=settings.worker.OUTBOX_RETENTION)
+        await session.execute(
+            delete(OutboxMessage).where(
+                or_(
+                    OutboxMessage.delivered_at < retained_since,
+                    and_(
+                        OutboxMessage.attempts >= settings.worker.OUTBOX_MAX_ATTEMPTS,
+                        OutboxMessage.updated_at < retained_since,
+                    ),
+                )
+            )
+        )
+        undeliverable = await session.scalar(
+            select(func.count())
+            .select_from(OutboxMessage)
+            .where(
+                OutboxMessage.delivered_at.is_(None),
+                OutboxMessage.attempts >= settings.worker.OUTBOX_MAX_ATTEMPTS,
+            )
+        )
+        await session.commit()
+    if undeliverable:
+        await logger.aerror("Outbox messages given up on after the max attempts.", undeliverable=undeliverable)
+    if delivered or failed:
+        await logger.ainfo("Outbox messages delivered.", delivered=delivered, failed=failed)
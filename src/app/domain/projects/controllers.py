@@ -20,12 +20,14 @@ from app.domain.accounts.models import User
 if TYPE_CHECKING:
     from uuid import UUID
 
-    from litestar.contrib.repository import FilterTypes
+    from litestar.pagination import CursorPagination
 
     from app.domain.projects.models import Service
+    from app.lib.dependencies import ArrayFilter, FilterTypes
 from app.domain.projects.dependencies import provides_service
 from app.domain.projects.models import Project as Model
 from app.domain.projects.models import ReadDTO, WriteDTO
+from app.lib import cache, settings
 
 __all__ = ["ApiController"]
 
@@ -42,10 +44,33 @@ class ApiController(Controller):
     DETAIL_ROUTE = "/{row_id:uuid}"
     guards = [requires_active_user]
 
-    @get()
-    async def filter(self, service: "Service", filters: list["FilterTypes"] = validation_skip) -> Sequence[Model]:
+    @get(
+        cache=settings.api.TAGGED_CACHE_EXPIRATION,
+        cache_key_builder=cache.tagged_cache_key_builder("projects"),
+    )
+    async def filter(
+        self,
+        service: "Service",
+        filters: list["FilterTypes"] = validation_skip,
+        label_filter: "ArrayFilter" = validation_skip,
+    ) -> Sequence[Model]:
         """Get a list of Models."""
-        return await service.list(*filters)
+        return await service.list(*filters, label_filter)
+
+    @get(
+        "/cursor",
+        cache=settings.api.TAGGED_CACHE_EXPIRATION,
+        cache_key_builder=cache.tagged_cache_key_builder("projects"),
+    )
+    async def filter_by_cursor(
+        self,
+        service: "Service",
+        cursor_filters: list["FilterTypes"] = validation_skip,
+        label_filter: "ArrayFilter" = validation_skip,
+    ) -> "CursorPagination[str, Model]":
+        """Get a keyset page of Models."""
+        results = await service.list(*cursor_filters, label_filter)
+        return service.to_cursor_dto(results, *cursor_filters)
 
     @post()
     async def create(self, data: Model, current_user: User, service: "Service") -> Model:
@@ -54,7 +79,11 @@ class ApiController(Controller):
         data.owner_id = current_user.id
         return await service.create(data)
 
-    @get(DETAIL_ROUTE)
+    @get(
+        DETAIL_ROUTE,
+        cache=settings.api.TAGGED_CACHE_EXPIRATION,
+        cache_key_builder=cache.tagged_cache_key_builder("projects:details", "project:{row_id}"),
+    )
     async def retrieve(self, service: "Service", row_id: "UUID") -> Model:
         """Get Model by ID."""
         return await service.get(row_id)
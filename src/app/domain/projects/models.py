@@ -3,15 +3,16 @@ from typing import TYPE_CHECKING, Annotated, Any
 from uuid import UUID
 
 from litestar.contrib.sqlalchemy.dto import SQLAlchemyDTO
-from litestar.contrib.sqlalchemy.repository import SQLAlchemyAsyncRepository
 from litestar.dto.factory import DTOConfig, Mark, dto_field
-from sqlalchemy import ARRAY, ForeignKey, String
+from sqlalchemy import ARRAY, ForeignKey, Index, String
 from sqlalchemy.orm import Mapped, relationship
 from sqlalchemy.orm import mapped_column as m_col
 
 from app.domain.accounts.models import User
+from app.lib import cache
 from app.lib.db import orm
-from app.lib.plugin import ProjectPlugin
+from app.lib.plugin import PluginDispatcher, ProjectPlugin
+from app.lib.repository import SQLAlchemyAsyncRepository
 from app.lib.service.sqlalchemy import SQLAlchemyAsyncRepositoryService
 
 if TYPE_CHECKING:
@@ -27,6 +28,7 @@ __all__ = [
 
 
 class Project(orm.TimestampedDatabaseModel):
+    __table_args__ = (Index("ix_project_labels", "labels", postgresql_using="gin"),)
     slug: Mapped[str] = m_col(unique=True)
     name: Mapped[str]
     description: Mapped[str]
@@ -40,7 +42,7 @@ class Project(orm.TimestampedDatabaseModel):
     sprint_checkup_day: Mapped[int | None] = m_col(default=1)
     repo_urls: Mapped[list[str]] = m_col(ARRAY(String))
     backlogs: Mapped[list["Backlog"]] = relationship("Backlog", back_populates="project", lazy="noload")
-    plugin_meta: Mapped[dict] = m_col(default=lambda: dict, info=dto_field(Mark.READ_ONLY))  # Relationships
+    plugin_meta: Mapped[dict] = m_col(default=dict, info=dto_field(Mark.READ_ONLY))  # Relationships
     owner_id: Mapped[UUID | None] = m_col(ForeignKey(User.id), nullable=True)
     owner: Mapped["User"] = relationship(
         "User",
@@ -59,7 +61,7 @@ class Repository(SQLAlchemyAsyncRepository[Project]):
 
 class Service(SQLAlchemyAsyncRepositoryService[Project]):
     repository_type = Repository
-    plugins: set[ProjectPlugin] = set()
+    plugins: PluginDispatcher[ProjectPlugin] = PluginDispatcher()
 
     def __init__(self, **repo_kwargs: Any) -> None:
         self.repository: Repository = self.repository_type(**repo_kwargs)
@@ -68,43 +70,42 @@ class Service(SQLAlchemyAsyncRepositoryService[Project]):
         super().__init__(**repo_kwargs)
 
     async def create(self, data: Project | dict[str, Any]) -> Project:
-        # Call the before_create hook for each registered plugin
-        for plugin in self.plugins:
-            data = await plugin.before_create(data=data)
+        data = await self.plugins.before_create(data)
         obj: Project = await super().create(data)
 
-        # Call the after_create hook for each registered plugin
-        for plugin in self.plugins:
-            await plugin.after_create(data=obj)
+        if await self.plugins.after_create(obj):
+            obj = await self.repository.update(obj)
 
+        await cache.invalidate_response_cache(self.repository.session, "projects")
         return obj
 
     async def update(self, item_id: Any, data: Project | dict[str, Any]) -> Project:
-        # Call the before_update hook for each registered plugin
-        for plugin in self.plugins:
-            data = await plugin.before_update(item_id=item_id, data=data)
+        data = await self.plugins.before_update(item_id, data)
 
         obj: Project = await super().update(item_id, data)
 
-        # Call the after_update hook for each registered plugin
-        for plugin in self.plugins:
-            await plugin.after_update(data=obj)
+        if await self.plugins.after_update(obj):
+            obj = await self.repository.update(obj)
 
+        await self._invalidate_cache(obj)
         return obj
 
     async def delete(self, item_id: Any) -> Project:
-        # Call the before_delete hook for each registered plugin
-        for plugin in self.plugins:
-            await plugin.before_delete(item_id=item_id)
+        await self.plugins.before_delete(item_id)
 
         obj: Project = await super().delete(item_id)
 
-        # Call the after_delete hook for each registered plugin
-        for plugin in self.plugins:
-            await plugin.after_delete(data=obj)
+        await self.plugins.after_delete(obj)
 
+        await self._invalidate_cache(obj)
         return obj
 
+    async def _invalidate_cache(self, obj: Project) -> None:
+        """Invalidate the cached responses that include `obj`, backlogs included as they show the project name."""
+        await cache.invalidate_response_cache(
+            self.repository.session, "projects", cache.entity_tag("project", obj.id), "backlogs", "backlogs:details"
+        )
+
 
 WriteDTO = SQLAlchemyDTO[
     Annotated[Project, DTOConfig(exclude={"id", "created_at", "updated_at", "backlogs", "plugin_meta", "owner"})]
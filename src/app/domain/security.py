@@ -7,10 +7,11 @@ from sqlalchemy import select
 from sqlalchemy.orm import joinedload, noload, selectinload
 
 from app.domain import urls
+from app.domain.accounts.cache import user_cache
 from app.domain.accounts.models import User
 from app.domain.accounts.services import UserService
 from app.domain.teams.models import TeamMember
-from app.lib import settings
+from app.lib import db, settings
 
 if TYPE_CHECKING:
     from litestar.connection import ASGIConnection, Request
@@ -33,7 +34,9 @@ async def provide_user(request: Request[User, Token, Any]) -> User:
 async def current_user_from_token(token: Token, connection: ASGIConnection[Any, Any, Any, Any]) -> User | None:
     """Lookup current user from local JWT token.
 
-    Fetches the user information from the database
+    Fetches the user information from the cache, or from the database on a miss.  The database lookup uses the
+    session of the connection, which the route handlers then reuse, so that a request holds a single pooled
+    connection.
 
 
     Args:
@@ -44,19 +47,27 @@ async def current_user_from_token(token: Token, connection: ASGIConnection[Any,
     Returns:
         User: User record mapped to the JWT identifier
     """
-    async with UserService.new(
-        statement=select(User).options(
-            noload("*"),
-            selectinload(User.teams).options(
-                joinedload(TeamMember.team, innerjoin=True).options(
+    user = await user_cache.get(token.sub)
+    if user is None:
+        async with UserService.new(
+            session=db.config.provide_session(connection.app.state, connection.scope),
+            statement=UserService.cached_statement(
+                "auth",
+                lambda: select(User).options(
                     noload("*"),
+                    selectinload(User.teams).options(
+                        joinedload(TeamMember.team, innerjoin=True).options(
+                            noload("*"),
+                        ),
+                    ),
                 ),
             ),
-        ),
-    ) as service:
-        user = await service.get_one_or_none(email=token.sub)
-        if user and user.is_active:
-            return user
+        ) as service:
+            user = await service.get_one_or_none(email=token.sub)
+        if user is not None:
+            await user_cache.set(user)
+    if user and user.is_active:
+        return user
     return None
 
 
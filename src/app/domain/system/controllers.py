@@ -7,8 +7,9 @@ from litestar.response import Response
 from sqlalchemy import text
 
 from app.domain import urls
-from app.domain.system.dtos import SystemHealth
-from app.lib import log, worker
+from app.domain.accounts.guards import requires_superuser
+from app.domain.system.dtos import SystemCache, SystemHealth
+from app.lib import cache, log, worker
 from app.lib.cache import redis
 
 if TYPE_CHECKING:
@@ -71,3 +72,27 @@ class SystemController(Controller):
             status_code=200 if db_ping and cache_ping and worker_ping else 500,
             media_type=MediaType.JSON,
         )
+
+    @get(
+        operation_id="SystemCache",
+        name="system:cache",
+        path=urls.SYSTEM_CACHE,
+        media_type=MediaType.JSON,
+        cache=False,
+        guards=[requires_superuser],
+        tags=["System"],
+        summary="Cache Statistics",
+        description="Hit ratios of the in process and Redis tiers of the cache, for the process serving the request.",
+        signature_namespace={"SystemCache": SystemCache},
+    )
+    async def cache_stats(self) -> SystemCache:
+        """Get the lookups of the cache tiers."""
+        return SystemCache(
+            local_hit_ratio=cache.stats.local_hit_ratio,
+            redis_hit_ratio=cache.stats.redis_hit_ratio,
+            local_hits=cache.stats.local_hits,
+            redis_hits=cache.stats.redis_hits,
+            misses=cache.stats.misses,
+            local_entries=len(cache.local_store_cache),
+            local_bytes=cache.local_store_cache.size,
+        )
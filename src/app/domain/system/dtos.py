@@ -5,7 +5,7 @@ from litestar.dto.factory.stdlib.dataclass import DataclassDTO
 
 from app.lib import dto, settings
 
-__all__ = ["SystemHealth", "SystemHealthDTO"]
+__all__ = ["SystemCache", "SystemHealth", "SystemHealthDTO"]
 
 
 @dataclass
@@ -17,6 +17,17 @@ class SystemHealth:
     version: str = settings.app.BUILD_NUMBER
 
 
+@dataclass
+class SystemCache:
+    local_hit_ratio: float
+    redis_hit_ratio: float
+    local_hits: int
+    redis_hits: int
+    misses: int
+    local_entries: int
+    local_bytes: int
+
+
 class SystemHealthDTO(DataclassDTO[SystemHealth]):
     """Team Create."""
 
@@ -15,12 +15,12 @@ from app.lib import log
 if TYPE_CHECKING:
     from uuid import UUID
 
-    from litestar.contrib.repository.filters import FilterTypes
     from litestar.dto.factory import DTOData
-    from litestar.pagination import OffsetPagination
+    from litestar.pagination import CursorPagination, OffsetPagination
 
     from app.domain.tags.models import Tag
     from app.domain.tags.services import TagService
+    from app.lib.dependencies import FilterTypes
 
 
 __all__ = ["TagController"]
@@ -51,6 +51,20 @@ class TagController(Controller):
         results, total = await tags_service.list_and_count(*filters)
         return tags_service.to_dto(results, total, *filters)
 
+    @get(
+        operation_id="ListTagsByCursor",
+        name="tags:list-cursor",
+        summary="List Tags (cursor pagination)",
+        description="Retrieve the tags, one keyset page at a time.",
+        path=urls.TAG_LIST_CURSOR,
+    )
+    async def list_tags_by_cursor(
+        self, tags_service: TagService, cursor_filters: list[FilterTypes] = Dependency(skip_validation=True)
+    ) -> CursorPagination[str, Tag]:
+        """List tags by cursor."""
+        results = await tags_service.list(*cursor_filters)
+        return tags_service.to_cursor_dto(results, *cursor_filters)
+
     @get(
         operation_id="GetTag",
         name="tags:get",
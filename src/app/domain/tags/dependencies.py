@@ -2,9 +2,6 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from sqlalchemy import select
-
-from app.domain.tags.models import Tag
 from app.domain.tags.services import TagService
 
 if TYPE_CHECKING:
@@ -26,5 +23,5 @@ async def provide_tags_service(
     Returns:
         TagService: An Tags service object
     """
-    async with TagService.new(session=db_session, statement=select(Tag)) as service:
+    async with TagService.new(session=db_session) as service:
         yield service
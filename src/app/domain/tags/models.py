@@ -18,7 +18,7 @@ class Tag(TimestampedDatabaseModel):
 
     __tablename__ = "tag"  # type: ignore[assignment]
     __table_args__ = {"comment": "Tags that can be applied to various objects"}
-    name: Mapped[str] = mapped_column(index=False)
+    name: Mapped[str] = mapped_column(index=False, unique=True)
     description: Mapped[str | None] = mapped_column(sa.String(length=255), index=False, nullable=True)
 
     # -----------
@@ -1,9 +1,18 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
+from sqlalchemy import select
+from sqlalchemy.orm import noload
+
 from app.domain.tags.models import Tag
+from app.lib.filters import CollectionFilter
 from app.lib.repository import SQLAlchemyAsyncRepository
 from app.lib.service.sqlalchemy import SQLAlchemyAsyncRepositoryService
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
 __all__ = ["TagService", "TagRepository"]
 
 
@@ -18,3 +27,25 @@ class TagService(SQLAlchemyAsyncRepositoryService[Tag]):
 
     repository_type = TagRepository
     match_fields = ["name"]
+
+    async def get_or_create_many(self, names: Iterable[str]) -> list[Tag]:
+        """Resolve tag names to tags, creating the missing ones.
+
+        Existing tags are fetched with one `IN` query and the missing ones are created with one statement.
+
+        Args:
+            names: The tag names.
+
+        Returns:
+            The tags, one per distinct name.
+        """
+        names = list(dict.fromkeys(names))
+        if not names:
+            return []
+        statement = self.cached_statement("resolve", lambda: select(Tag).options(noload(Tag.teams)))
+        tags = list(await self.list(CollectionFilter("name", names), statement=statement))
+        existing = {tag.name for tag in tags}
+        missing = [name for name in names if name not in existing]
+        if missing:
+            tags.extend(await self.upsert_many([{"name": name} for name in missing]))
+        return tags
@@ -17,7 +17,7 @@ if TYPE_CHECKING:
     from uuid import UUID
 
     from litestar.dto.factory import DTOData
-    from litestar.pagination import OffsetPagination
+    from litestar.pagination import CursorPagination, OffsetPagination
 
     from app.domain.accounts.models import User
     from app.domain.teams.models import Team
@@ -55,6 +55,25 @@ class TeamController(Controller):
             results, total = await teams_service.get_user_teams(*filters, user_id=current_user.id)
         return teams_service.to_dto(results, total, *filters)
 
+    @get(
+        operation_id="ListTeamsByCursor",
+        name="teams:list-cursor",
+        summary="List Teams (cursor pagination)",
+        path=urls.TEAM_LIST_CURSOR,
+    )
+    async def list_teams_by_cursor(
+        self,
+        teams_service: TeamService,
+        current_user: User,
+        cursor_filters: list[FilterTypes] = Dependency(skip_validation=True),
+    ) -> CursorPagination[str, Team]:
+        """List teams that your account can access, one keyset page at a time."""
+        if current_user.is_superuser:
+            results = await teams_service.list(*cursor_filters)
+        else:
+            results = await teams_service.list_user_teams(*cursor_filters, user_id=current_user.id)
+        return teams_service.to_cursor_dto(results, *cursor_filters)
+
     @post(
         operation_id="CreateTeam",
         name="teams:create",
@@ -25,12 +25,15 @@ async def provides_teams_service(db_session: AsyncSession) -> AsyncGenerator[Tea
     """Construct repository and service objects for the request."""
     async with TeamService.new(
         session=db_session,
-        statement=select(Team)
-        .order_by(Team.name)
-        .options(
-            selectinload(Team.tags).options(noload("*")),
-            selectinload(Team.members).options(
-                joinedload(TeamMember.user, innerjoin=True).options(noload("*")),
+        statement=TeamService.cached_statement(
+            "list",
+            lambda: select(Team)
+            .order_by(Team.name)
+            .options(
+                selectinload(Team.tags).options(noload("*")),
+                selectinload(Team.members).options(
+                    joinedload(TeamMember.user, innerjoin=True).options(noload("*")),
+                ),
             ),
         ),
     ) as service:
@@ -44,10 +47,13 @@ async def provide_team_members_service(db_session: AsyncSession) -> AsyncGenerat
     """Construct repository and service objects for the request."""
     async with TeamMemberService.new(
         session=db_session,
-        statement=select(TeamMember).options(
-            noload("*"),
-            joinedload(TeamMember.team, innerjoin=True).options(noload("*")),
-            joinedload(TeamMember.user, innerjoin=True).options(noload("*")),
+        statement=TeamMemberService.cached_statement(
+            "list",
+            lambda: select(TeamMember).options(
+                noload("*"),
+                joinedload(TeamMember.team, innerjoin=True).options(noload("*")),
+                joinedload(TeamMember.user, innerjoin=True).options(noload("*")),
+            ),
         ),
     ) as service:
         try:
@@ -60,10 +66,13 @@ async def provide_team_invitations_service(db_session: AsyncSession) -> AsyncGen
     """Construct repository and service objects for the request."""
     async with TeamInvitationService.new(
         session=db_session,
-        statement=select(TeamInvitation).options(
-            noload("*"),
-            joinedload(TeamInvitation.team, innerjoin=True).options(noload("*")),
-            joinedload(TeamInvitation.invited_by, innerjoin=True).options(noload("*")),
+        statement=TeamInvitationService.cached_statement(
+            "list",
+            lambda: select(TeamInvitation).options(
+                noload("*"),
+                joinedload(TeamInvitation.team, innerjoin=True).options(noload("*")),
+                joinedload(TeamInvitation.invited_by, innerjoin=True).options(noload("*")),
+            ),
         ),
     ) as service:
         try:
@@ -1,14 +1,17 @@
 from typing import Any
 from uuid import UUID, uuid4
 
-from sqlalchemy import select
+from litestar.contrib.sqlalchemy.repository._util import wrap_sqlalchemy_exception
+from sqlalchemy import Select, select
 from sqlalchemy.orm import joinedload, noload, selectinload
 
+from app.domain.accounts.cache import user_cache
 from app.domain.tags.dependencies import provide_tags_service
 from app.domain.teams.models import Team, TeamInvitation, TeamMember, TeamRoles
 from app.lib.dependencies import FilterTypes
-from app.lib.repository import SQLAlchemyAsyncRepository, SQLAlchemyAsyncSlugRepository
+from app.lib.repository import SQLAlchemyAsyncRepository, SQLAlchemyAsyncSlugRepository, statement_cache
 from app.lib.service.sqlalchemy import SQLAlchemyAsyncRepositoryService
+from app.utils import slugify
 
 __all__ = [
     "TeamInvitationRepository",
@@ -32,19 +35,31 @@ class TeamRepository(SQLAlchemyAsyncSlugRepository[Team]):
         **kwargs: Any,
     ) -> tuple[list[Team], int]:
         """Get all teams for a user."""
-        statement = (
-            select(Team)
+        return await self.list_and_count(*filters, statement=self._user_teams_statement(user_id))
+
+    async def list_user_teams(
+        self,
+        *filters: FilterTypes,
+        user_id: UUID,
+        **kwargs: Any,
+    ) -> list[Team]:
+        """Get a page of teams for a user, without counting the collection."""
+        return await self.list(*filters, statement=self._user_teams_statement(user_id))
+
+    def _user_teams_statement(self, user_id: UUID) -> Select[tuple[Team]]:
+        statement = statement_cache.get(
+            (type(self), "user_teams"),
+            lambda: select(Team)
             .join(TeamMember, onclause=Team.id == TeamMember.team_id, isouter=False)
-            .where(TeamMember.user_id == user_id)
             .options(
                 noload("*"),
                 selectinload(Team.members).options(
                     joinedload(TeamMember.user, innerjoin=True).options(noload("*")),
                 ),
             )
-            .execution_options(populate_existing=True)
+            .execution_options(populate_existing=True),
         )
-        return await self.list_and_count(*filters, statement=statement)
+        return statement.where(TeamMember.user_id == user_id)
 
 
 class TeamService(SQLAlchemyAsyncRepositoryService[Team]):
@@ -66,6 +81,15 @@ class TeamService(SQLAlchemyAsyncRepositoryService[Team]):
         """Get all teams for a user."""
         return await self.repository.get_user_teams(*filters, user_id=user_id, **kwargs)
 
+    async def list_user_teams(
+        self,
+        *filters: FilterTypes,
+        user_id: UUID,
+        **kwargs: Any,
+    ) -> list[Team]:
+        """Get a page of teams for a user, without counting the collection."""
+        return await self.repository.list_user_teams(*filters, user_id=user_id, **kwargs)
+
     async def create(self, data: Team | dict[str, Any]) -> Team:
         """Create a new team with an owner."""
         owner_id: UUID | None = None
@@ -79,14 +103,18 @@ class TeamService(SQLAlchemyAsyncRepositoryService[Team]):
             db_obj.members.append(TeamMember(user_id=owner_id, role=TeamRoles.ADMIN, is_owner=True))
         if tags_added:
             tags_service = await anext(provide_tags_service(db_session=self.repository.session))
-            for tag_text in tags_added:
-                tag, _ = await tags_service.get_or_create(match_fields=["name"], upsert=False, name=tag_text)
-                db_obj.tags.append(tag)
-        return await super().create(db_obj)
+            db_obj.tags.extend(await tags_service.get_or_create_many(tags_added))
+        db_obj = await super().create(db_obj)
+        if owner_id:
+            await user_cache.invalidate(owner_id, session=self.repository.session)
+        return db_obj
 
     async def update(self, item_id: Any, data: Team | dict[str, Any]) -> Team:
         """Wrap repository update operation.
 
+        The column values and the tag changes are applied to the stored team and written with a single flush. The
+        team isn't refreshed, which would expire the `team` of its loaded members.
+
         Args:
             item_id: Identifier of item to be updated.
             data: Representation to be updated.
@@ -94,27 +122,50 @@ class TeamService(SQLAlchemyAsyncRepositoryService[Team]):
         Returns:
             Updated representation.
         """
-        tags_updated: list[str] = []
-        if isinstance(data, dict):
-            tags_updated.extend(data.pop("tags", None) or [])
-            data["id"] = item_id
-            data = await super().update(item_id, data)
+        if not isinstance(data, dict):
+            return await super().update(item_id, data)
+        tags_updated: list[str] = data.pop("tags", None) or []
+        values = self.to_values([await self.to_model(data, "update")])[0]
+        db_obj = await self.repository.get(item_id)
+        for key, value in values.items():
+            setattr(db_obj, key, value)
+        tags_kept = [tag for tag in db_obj.tags if tag.name in tags_updated]
+        tags_to_add = [tag_text for tag_text in tags_updated if tag_text not in {tag.name for tag in tags_kept}]
+        if tags_to_add:
             tags_service = await anext(provide_tags_service(db_session=self.repository.session))
-            existing_tags = [tag.name for tag in data.tags]
-            tags_to_remove = [tag for tag in data.tags if tag.name not in tags_updated]
-            tags_to_add = [tag for tag in tags_updated if tag not in existing_tags]
-            for tag_rm in tags_to_remove:
-                data.tags.remove(tag_rm)
-            for tag_text in tags_to_add:
-                tag, _ = await tags_service.get_or_create(name=tag_text)
-                data.tags.append(tag)
-        return await super().update(item_id, data)
+            tags_kept.extend(await tags_service.get_or_create_many(tags_to_add))
+        db_obj.tags = tags_kept
+        with wrap_sqlalchemy_exception():
+            self.repository.session.add(db_obj)
+            await self.repository.session.flush()
+            self.repository.session.expunge(db_obj)
+        return db_obj
+
+    async def delete(self, item_id: Any) -> Team:
+        """Delete a team and drop its members from the authenticated user cache."""
+        member_ids = await self.repository.session.scalars(
+            select(TeamMember.user_id).where(TeamMember.team_id == item_id)
+        )
+        db_obj = await super().delete(item_id)
+        await user_cache.invalidate(*member_ids, session=self.repository.session)
+        return db_obj
 
     async def to_model(self, data: Team | dict[str, Any], operation: str | None = None) -> Team:
         if isinstance(data, dict) and "slug" not in data and operation == "create":
-            data["slug"] = await self.repository.get_available_slug(data["name"])
+            data["slug"] = self.repository.get_available_slug(data["name"])
         return await super().to_model(data, operation)
 
+    async def to_insert_values(
+        self, data: list[Team | dict[str, Any]] | list[dict[str, Any]] | list[Team]
+    ) -> list[dict[str, Any]]:
+        values = self.to_values(data, validate=True)
+        if not values:
+            return values
+        suffixes = await self.repository.get_slug_suffixes(len(values))
+        for row, suffix in zip(values, suffixes, strict=True):
+            row.setdefault("slug", f"{slugify(row.get('name', ''))}-{suffix}")
+        return values
+
 
 class TeamMemberRepository(SQLAlchemyAsyncRepository[TeamMember]):
     """Team Member Repository."""
@@ -123,10 +174,28 @@ class TeamMemberRepository(SQLAlchemyAsyncRepository[TeamMember]):
 
 
 class TeamMemberService(SQLAlchemyAsyncRepositoryService[TeamMember]):
-    """Team Member Service."""
+    """Team Member Service.
+
+    Memberships are part of the authenticated user, so changes drop the member from the user cache.
+    """
 
     repository_type = TeamMemberRepository
 
+    async def create(self, data: TeamMember | dict[str, Any]) -> TeamMember:
+        db_obj = await super().create(data)
+        await user_cache.invalidate(db_obj.user_id, session=self.repository.session)
+        return db_obj
+
+    async def update(self, item_id: Any, data: TeamMember | dict[str, Any]) -> TeamMember:
+        db_obj = await super().update(item_id, data)
+        await user_cache.invalidate(db_obj.user_id, session=self.repository.session)
+        return db_obj
+
+    async def delete(self, item_id: Any) -> TeamMember:
+        db_obj = await super().delete(item_id)
+        await user_cache.invalidate(db_obj.user_id, session=self.repository.session)
+        return db_obj
+
 
 class TeamInvitationRepository(SQLAlchemyAsyncRepository[TeamInvitation]):
     """Team Invitation Repository."""
@@ -2,8 +2,10 @@ INDEX = "/"
 SITE_ROOT = "/{path:str}"
 OPENAPI_SCHEMA = "/schema"
 SYSTEM_HEALTH = "/health"
+SYSTEM_CACHE = "/api/system/cache"
 
 TAG_LIST = "/api/tags"
+TAG_LIST_CURSOR = "/api/tags/cursor"
 TAG_CREATE = "/api/tags"
 TAG_UPDATE = "/api/tags/{tag_id:uuid}"
 TAG_DELETE = "/api/tags/{tag_id:uuid}"
@@ -19,6 +21,7 @@ ACCOUNT_UPDATE = "/api/users/{user_id:uuid}"
 ACCOUNT_CREATE = "/api/users"
 
 TEAM_LIST = "/api/teams"
+TEAM_LIST_CURSOR = "/api/teams/cursor"
 TEAM_DELETE = "/api/teams/{team_id:uuid}"
 TEAM_DETAIL = "/api/teams/{team_id:uuid}"
 TEAM_UPDATE = "/api/teams/{team_id:uuid}"
@@ -28,3 +31,8 @@ TEAM_INVITATION_LIST = "/api/workspaces/{team_id:uuid}/invitations"
 
 
 STATS_WEEKLY_NEW_USERS = "/api/stats/weekly-new-users"
+STATS_SPRINT_BACKLOGS = "/api/stats/sprint-backlogs"
+STATS_WEEKLY_POINTS_BURNED = "/api/stats/weekly-points-burned"
+STATS_SPRINT_BURNDOWN = "/api/stats/projects/{project_slug:str}/sprints/{sprint_number:int}/burndown"
+STATS_SPRINT_BURNUP = "/api/stats/projects/{project_slug:str}/sprints/{sprint_number:int}/burnup"
+STATS_PROJECT_VELOCITY = "/api/stats/projects/{project_slug:str}/velocity"
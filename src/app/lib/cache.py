@@ -1,18 +1,68 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import asyncio
+import math
+import struct
+import time
+from collections import OrderedDict
+from contextlib import suppress
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+from urllib.parse import quote
+from uuid import uuid4
 
 from litestar.config.response_cache import ResponseCacheConfig, default_cache_key_builder
+from litestar.stores.base import NamespacedStore
 from litestar.stores.redis import RedisStore
+from litestar.types import Empty
 from redis.asyncio import Redis
+from redis.exceptions import RedisError
 
-from app.lib import settings
+from app.lib import log, serialization, settings
 
-__all__ = ["cache_key_builder", "on_shutdown"]
+__all__ = [
+    "CacheStats",
+    "INVALIDATION_CHANNEL",
+    "STORE_LOCAL_CACHE",
+    "LRUCache",
+    "SingleFlightStore",
+    "TaggedRedisStore",
+    "TwoTierStore",
+    "cache_key_builder",
+    "entity_tag",
+    "invalidate_committed_response_cache",
+    "invalidate_response_cache",
+    "listen_for_invalidations",
+    "local_caches",
+    "local_store_cache",
+    "on_shutdown",
+    "on_startup",
+    "publish_local_invalidation",
+    "release_failed_flights",
+    "response_cache_store",
+    "single_flight_store_factory",
+    "stats",
+    "tagged_cache_key_builder",
+]
 
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterable, Iterator
+
     from litestar.connection import Request
+    from litestar.types import CacheKeyBuilder, EmptyType, Scope
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = log.get_logger()
+
+TAGS_DELIMITER = "#"
+"""Delimits the tags at the start of a response cache key, see [`tagged_cache_key_builder`][]."""
+RESPONSE_CACHE_TAGS_SESSION_KEY = "response_cache_tags"
+
+K = TypeVar("K")
+V = TypeVar("V")
 
 
 redis = Redis.from_url(
@@ -29,8 +79,18 @@ redis = Redis.from_url(
 """
 
 
+async def on_startup() -> None:
+    """On Startup."""
+    global _listener  # noqa: PLW0603
+    _listener = asyncio.create_task(listen_for_invalidations())
+
+
 async def on_shutdown() -> None:
     """On Shutdown."""
+    if _listener is not None:
+        _listener.cancel()
+        with suppress(asyncio.CancelledError):
+            await _listener
     await redis.close()
 
 
@@ -50,8 +110,647 @@ def cache_key_builder(request: Request) -> str:
     return f"{settings.app.slug}:{default_cache_key_builder(request)}"
 
 
-def redis_store_factory(name: str) -> RedisStore:
-    return RedisStore(redis, namespace=f"{settings.app.slug}:{name}")
+def entity_tag(name: str, *values: object) -> str:
+    """Tag of the entity identified by `values`, as formatted by [`tagged_cache_key_builder`][].
+
+    E.g. `entity_tag("sprint", project_slug, sprint_number)` for the tag template
+    `"sprint:{project_slug}:{sprint_number}"`.
+    """
+    return ":".join([name, *(quote(str(value), safe="") for value in values)])
+
+
+def tagged_cache_key_builder(*tags: str) -> CacheKeyBuilder:
+    """Build the cache keys of a route handler whose responses depend on the entities named by `tags`.
+
+    The tags are prepended to the key, for [`TaggedRedisStore`][app.lib.cache.TaggedRedisStore] to index the entry
+    under them.
+
+    Args:
+        *tags: Tag templates, formatted with the path parameters of the request, e.g. `"backlog:{row_id}"`.
+
+    Returns:
+        A cache key builder for the route handler.
+    """
+
+    def builder(request: Request) -> str:
+        # quoted so that a path parameter can't contain a delimiter
+        path_params = {key: quote(str(value), safe="") for key, value in request.path_params.items()}
+        tag_list = ",".join(tag.format(**path_params) for tag in tags)
+        return f"{TAGS_DELIMITER}{tag_list}{TAGS_DELIMITER}{cache_key_builder(request)}"
+
+    return builder
+
+
+class LRUCache(Generic[K, V]):
+    """Size bounded, in process cache with a time to live."""
+
+    def __init__(
+        self,
+        maxsize: int,
+        expiration: float,
+        timer: Callable[[], float] = time.monotonic,
+        max_bytes: int | None = None,
+        sizeof: Callable[[V], int] = len,  # type: ignore[assignment]
+    ) -> None:
+        """Configure the cache.
+
+        Args:
+            maxsize: Max number of entries.  The least recently used entry is evicted first.
+            expiration: Seconds an entry is kept, unless set with a shorter expiration.
+            timer: Clock, in seconds.
+            max_bytes: Max total size of the values, if any.  Larger values are not cached.
+            sizeof: Size of a value, in bytes.
+        """
+        self.maxsize = maxsize
+        self.expiration = expiration
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._timer = timer
+        self._sizeof = sizeof
+        self._entries: OrderedDict[K, tuple[float, V, int]] = OrderedDict()
+
+    def get(self, key: K) -> V | None:
+        """Get the value of `key` if it's not expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value, _ = entry
+        if expires_at <= self._timer():
+            self.pop(key)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V, expiration: float | None = None) -> None:
+        """Store `value` under `key`, evicting the least recently used entries when full.
+
+        Args:
+            key: Key of the entry.
+            value: Value to store.
+            expiration: Seconds the entry is kept, capped by the expiration of the cache.
+        """
+        self.pop(key)
+        size = self._sizeof(value) if self.max_bytes is not None else 0
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        expiration = self.expiration if expiration is None else min(expiration, self.expiration)
+        self._entries[key] = (self._timer() + expiration, value, size)
+        self.size += size
+        while len(self._entries) > self.maxsize or (self.max_bytes is not None and self.size > self.max_bytes):
+            *_, evicted_size = self._entries.popitem(last=False)[1]
+            self.size -= evicted_size
+
+    def pop(self, key: K) -> V | None:
+        """Remove `key` and return its value."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return None
+        self.size -= entry[2]
+        return entry[1]
+
+    def items(self) -> Iterator[tuple[K, V]]:
+        """Iterate over the entries, including the expired ones."""
+        return ((key, value) for key, (_, value, _) in list(self._entries.items()))
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+        self.size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _split_tags(key: str) -> tuple[str, list[str]]:
+    if not key.startswith(TAGS_DELIMITER):
+        return key, []
+    tag_list, _, key = key[len(TAGS_DELIMITER) :].partition(TAGS_DELIMITER)
+    return key, tag_list.split(",")
+
+
+class TaggedRedisStore(RedisStore):
+    """Redis store whose entries can be invalidated by the tags of their key.
+
+    Each tag is a Redis set of the keys cached under it, which expires with the longest lived of them.  Keys without
+    tags are stored as by [`RedisStore`][litestar.stores.redis.RedisStore].
+    """
+
+    __slots__ = ("_set_tagged_script", "_invalidate_script")
+
+    def __init__(self, redis: Redis, namespace: str | None | EmptyType = Empty) -> None:
+        super().__init__(redis, namespace)
+
+        # script to set a key and add it to its tags in one atomic step
+        self._set_tagged_script = self._redis.register_script(
+            b"""
+        local key = KEYS[1]
+        local expires_in = tonumber(ARGV[2])
+
+        if expires_in > 0 then
+            redis.call('SET', key, ARGV[1], 'EX', expires_in)
+        else
+            redis.call('SET', key, ARGV[1])
+        end
+
+        for i = 2, #KEYS do
+            local exists = redis.call('EXISTS', KEYS[i])
+            redis.call('SADD', KEYS[i], key)
+            if expires_in == 0 then
+                redis.call('PERSIST', KEYS[i])
+            elseif exists == 0 then
+                redis.call('EXPIRE', KEYS[i], expires_in)
+            else
+                local ttl = redis.call('TTL', KEYS[i])
+                if ttl >= 0 and ttl < expires_in then
+                    redis.call('EXPIRE', KEYS[i], expires_in)
+                end
+            end
+        end
+        """
+        )
+
+        # script to delete the keys of the given tags, and the tags
+        self._invalidate_script = self._redis.register_script(
+            b"""
+        local deleted = {}
+
+        for i = 1, #KEYS do
+            local keys = redis.call('SMEMBERS', KEYS[i])
+            for j = 1, #keys, 1000 do
+                redis.call('UNLINK', unpack(keys, j, math.min(j + 999, #keys)))
+            end
+            for _, key in ipairs(keys) do
+                table.insert(deleted, key)
+            end
+            redis.call('UNLINK', KEYS[i])
+        end
+
+        return deleted
+        """
+        )
+
+    def with_namespace(self, namespace: str) -> TaggedRedisStore:
+        return type(self)(redis=self._redis, namespace=f"{self.namespace}_{namespace}" if self.namespace else namespace)
+
+    def _make_tag_key(self, tag: str) -> str:
+        prefix = f"{self.namespace}_tags:" if self.namespace else "tags:"
+        return prefix + tag
+
+    async def set(self, key: str, value: str | bytes, expires_in: int | timedelta | None = None) -> None:
+        """Set a value, and index its key under its tags.
+
+        Args:
+            key: Key to associate the value with, optionally prefixed with tags
+            value: Value to store
+            expires_in: Time in seconds before the key is considered expired
+        """
+        key, tags = _split_tags(key)
+        if not tags:
+            return await super().set(key, value, expires_in)
+        if isinstance(expires_in, timedelta):
+            expires_in = int(expires_in.total_seconds())
+        await self._set_tagged_script(
+            keys=[self._make_key(key), *(self._make_tag_key(tag) for tag in tags)],
+            args=[value, expires_in or 0],
+        )
+        return None
+
+    def redis_key(self, key: str) -> str:
+        """Redis key of `key`, without its tags."""
+        return self._make_key(_split_tags(key)[0])
+
+    async def get(self, key: str, renew_for: int | timedelta | None = None) -> bytes | None:
+        return await super().get(_split_tags(key)[0], renew_for)
+
+    async def get_with_expiry(self, key: str) -> tuple[bytes | None, int | None]:
+        """Get a value and the time in seconds it expires in, `None` if it doesn't expire."""
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.get(self.redis_key(key))
+            pipe.ttl(self.redis_key(key))
+            value, ttl = await pipe.execute()
+        return value, ttl if ttl >= 0 else None
+
+    async def delete(self, key: str) -> None:
+        await super().delete(_split_tags(key)[0])
+
+    async def exists(self, key: str) -> bool:
+        return await super().exists(_split_tags(key)[0])
+
+    async def expires_in(self, key: str) -> int | None:
+        return await super().expires_in(_split_tags(key)[0])
+
+    async def invalidate(self, *tags: str) -> list[str]:
+        """Delete the values stored under any of `tags`.
+
+        Returns:
+            The Redis keys of the deleted values.
+        """
+        if not tags:
+            return []
+        keys = await self._invalidate_script(keys=[self._make_tag_key(tag) for tag in tags], args=[])
+        return [key.decode() for key in keys]
+
+
+@dataclass
+class CacheStats:
+    """Lookups of the two tier stores of this process."""
+
+    local_hits: int = 0
+    redis_hits: int = 0
+    misses: int = 0
+
+    @property
+    def local_hit_ratio(self) -> float:
+        """Share of the lookups served in process."""
+        lookups = self.local_hits + self.redis_hits + self.misses
+        return self.local_hits / lookups if lookups else 0.0
+
+    @property
+    def redis_hit_ratio(self) -> float:
+        """Share of the lookups missed in process that Redis served."""
+        lookups = self.redis_hits + self.misses
+        return self.redis_hits / lookups if lookups else 0.0
+
+
+class TwoTierStore(NamespacedStore):
+    """Store keeping the values of a Redis store in a bounded, in process LRU as well.
+
+    Local entries expire with their Redis key, or after the local expiration if sooner.  Changes are published on
+    [`INVALIDATION_CHANNEL`][app.lib.cache.INVALIDATION_CHANNEL], for the other processes to drop their local entries,
+    see [`listen_for_invalidations`][app.lib.cache.listen_for_invalidations].
+    """
+
+    __slots__ = ("backend", "local")
+
+    def __init__(self, backend: TaggedRedisStore, local: LRUCache[str, bytes]) -> None:
+        """Configure the store.
+
+        Args:
+            backend: Redis tier.
+            local: In process tier, shared by the stores and keyed by Redis key.
+        """
+        self.backend = backend
+        self.local = local
+
+    @property
+    def namespace(self) -> str | None:
+        return self.backend.namespace
+
+    def with_namespace(self, namespace: str) -> TwoTierStore:
+        return type(self)(self.backend.with_namespace(namespace), self.local)
+
+    async def set(self, key: str, value: str | bytes, expires_in: int | timedelta | None = None) -> None:
+        if isinstance(value, str):
+            value = value.encode("utf-8")
+        if isinstance(expires_in, timedelta):
+            expires_in = int(expires_in.total_seconds())
+        await self.backend.set(key, value, expires_in)
+        redis_key = self.backend.redis_key(key)
+        await _publish_invalidation(keys=[redis_key])
+        self.local.set(redis_key, value, expires_in)
+
+    async def get(self, key: str, renew_for: int | timedelta | None = None) -> bytes | None:
+        if renew_for:
+            # renewing is done by Redis
+            return await self.backend.get(key, renew_for)
+        redis_key = self.backend.redis_key(key)
+        value = self.local.get(redis_key)
+        if value is not None:
+            stats.local_hits += 1
+            return value
+        generation = _generation
+        value, expires_in = await self.backend.get_with_expiry(key)
+        if value is None:
+            stats.misses += 1
+            return None
+        stats.redis_hits += 1
+        # an invalidation received meanwhile may be about the value just read
+        if generation == _generation:
+            self.local.set(redis_key, value, expires_in)
+        return value
+
+    async def delete(self, key: str) -> None:
+        await self.backend.delete(key)
+        redis_key = self.backend.redis_key(key)
+        self.local.pop(redis_key)
+        await _publish_invalidation(keys=[redis_key])
+
+    async def delete_all(self) -> None:
+        await self.backend.delete_all()
+        prefix = f"{self.backend.namespace}:"
+        _drop_local(prefix=prefix)
+        await _publish_invalidation(prefix=prefix)
+
+    async def exists(self, key: str) -> bool:
+        return self.local.get(self.backend.redis_key(key)) is not None or await self.backend.exists(key)
+
+    async def expires_in(self, key: str) -> int | None:
+        return await self.backend.expires_in(key)
+
+    async def invalidate(self, *tags: str) -> None:
+        """Delete the values stored under any of `tags`."""
+        keys = await self.backend.invalidate(*tags)
+        if keys:
+            _drop_local(keys=keys)
+            await _publish_invalidation(keys=keys)
+
+
+local_store_cache: LRUCache[str, bytes] = LRUCache(
+    maxsize=settings.api.CACHE_LOCAL_SIZE,
+    expiration=settings.api.CACHE_LOCAL_EXPIRATION,
+    max_bytes=settings.api.CACHE_LOCAL_MAX_BYTES,
+)
+"""In process tier of the two tier stores."""
+stats = CacheStats()
+"""Lookups of the two tier stores of this process."""
+
+INVALIDATION_CHANNEL = f"{settings.app.slug}:cache:invalidations"
+"""Redis channel of the changes to the two tier stores, and to the other in process caches."""
+STORE_LOCAL_CACHE = "stores"
+"""Name of the in process tier of the two tier stores in the invalidation messages."""
+local_caches: dict[str, LRUCache[str, Any]] = {STORE_LOCAL_CACHE: local_store_cache}
+"""In process caches whose entries are dropped by the invalidation messages, by name."""
+_origin = uuid4().hex
+_generation = 0
+_listener: asyncio.Task[None] | None = None
+
+
+def _drop_local(keys: Iterable[str] = (), prefix: str | None = None, name: str = STORE_LOCAL_CACHE) -> None:
+    global _generation  # noqa: PLW0603
+    _generation += 1
+    local = local_caches.get(name)
+    if local is None:
+        return
+    for key in keys:
+        local.pop(key)
+    if prefix is not None:
+        for key, _ in local.items():
+            if key.startswith(prefix):
+                local.pop(key)
+
+
+async def _publish_invalidation(
+    keys: list[str] | None = None, prefix: str | None = None, name: str = STORE_LOCAL_CACHE
+) -> None:
+    message = {"origin": _origin, "cache": name, "keys": keys or [], "prefix": prefix}
+    await redis.publish(INVALIDATION_CHANNEL, serialization.to_json(message))
+
+
+async def publish_local_invalidation(name: str, keys: list[str]) -> None:
+    """Have the other processes drop `keys` from their in process cache registered as `name` in `local_caches`.
+
+    Raises:
+        RedisError: The message can't be published.
+    """
+    await _publish_invalidation(keys=keys, name=name)
+
+
+async def listen_for_invalidations() -> None:
+    """Drop the local entries that other processes changed, until cancelled.
+
+    The local caches are cleared when the subscription is lost, as changes may have been missed.
+    """
+    while True:
+        try:
+            async with redis.pubsub(ignore_subscribe_messages=True) as pubsub:
+                await pubsub.subscribe(INVALIDATION_CHANNEL)
+                async for message in pubsub.listen():
+                    if message is None or message["type"] != "message":
+                        continue
+                    invalidation = serialization.from_json(message["data"])
+                    if invalidation["origin"] != _origin:
+                        _drop_local(
+                            keys=invalidation["keys"],
+                            prefix=invalidation["prefix"],
+                            name=invalidation.get("cache", STORE_LOCAL_CACHE),
+                        )
+        except RedisError:
+            logger.warning("cache invalidation subscription lost", exc_info=True)
+            for name in local_caches:
+                _drop_local(prefix="", name=name)
+            await asyncio.sleep(1)
+
+
+@dataclass
+class _Flight:
+    landed: asyncio.Event
+    token: str | None = None
+    timeout: asyncio.TimerHandle | None = None
+
+
+class SingleFlightStore(NamespacedStore):
+    """Store coalescing the concurrent misses of a key into a single computation of its value.
+
+    The first caller to miss a key leads: its `get` returns `None`, and it is expected to `set` the value.  Leading is
+    claimed within the process and across processes, through a Redis lock.  The other callers wait for the value, or
+    for `lock_timeout` seconds if it's never set, e.g. because its computation failed, and then compute it themselves.
+
+    Values are kept `stale_for` seconds after they expire.  A stale value is served to the other callers while the
+    leader computes the new one.
+    """
+
+    __slots__ = ("store", "stale_for", "lock_timeout", "poll_interval", "_flights", "_release_script")
+
+    def __init__(
+        self, store: TwoTierStore, stale_for: int = 0, lock_timeout: float = 10, poll_interval: float = 0.05
+    ) -> None:
+        """Configure the store.
+
+        Args:
+            store: Store of the values.
+            stale_for: Seconds an expired value can still be served while it's computed again.
+            lock_timeout: Max seconds a caller leads the computation of a value.
+            poll_interval: Seconds between the checks for a value computed by another process.
+        """
+        self.store = store
+        self.stale_for = stale_for
+        self.lock_timeout = lock_timeout
+        self.poll_interval = poll_interval
+        self._flights: dict[str, _Flight] = {}
+        # script to release a lock only if it's still held by its owner
+        self._release_script = redis.register_script(
+            b"""
+        if redis.call('GET', KEYS[1]) == ARGV[1] then
+            return redis.call('DEL', KEYS[1])
+        end
+        return 0
+        """
+        )
+
+    @property
+    def namespace(self) -> str | None:
+        return self.store.namespace
+
+    def with_namespace(self, namespace: str) -> SingleFlightStore:
+        return type(self)(self.store.with_namespace(namespace), self.stale_for, self.lock_timeout, self.poll_interval)
+
+    def _lock_key(self, key: str) -> str:
+        return f"{self.store.backend.redis_key(key)}:lock"
+
+    async def get(self, key: str, renew_for: int | timedelta | None = None) -> bytes | None:
+        """Get a value, or `None` if the caller has to compute it.
+
+        Args:
+            key: Key associated with the value
+            renew_for: Renew the expiry of the value for `renew_for` seconds, see
+                [`RedisStore.get`][litestar.stores.redis.RedisStore.get]
+
+        Returns:
+            The value, possibly stale, or `None` if the caller leads its computation or waited for it in vain.
+        """
+        fresh_until, value = _unpack_entry(await self.store.get(key, renew_for))
+        if value is not None and fresh_until > time.time():
+            return value
+        lock_key = self._lock_key(key)
+        flight = self._flights.get(lock_key)
+        if flight is not None:
+            if value is not None:
+                return value
+            with suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(flight.landed.wait(), self.lock_timeout)
+            return _unpack_entry(await self.store.get(key))[1]
+        flight = self._flights[lock_key] = _Flight(landed=asyncio.Event())
+        token = uuid4().hex
+        if await redis.set(lock_key, token, nx=True, px=int(self.lock_timeout * 1000)):
+            flight.token = token
+            flight.timeout = asyncio.get_running_loop().call_later(self.lock_timeout, self._land, lock_key)
+            _led_flights.set((*_led_flights.get(), (self, key)))
+            return None
+        try:
+            if value is not None:
+                return value
+            return await self._wait_for_other_process(key, lock_key)
+        finally:
+            self._land(lock_key)
+
+    async def _wait_for_other_process(self, key: str, lock_key: str) -> bytes | None:
+        deadline = time.monotonic() + self.lock_timeout
+        while time.monotonic() < deadline:
+            await asyncio.sleep(self.poll_interval)
+            value = _unpack_entry(await self.store.get(key))[1]
+            if value is not None or not await redis.exists(lock_key):
+                return value
+        return None
+
+    def _land(self, lock_key: str) -> _Flight | None:
+        flight = self._flights.pop(lock_key, None)
+        if flight is not None:
+            flight.landed.set()
+            if flight.timeout is not None:
+                flight.timeout.cancel()
+        return flight
+
+    async def _release(self, key: str) -> None:
+        lock_key = self._lock_key(key)
+        flight = self._land(lock_key)
+        if flight is not None and flight.token is not None:
+            await self._release_script(keys=[lock_key], args=[flight.token])
+
+    async def set(self, key: str, value: str | bytes, expires_in: int | timedelta | None = None) -> None:
+        """Set a value, and release the callers waiting for it.
+
+        Args:
+            key: Key to associate the value with
+            value: Value to store
+            expires_in: Time in seconds before the value is stale
+        """
+        if isinstance(value, str):
+            value = value.encode("utf-8")
+        if isinstance(expires_in, timedelta):
+            expires_in = int(expires_in.total_seconds())
+        fresh_until = time.time() + expires_in if expires_in else math.inf
+        try:
+            await self.store.set(
+                key, _pack_entry(fresh_until, value), expires_in + self.stale_for if expires_in else None
+            )
+        finally:
+            await self._release(key)
+
+    async def get_or_set(
+        self, key: str, factory: Callable[[], Awaitable[bytes]], expires_in: int | timedelta | None = None
+    ) -> bytes:
+        """Get a value, computing it with `factory` on a miss.
+
+        Args:
+            key: Key associated with the value
+            factory: Computes the value
+            expires_in: Time in seconds before the value is stale
+
+        Returns:
+            The value.
+        """
+        value = await self.get(key)
+        if value is not None:
+            return value
+        try:
+            value = await factory()
+        except BaseException:
+            await self._release(key)
+            raise
+        await self.set(key, value, expires_in)
+        return value
+
+    async def delete(self, key: str) -> None:
+        await self.store.delete(key)
+
+    async def delete_all(self) -> None:
+        await self.store.delete_all()
+
+    async def exists(self, key: str) -> bool:
+        return await self.store.exists(key)
+
+    async def expires_in(self, key: str) -> int | None:
+        return await self.store.expires_in(key)
+
+    async def invalidate(self, *tags: str) -> None:
+        """Delete the values stored under any of `tags`."""
+        await self.store.invalidate(*tags)
+
+
+_led_flights: ContextVar[tuple[tuple[SingleFlightStore, str], ...]] = ContextVar("led_flights", default=())
+
+
+async def release_failed_flights(exception: Exception, scope: Scope) -> None:
+    """Release the keys whose computation a failed request led, for the requests waiting on them to compute them."""
+    for store, key in _led_flights.get():
+        await store._release(key)
+    _led_flights.set(())
+
+
+_ENTRY_HEADER = struct.Struct(">4sd")
+_ENTRY_MAGIC = b"sf01"
+
+
+def _pack_entry(fresh_until: float, value: bytes) -> bytes:
+    return _ENTRY_HEADER.pack(_ENTRY_MAGIC, fresh_until) + value
+
+
+def _unpack_entry(entry: bytes | None) -> tuple[float, bytes | None]:
+    if entry is None or entry[: len(_ENTRY_MAGIC)] != _ENTRY_MAGIC:
+        return 0.0, None
+    _, fresh_until = _ENTRY_HEADER.unpack_from(entry)
+    return fresh_until, entry[_ENTRY_HEADER.size :]
+
+
+def redis_store_factory(name: str) -> TwoTierStore:
+    return TwoTierStore(TaggedRedisStore(redis, namespace=f"{settings.app.slug}:{name}"), local_store_cache)
+
+
+def single_flight_store_factory(name: str, stale_for: int | None = None) -> SingleFlightStore:
+    """Create a two tier store coalescing the concurrent misses of its keys.
+
+    Args:
+        name: Name of the store.
+        stale_for: Seconds an expired value can still be served, `API_CACHE_STALE_EXPIRATION` by default.
+
+    Returns:
+        The store.  It should be created once per process, for the misses to be coalesced.
+    """
+    return SingleFlightStore(
+        redis_store_factory(name),
+        stale_for=settings.api.CACHE_STALE_EXPIRATION if stale_for is None else stale_for,
+        lock_timeout=settings.api.CACHE_LOCK_TIMEOUT,
+    )
 
 
 config = ResponseCacheConfig(
@@ -59,3 +758,35 @@ config = ResponseCacheConfig(
     key_builder=cache_key_builder,
 )
 """Cache configuration for application."""
+
+response_cache_store = single_flight_store_factory(config.store)
+"""Store of the response cache."""
+
+
+async def invalidate_response_cache(session: AsyncSession, *tags: str) -> None:
+    """Invalidate the cached responses tagged with any of `tags`, after a change to their entities.
+
+    The responses are invalidated right away, and again once `session` commits, see
+    [`invalidate_committed_response_cache`][app.lib.cache.invalidate_committed_response_cache].  This drops the
+    responses that concurrent requests cached from the data as it was before the commit.
+
+    Args:
+        session: Session the change is made in.
+        *tags: Tags of the changed entities.
+    """
+    session.info.setdefault(RESPONSE_CACHE_TAGS_SESSION_KEY, set()).update(tags)
+    try:
+        await response_cache_store.invalidate(*tags)
+    except RedisError:
+        logger.warning("response cache invalidation failed", tags=sorted(tags), exc_info=True)
+
+
+async def invalidate_committed_response_cache(session: AsyncSession) -> None:
+    """Invalidate the cached responses tagged by the changes `session` just committed."""
+    tags = session.info.pop(RESPONSE_CACHE_TAGS_SESSION_KEY, None)
+    if not tags:
+        return
+    try:
+        await response_cache_store.invalidate(*tags)
+    except RedisError:
+        logger.warning("response cache invalidation failed", tags=sorted(tags), exc_info=True)
@@ -13,6 +13,9 @@ session."""
 DB_CONNECTION_DEPENDENCY_KEY = "db_connection"
 """The name of the key used for dependency injection of the raw database
 connection."""
+HTTP_CLIENT_DEPENDENCY_KEY = "http_client"
+"""The name of the key used for dependency injection of the shared HTTP
+client."""
 USER_DEPENDENCY_KEY = "current_user"
 """The name of the key used for dependency injection of the database
 session."""
@@ -20,5 +23,7 @@ DTO_INFO_KEY = "info"
 """The name of the key used for storing DTO information."""
 DEFAULT_PAGINATION_SIZE = 20
 """Default page size to use."""
+DEFAULT_INSERT_BATCH_SIZE = 500
+"""Default number of rows sent per statement by bulk inserts."""
 SERVICE_OBJECT_IDENTITY_MAP: MutableMapping[str, type[Service[Any]]] = {}
 """Used by the worker to lookup methods for service object callbacks."""
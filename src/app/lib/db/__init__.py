@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from app.lib.db import orm, utils
 from app.lib.db.base import (
+    after_commit,
     async_session_factory,
     before_send_handler,
     config,
@@ -12,6 +13,7 @@ from app.lib.db.base import (
 )
 
 __all__ = [
+    "after_commit",
     "utils",
     "before_send_handler",
     "config",
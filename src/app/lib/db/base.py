@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 from contextlib import asynccontextmanager
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Any, cast
 
 from litestar.contrib.sqlalchemy.plugins.init.config import (
     SQLAlchemyAsyncConfig,
@@ -16,14 +17,49 @@ from litestar.utils import (
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.pool import NullPool
 
-from app.lib import constants, settings
+from app.lib import cache, constants, log, settings
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator
+    from collections.abc import AsyncIterator, Awaitable, Callable
 
     from litestar.types import Message, Scope
     from sqlalchemy.ext.asyncio import AsyncSession
-__all__ = ["before_send_handler", "session"]
+__all__ = ["after_commit", "before_send_handler", "session"]
+
+logger = log.get_logger()
+
+AFTER_COMMIT_SESSION_KEY = "after_commit"
+_background_tasks: set[asyncio.Task[None]] = set()
+
+
+def after_commit(session: AsyncSession, callback: Callable[[], Awaitable[Any]]) -> None:
+    """Run `callback` in the background once the request `session` commits.
+
+    The callbacks are dropped if the session rolls back instead, so that e.g. notifications are only sent for
+    changes that are persisted.  Their errors are logged, and a callback registered more than once runs once.
+
+    Args:
+        session: Session the change is made in.
+        callback: Function returning the awaitable to run.
+    """
+    callbacks = session.info.setdefault(AFTER_COMMIT_SESSION_KEY, [])
+    if callback not in callbacks:
+        callbacks.append(callback)
+
+
+async def _run_after_commit(callback: Callable[[], Awaitable[Any]]) -> None:
+    try:
+        await callback()
+    except Exception:  # noqa: BLE001
+        logger.exception("after commit callback failed")
+
+
+def _spawn_after_commit(session: AsyncSession) -> None:
+    for callback in session.info.pop(AFTER_COMMIT_SESSION_KEY, []):
+        # the event loop only keeps weak references to its tasks
+        task = asyncio.create_task(_run_after_commit(callback))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
 
 
 async def before_send_handler(message: Message, scope: Scope) -> None:
@@ -41,7 +77,10 @@ async def before_send_handler(message: Message, scope: Scope) -> None:
         if session is not None and message["type"] == "http.response.start":
             if HTTP_200_OK <= message["status"] < HTTP_300_MULTIPLE_CHOICES:
                 await session.commit()
+                await cache.invalidate_committed_response_cache(session)
+                _spawn_after_commit(session)
             else:
+                session.info.pop(AFTER_COMMIT_SESSION_KEY, None)
                 await session.rollback()
     finally:
         if session and message["type"] in SESSION_TERMINUS_ASGI_EVENTS:
@@ -0,0 +1,71 @@
+"""analytics rollups
+
+Revision ID: 8c1f0d6b2a94
+Revises: 5e2a9c41d7b3
+Create Date: 2026-10-18 14:37:05.602114
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from litestar.contrib.sqlalchemy.types import GUID, ORA_JSONB, DateTimeUTC
+
+
+sa.GUID = GUID
+sa.DateTimeUTC = DateTimeUTC
+sa.ORA_JSONB = ORA_JSONB
+
+# revision identifiers, used by Alembic.
+revision = '8c1f0d6b2a94'
+down_revision = '5e2a9c41d7b3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('analytics_weekly_rollup',
+    sa.Column('series', sa.String(length=50), nullable=False),
+    sa.Column('dimension', sa.String(length=100), nullable=False),
+    sa.Column('week', sa.DateTimeUTC(timezone=True), nullable=False),
+    sa.Column('value', sa.Float(), nullable=False),
+    sa.Column('id', sa.GUID(length=16), nullable=False),
+    sa.Column('_sentinel', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTimeUTC(timezone=True), nullable=False),
+    sa.Column('updated_at', sa.DateTimeUTC(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('id', name=op.f('pk_analytics_weekly_rollup')),
+    sa.UniqueConstraint('series', 'dimension', 'week', name=op.f('uq_analytics_weekly_rollup_series'))
+    )
+    op.create_table('analytics_sprint_rollup',
+    sa.Column('series', sa.String(length=50), nullable=False),
+    sa.Column('project_slug', sa.String(), nullable=False),
+    sa.Column('sprint_number', sa.Integer(), nullable=False),
+    sa.Column('value', sa.Float(), nullable=False),
+    sa.Column('id', sa.GUID(length=16), nullable=False),
+    sa.Column('_sentinel', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTimeUTC(timezone=True), nullable=False),
+    sa.Column('updated_at', sa.DateTimeUTC(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('id', name=op.f('pk_analytics_sprint_rollup')),
+    sa.UniqueConstraint('series', 'project_slug', 'sprint_number', name=op.f('uq_analytics_sprint_rollup_series'))
+    )
+    op.create_table('analytics_rollup_watermark',
+    sa.Column('source', sa.String(length=50), nullable=False),
+    sa.Column('watermark', sa.DateTimeUTC(timezone=True), nullable=False),
+    sa.Column('id', sa.GUID(length=16), nullable=False),
+    sa.Column('_sentinel', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTimeUTC(timezone=True), nullable=False),
+    sa.Column('updated_at', sa.DateTimeUTC(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('id', name=op.f('pk_analytics_rollup_watermark')),
+    sa.UniqueConstraint('source', name=op.f('uq_analytics_rollup_watermark_source'))
+    )
+    # the rollup folds scan the rows created since the last watermark
+    op.create_index(op.f('ix_user_account_created_at'), 'user_account', ['created_at'], unique=False)
+    op.create_index(op.f('ix_backlog_created_at'), 'backlog', ['created_at'], unique=False)
+    op.create_index(op.f('ix_backlog_audit_created_at'), 'backlog_audit', ['created_at'], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_backlog_audit_created_at'), table_name='backlog_audit')
+    op.drop_index(op.f('ix_backlog_created_at'), table_name='backlog')
+    op.drop_index(op.f('ix_user_account_created_at'), table_name='user_account')
+    op.drop_table('analytics_rollup_watermark')
+    op.drop_table('analytics_sprint_rollup')
+    op.drop_table('analytics_weekly_rollup')
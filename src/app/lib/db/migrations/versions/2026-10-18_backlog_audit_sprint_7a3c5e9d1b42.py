@@ -0,0 +1,38 @@
+"""backlog audit sprint
+
+Revision ID: 7a3c5e9d1b42
+Revises: 590c3eb3b716
+Create Date: 2026-10-18 21:14:36.118204
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from litestar.contrib.sqlalchemy.types import GUID, ORA_JSONB, DateTimeUTC
+
+
+sa.GUID = GUID
+sa.DateTimeUTC = DateTimeUTC
+sa.ORA_JSONB = ORA_JSONB
+
+# revision identifiers, used by Alembic.
+revision = '7a3c5e9d1b42'
+down_revision = '590c3eb3b716'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('backlog_audit', sa.Column('project_slug', sa.String(), nullable=True))
+    op.add_column('backlog_audit', sa.Column('sprint_number', sa.Integer(), nullable=True))
+    op.add_column('backlog_audit', sa.Column('points', sa.Integer(), nullable=True))
+    # the sprint and points the existing changes were made at aren't known, the current ones are the best guess
+    op.execute(
+        "update backlog_audit set project_slug = backlog.project_slug, sprint_number = backlog.sprint_number, "
+        "points = backlog.points from backlog where backlog.id = backlog_audit.backlog_id"
+    )
+
+
+def downgrade():
+    op.drop_column('backlog_audit', 'points')
+    op.drop_column('backlog_audit', 'sprint_number')
+    op.drop_column('backlog_audit', 'project_slug')
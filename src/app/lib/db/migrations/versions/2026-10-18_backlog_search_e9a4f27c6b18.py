@@ -0,0 +1,61 @@
+"""backlog search
+
+Revision ID: e9a4f27c6b18
+Revises: b47e1c9a03d5
+Create Date: 2026-10-18 19:41:22.870153
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from litestar.contrib.sqlalchemy.types import GUID, ORA_JSONB, DateTimeUTC
+from sqlalchemy.dialects import postgresql
+
+
+sa.GUID = GUID
+sa.DateTimeUTC = DateTimeUTC
+sa.ORA_JSONB = ORA_JSONB
+
+# revision identifiers, used by Alembic.
+revision = 'e9a4f27c6b18'
+down_revision = 'b47e1c9a03d5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("create extension if not exists pg_trgm")
+    op.execute(
+        "create or replace function immutable_array_to_string(text[], text) returns text "
+        "language sql immutable parallel safe as $$ select array_to_string($1, $2) $$"
+    )
+    op.add_column(
+        'backlog',
+        sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+                "setweight(to_tsvector('simple', coalesce(slug, '')), 'B') || "
+                "setweight(to_tsvector('english', coalesce(immutable_array_to_string(labels, ' '), '')), 'B') || "
+                "setweight(to_tsvector('english', coalesce(description, '')), 'C')",
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+    )
+    op.create_index('ix_backlog_search_vector', 'backlog', ['search_vector'], unique=False, postgresql_using='gin')
+    op.create_index(
+        'ix_backlog_title_trgm',
+        'backlog',
+        ['title'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'title': 'gin_trgm_ops'},
+    )
+
+
+def downgrade():
+    op.drop_index('ix_backlog_title_trgm', table_name='backlog', postgresql_using='gin')
+    op.drop_index('ix_backlog_search_vector', table_name='backlog', postgresql_using='gin')
+    op.drop_column('backlog', 'search_vector')
+    op.execute("drop function immutable_array_to_string(text[], text)")
@@ -0,0 +1,31 @@
+"""label indexes
+
+Revision ID: 2f6b8d3e1a57
+Revises: e9a4f27c6b18
+Create Date: 2026-10-18 20:37:15.104828
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from litestar.contrib.sqlalchemy.types import GUID, ORA_JSONB, DateTimeUTC
+
+
+sa.GUID = GUID
+sa.DateTimeUTC = DateTimeUTC
+sa.ORA_JSONB = ORA_JSONB
+
+# revision identifiers, used by Alembic.
+revision = '2f6b8d3e1a57'
+down_revision = 'e9a4f27c6b18'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_backlog_labels', 'backlog', ['labels'], unique=False, postgresql_using='gin')
+    op.create_index('ix_project_labels', 'project', ['labels'], unique=False, postgresql_using='gin')
+
+
+def downgrade():
+    op.drop_index('ix_project_labels', table_name='project', postgresql_using='gin')
+    op.drop_index('ix_backlog_labels', table_name='backlog', postgresql_using='gin')
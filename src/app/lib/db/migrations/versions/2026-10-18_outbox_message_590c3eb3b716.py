@@ -0,0 +1,45 @@
+"""outbox message
+
+Revision ID: 590c3eb3b716
+Revises: 2f6b8d3e1a57
+Create Date: 2026-10-18 05:20:16.086722
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from litestar.contrib.sqlalchemy.types import GUID, ORA_JSONB, DateTimeUTC
+from sqlalchemy.dialects import postgresql
+
+sa.GUID = GUID
+sa.DateTimeUTC = DateTimeUTC
+sa.ORA_JSONB = ORA_JSONB
+
+# revision identifiers, used by Alembic.
+revision = '590c3eb3b716'
+down_revision = '2f6b8d3e1a57'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('outbox_message',
+    sa.Column('topic', sa.String(length=100), nullable=False),
+    sa.Column('key', sa.String(length=255), nullable=False),
+    sa.Column('payload', sa.JSON().with_variant(sa.ORA_JSONB(), 'oracle').with_variant(postgresql.JSONB(astext_type=sa.Text()), 'postgresql'), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('available_at', sa.DateTimeUTC(timezone=True), nullable=False),
+    sa.Column('delivered_at', sa.DateTimeUTC(timezone=True), nullable=True),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('id', sa.GUID(length=16), nullable=False),
+    sa.Column('_sentinel', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTimeUTC(timezone=True), nullable=False),
+    sa.Column('updated_at', sa.DateTimeUTC(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('id', name=op.f('pk_outbox_message')),
+    sa.UniqueConstraint('key', name=op.f('uq_outbox_message_key'))
+    )
+    op.create_index('ix_outbox_message_pending', 'outbox_message', ['available_at'], unique=False, postgresql_where=sa.text('delivered_at IS NULL'))
+
+
+def downgrade():
+    op.drop_index('ix_outbox_message_pending', table_name='outbox_message', postgresql_where=sa.text('delivered_at IS NULL'))
+    op.drop_table('outbox_message')
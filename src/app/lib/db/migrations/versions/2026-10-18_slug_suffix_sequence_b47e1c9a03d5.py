@@ -0,0 +1,30 @@
+"""slug suffix sequence
+
+Revision ID: b47e1c9a03d5
+Revises: 3d7e5b1f9c20
+Create Date: 2026-10-18 18:24:06.508913
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from litestar.contrib.sqlalchemy.types import GUID, ORA_JSONB, DateTimeUTC
+from sqlalchemy.schema import CreateSequence, DropSequence
+
+
+sa.GUID = GUID
+sa.DateTimeUTC = DateTimeUTC
+sa.ORA_JSONB = ORA_JSONB
+
+# revision identifiers, used by Alembic.
+revision = 'b47e1c9a03d5'
+down_revision = '3d7e5b1f9c20'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute(CreateSequence(sa.Sequence('slug_suffix_seq', start=0x10000)))
+
+
+def downgrade():
+    op.execute(DropSequence(sa.Sequence('slug_suffix_seq')))
@@ -0,0 +1,33 @@
+"""sprint analytics indexes
+
+Revision ID: 3d7e5b1f9c20
+Revises: 8c1f0d6b2a94
+Create Date: 2026-10-18 16:02:48.317740
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from litestar.contrib.sqlalchemy.types import GUID, ORA_JSONB, DateTimeUTC
+
+
+sa.GUID = GUID
+sa.DateTimeUTC = DateTimeUTC
+sa.ORA_JSONB = ORA_JSONB
+
+# revision identifiers, used by Alembic.
+revision = '3d7e5b1f9c20'
+down_revision = '8c1f0d6b2a94'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        op.f('ix_backlog_project_slug_sprint_number'), 'backlog', ['project_slug', 'sprint_number'], unique=False
+    )
+    op.create_index(op.f('ix_backlog_audit_backlog_id'), 'backlog_audit', ['backlog_id'], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_backlog_audit_backlog_id'), table_name='backlog_audit')
+    op.drop_index(op.f('ix_backlog_project_slug_sprint_number'), table_name='backlog')
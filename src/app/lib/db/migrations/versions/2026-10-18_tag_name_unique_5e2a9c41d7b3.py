@@ -0,0 +1,48 @@
+"""tag name unique
+
+Revision ID: 5e2a9c41d7b3
+Revises: 13b6784a4aa7
+Create Date: 2026-10-18 09:12:41.215377
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from litestar.contrib.sqlalchemy.types import GUID, ORA_JSONB, DateTimeUTC
+
+
+sa.GUID = GUID
+sa.DateTimeUTC = DateTimeUTC
+sa.ORA_JSONB = ORA_JSONB
+
+# revision identifiers, used by Alembic.
+revision = '5e2a9c41d7b3'
+down_revision = '13b6784a4aa7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # merge duplicate tags into the oldest one before enforcing uniqueness
+    op.execute(
+        """
+        create temporary table tag_merge as
+        select id, first_value(id) over (partition by name order by created_at, id) as keep_id
+        from tag
+        """
+    )
+    op.execute(
+        """
+        insert into team_tag (team_id, tag_id)
+        select team_tag.team_id, tag_merge.keep_id
+        from team_tag join tag_merge on tag_merge.id = team_tag.tag_id
+        where tag_merge.id <> tag_merge.keep_id
+        on conflict do nothing
+        """
+    )
+    op.execute("delete from tag using tag_merge where tag.id = tag_merge.id and tag_merge.id <> tag_merge.keep_id")
+    op.execute("drop table tag_merge")
+    op.create_unique_constraint(op.f('uq_tag_name'), 'tag', ['name'])
+
+
+def downgrade():
+    op.drop_constraint(op.f('uq_tag_name'), 'tag', type_='unique')
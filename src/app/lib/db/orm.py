@@ -2,20 +2,65 @@
 
 from __future__ import annotations
 
-from typing import Any
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
 
-from litestar.contrib.sqlalchemy.base import AuditColumns, orm_registry
-from litestar.contrib.sqlalchemy.base import UUIDAuditBase as TimestampedDatabaseModel
+from litestar.contrib.sqlalchemy.base import CommonTableAttributes, UUIDPrimaryKey, orm_registry
 from litestar.contrib.sqlalchemy.base import UUIDBase as DatabaseModel
 from litestar.contrib.sqlalchemy.repository import ModelT  # noqa: TCH002
-from sqlalchemy import String
+from litestar.contrib.sqlalchemy.types import DateTimeUTC
+from sqlalchemy import Sequence, String, TypeDecorator, func, literal
 from sqlalchemy.orm import (
+    DeclarativeBase,
     Mapped,
     declarative_mixin,
     mapped_column,
 )
 
-__all__ = ["DatabaseModel", "TimestampedDatabaseModel", "orm_registry", "model_from_dict", "AuditColumns", "SlugKey"]
+__all__ = [
+    "DatabaseModel",
+    "TimestampedDatabaseModel",
+    "orm_registry",
+    "model_from_dict",
+    "AuditColumns",
+    "SlugKey",
+    "slug_suffix_sequence",
+    "unique_slug",
+    "column_python_type",
+]
+
+if TYPE_CHECKING:
+    from sqlalchemy import ColumnElement
+    from sqlalchemy.types import TypeEngine
+
+# starts above the 4 character random suffixes previously appended to slugs, so that they can't collide
+slug_suffix_sequence = Sequence("slug_suffix_seq", start=0x10000, metadata=orm_registry.metadata)
+"""Sequence of the suffixes making slugs unique, see [`unique_slug`][app.lib.db.orm.unique_slug]."""
+
+
+def _utcnow() -> datetime:
+    return datetime.now(UTC)
+
+
+@declarative_mixin
+class AuditColumns:
+    """Created/Updated At Fields Mixin.
+
+    Unlike the litestar mixin, whose defaults are evaluated once when the models are imported, the timestamps are
+    taken when each row is inserted or updated, including by the core `INSERT` statements of the repositories.
+    Timestamps set explicitly are kept.
+    """
+
+    created_at: Mapped[datetime] = mapped_column(DateTimeUTC(timezone=True), default=_utcnow)
+    """Date/time of instance creation."""
+    updated_at: Mapped[datetime] = mapped_column(DateTimeUTC(timezone=True), default=_utcnow, onupdate=_utcnow)
+    """Date/time of instance last update."""
+
+
+class TimestampedDatabaseModel(CommonTableAttributes, UUIDPrimaryKey, AuditColumns, DeclarativeBase):
+    """Base for declarative models with UUID primary keys and audit columns."""
+
+    registry = orm_registry
 
 
 @declarative_mixin
@@ -26,6 +71,15 @@ class SlugKey:
     slug: Mapped[str] = mapped_column(String(length=100), index=True, nullable=False, unique=True, sort_order=-9)
 
 
+def unique_slug(prefix: str) -> ColumnElement[str]:
+    """SQL expression of `prefix` followed by the next value of `slug_suffix_seq` in hex, e.g. `"proj-S1-1000a"`.
+
+    Assigned to the slug of a new instance, it is evaluated by the `INSERT` itself, so allocating the slug takes no
+    extra query and concurrent inserts can't be given the same one.
+    """
+    return literal(prefix, String) + func.to_hex(slug_suffix_sequence.next_value())
+
+
 def model_from_dict(model: ModelT, **kwargs: Any) -> ModelT:
     """Return ORM Object from Dictionary."""
     data = {}
@@ -34,3 +88,17 @@ def model_from_dict(model: ModelT, **kwargs: Any) -> ModelT:
         if column_val is not None:
             data.update({column.name: column_val})
     return model(**data)  # type: ignore
+
+
+def column_python_type(column_type: TypeEngine[Any]) -> type | None:
+    """Return the python type of values of a column type.
+
+    Type decorators, such as `DateTimeUTC`, don't always implement `python_type`, so it is taken from the
+    underlying implementation type.  `None` when it is not known.
+    """
+    try:
+        return column_type.python_type
+    except NotImplementedError:
+        if isinstance(column_type, TypeDecorator):
+            return column_python_type(column_type.impl_instance)
+        return None
@@ -4,18 +4,23 @@ from __future__ import annotations
 from datetime import datetime
 from typing import TYPE_CHECKING, Literal
 
-from litestar.contrib.repository.filters import (
+from litestar.di import Provide
+from litestar.exceptions import ValidationException
+from litestar.params import Dependency, Parameter
+
+from app.lib import constants
+from app.lib.filters import (
+    ArrayFilter,
     BeforeAfter,
     CollectionFilter,
     FilterTypes,
+    InvalidCursorError,
+    LimitCursor,
     LimitOffset,
     OrderBy,
     SearchFilter,
+    decode_cursor,
 )
-from litestar.di import Provide
-from litestar.params import Dependency, Parameter
-
-from app.lib import constants
 
 if TYPE_CHECKING:
     from uuid import UUID
@@ -23,14 +28,19 @@ if TYPE_CHECKING:
 __all__ = [
     "create_collection_dependencies",
     "provide_created_filter",
+    "provide_cursor_filter_dependencies",
+    "provide_cursor_pagination",
     "provide_filter_dependencies",
     "provide_id_filter",
+    "provide_label_filter",
     "provide_limit_offset_pagination",
     "provide_updated_filter",
     "provide_search_filter",
     "provide_order_by",
+    "ArrayFilter",
     "BeforeAfter",
     "CollectionFilter",
+    "LimitCursor",
     "LimitOffset",
     "OrderBy",
     "SearchFilter",
@@ -41,12 +51,15 @@ DTorNone = datetime | None
 StringOrNone = str | None
 """Aggregate type alias of the types supported for collection filtering."""
 FILTERS_DEPENDENCY_KEY = "filters"
+CURSOR_FILTERS_DEPENDENCY_KEY = "cursor_filters"
 CREATED_FILTER_DEPENDENCY_KEY = "created_filter"
 ID_FILTER_DEPENDENCY_KEY = "id_filter"
 LIMIT_OFFSET_DEPENDENCY_KEY = "limit_offset"
+LIMIT_CURSOR_DEPENDENCY_KEY = "limit_cursor"
 UPDATED_FILTER_DEPENDENCY_KEY = "updated_filter"
 ORDER_BY_DEPENDENCY_KEY = "order_by"
 SEARCH_FILTER_DEPENDENCY_KEY = "search_filter"
+LABEL_FILTER_DEPENDENCY_KEY = "label_filter"
 
 
 def provide_id_filter(
@@ -103,8 +116,31 @@ def provide_search_filter(
     return SearchFilter(field_name=field, value=search, ignore_case=ignore_case or False)
 
 
+def provide_label_filter(
+    labels: list[str] | None = Parameter(title="Labels to filter by", query="labels", default=None, required=False),
+    labels_match: Literal["all", "any"] = Parameter(
+        title="Match all or any of the labels", query="labelsMatch", default="all", required=False
+    ),
+) -> ArrayFilter:
+    """Filter on the `labels` array of the models that have one, e.g. backlogs and projects.
+
+    Not part of the common filters, as most models have no labels.  Matching all the labels uses the `@>`
+    containment operator and any of them the `&&` overlap operator, both of which are served by a GIN index.
+
+    Parameters
+    ----------
+    labels : list[str]
+        Labels to match, the filter is not applied if empty.
+    labels_match : str
+        Match the rows with all ('all') or any ('any') of the labels.
+    """
+    return ArrayFilter(
+        field_name="labels", values=labels or [], operator="contains" if labels_match == "all" else "overlaps"
+    )
+
+
 def provide_order_by(
-    field_name: str = Parameter(title="Order by field", query="orderBy", default=None, required=False),
+    field_name: StringOrNone = Parameter(title="Order by field", query="orderBy", default=None, required=False),
     sort_order: Literal["asc", "desc"] = Parameter(
         title="Field to search", query="sortOrder", default="desc", required=False
     ),
@@ -115,12 +151,12 @@ def provide_order_by(
 
     Parameters
     ----------
-    field_name : str
-        Field name to order by.
+    field_name : str | None
+        Field name to order by.  `None` when no ordering was requested.
     sort_order : str
         Order field ascending ('asc') or descending ('desc)
     """
-    return OrderBy(field_name=field_name, sort_order=sort_order)
+    return OrderBy(field_name=field_name, sort_order=sort_order)  # type: ignore[arg-type]
 
 
 def provide_updated_filter(
@@ -164,6 +200,41 @@ def provide_limit_offset_pagination(
     return LimitOffset(page_size, page_size * (current_page - 1))
 
 
+def provide_cursor_pagination(
+    order_by: OrderBy = Dependency(skip_validation=True),
+    cursor: StringOrNone = Parameter(title="Pagination cursor", query="cursor", default=None, required=False),
+    page_size: int = Parameter(
+        query="pageSize",
+        ge=1,
+        default=constants.DEFAULT_PAGINATION_SIZE,
+        required=False,
+    ),
+) -> LimitCursor:
+    """Add keyset (cursor) pagination.
+
+    Return type consumed by `Repository._apply_filters()`.  The page is sorted on the `orderBy` column, or on
+    `created_at` when no ordering was requested, with the identifier as tie-breaker.
+
+    Parameters
+    ----------
+    order_by : OrderBy
+        The active ordering of the collection.
+    cursor : str | None
+        Opaque `nextCursor` value of the previous page.  Omit to fetch the first page.
+    page_size : int
+        LIMIT to apply to select.
+    """
+    after = None
+    if cursor:
+        try:
+            after = decode_cursor(cursor)
+        except InvalidCursorError as exc:
+            raise ValidationException(detail="Invalid pagination cursor") from exc
+    if not order_by.field_name:
+        return LimitCursor(limit=page_size, after=after)
+    return LimitCursor(limit=page_size, field_name=order_by.field_name, sort_order=order_by.sort_order, after=after)
+
+
 def provide_filter_dependencies(
     created_filter: BeforeAfter = Dependency(skip_validation=True),
     updated_filter: BeforeAfter = Dependency(skip_validation=True),
@@ -211,6 +282,29 @@ def provide_filter_dependencies(
     return filters
 
 
+def provide_cursor_filter_dependencies(
+    created_filter: BeforeAfter = Dependency(skip_validation=True),
+    updated_filter: BeforeAfter = Dependency(skip_validation=True),
+    id_filter: CollectionFilter = Dependency(skip_validation=True),
+    limit_cursor: LimitCursor = Dependency(skip_validation=True),
+    search_filter: SearchFilter = Dependency(skip_validation=True),
+) -> list[FilterTypes]:
+    """Provide common collection route filtering dependencies for cursor paginated routes.
+
+    Same as `provide_filter_dependencies`, with `LimitCursor` in place of `LimitOffset`.  Ordering is part of
+    the cursor, so no separate `OrderBy` is included.
+
+    Returns:
+    -------
+    list[FilterTypes]
+        List of filters parsed from connection.
+    """
+    filters: list[FilterTypes] = [created_filter, id_filter, limit_cursor, updated_filter]
+    if search_filter.field_name is not None and search_filter.value is not None:
+        filters.append(search_filter)
+    return filters
+
+
 def create_collection_dependencies() -> dict[str, Provide]:
     """Create ORM dependencies.
 
@@ -222,10 +316,13 @@ def create_collection_dependencies() -> dict[str, Provide]:
     """
     return {
         LIMIT_OFFSET_DEPENDENCY_KEY: Provide(provide_limit_offset_pagination, sync_to_thread=False),
+        LIMIT_CURSOR_DEPENDENCY_KEY: Provide(provide_cursor_pagination, sync_to_thread=False),
         UPDATED_FILTER_DEPENDENCY_KEY: Provide(provide_updated_filter, sync_to_thread=False),
         CREATED_FILTER_DEPENDENCY_KEY: Provide(provide_created_filter, sync_to_thread=False),
         ID_FILTER_DEPENDENCY_KEY: Provide(provide_id_filter, sync_to_thread=False),
         SEARCH_FILTER_DEPENDENCY_KEY: Provide(provide_search_filter, sync_to_thread=False),
+        LABEL_FILTER_DEPENDENCY_KEY: Provide(provide_label_filter, sync_to_thread=False),
         ORDER_BY_DEPENDENCY_KEY: Provide(provide_order_by, sync_to_thread=False),
         FILTERS_DEPENDENCY_KEY: Provide(provide_filter_dependencies, sync_to_thread=False),
+        CURSOR_FILTERS_DEPENDENCY_KEY: Provide(provide_cursor_filter_dependencies, sync_to_thread=False),
     }
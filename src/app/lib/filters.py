@@ -0,0 +1,99 @@
+"""Collection filter datastructures.
+
+Extends the filters shipped with `litestar.contrib.repository` with the
+application specific ones understood by
+[`SQLAlchemyAsyncRepository`][app.lib.repository.SQLAlchemyAsyncRepository].
+"""
+from __future__ import annotations
+
+import base64
+import binascii
+from dataclasses import dataclass
+from typing import Any, Literal, TypeAlias
+
+import msgspec
+from litestar.contrib.repository.filters import BeforeAfter, CollectionFilter, LimitOffset, OrderBy, SearchFilter
+
+from app.lib import serialization
+
+__all__ = [
+    "ArrayFilter",
+    "BeforeAfter",
+    "CollectionFilter",
+    "FilterTypes",
+    "InvalidCursorError",
+    "LimitCursor",
+    "LimitOffset",
+    "OrderBy",
+    "SearchFilter",
+    "decode_cursor",
+    "encode_cursor",
+]
+
+
+@dataclass
+class LimitCursor:
+    """Data required to add keyset (cursor) pagination to a query."""
+
+    limit: int
+    """Value for ``LIMIT`` clause of query."""
+    field_name: str = "created_at"
+    """Name of the model attribute to sort and seek on.  The identifier is always used as a tie-breaker."""
+    sort_order: Literal["asc", "desc"] = "desc"
+    """Sort ascending or descending."""
+    after: tuple[Any, Any] | None = None
+    """Decoded `(field value, id)` of the last row of the previous page.  `None` for the first page."""
+
+
+@dataclass
+class ArrayFilter:
+    """Data required to filter on the elements of an array column, e.g. the labels of backlogs."""
+
+    field_name: str
+    """Name of the model attribute to filter on."""
+    values: list[Any]
+    """Values to match.  The filter is not applied if empty."""
+    operator: Literal["contains", "overlaps"] = "contains"
+    """Match the rows whose array contains all the values (`@>`), or any of them (`&&`)."""
+
+
+FilterTypes: TypeAlias = (
+    BeforeAfter | CollectionFilter[Any] | LimitOffset | OrderBy | SearchFilter | LimitCursor | ArrayFilter
+)
+"""Aggregate type alias of the types supported for collection filtering."""
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a cursor token can't be decoded."""
+
+
+def encode_cursor(value: Any, item_id: Any) -> str:
+    """Encode the keyset of a row into an opaque, URL safe token.
+
+    Args:
+        value: Value of the sort column of the row.
+        item_id: Identifier of the row.
+
+    Returns:
+        str: The cursor token.
+    """
+    return base64.urlsafe_b64encode(serialization.to_json([value, item_id])).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[Any, Any]:
+    """Decode a token created by `encode_cursor`.
+
+    Args:
+        cursor: The cursor token.
+
+    Raises:
+        InvalidCursorError: The token is malformed.
+
+    Returns:
+        tuple[Any, Any]: JSON decoded `(value, id)` pair.
+    """
+    try:
+        value, item_id = serialization.from_json(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (binascii.Error, msgspec.DecodeError, TypeError, ValueError) as exc:
+        raise InvalidCursorError(cursor) from exc
+    return value, item_id
@@ -0,0 +1,128 @@
+"""Shared HTTP client of the outbound integrations, e.g. the Zulip plugin."""
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+from app.lib import log, settings
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable
+
+__all__ = ["HostLimitedTransport", "create_client", "get_client", "on_shutdown", "on_startup", "provide_http_client"]
+
+logger = log.get_logger()
+
+_client: httpx.AsyncClient | None = None
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """Response body that releases the slot of its request once closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, release: Callable[[], None]) -> None:
+        self.stream = stream
+        self.release = release
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self.stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self.stream.aclose()
+        finally:
+            self.release()
+
+
+class HostLimitedTransport(httpx.AsyncBaseTransport):
+    """Transport limiting the number of concurrent requests to each host.
+
+    A request holds its slot until its response is closed, and waits for one up to its pool timeout.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, max_requests_per_host: int) -> None:
+        self.transport = transport
+        self.slots: defaultdict[str, asyncio.Semaphore] = defaultdict(lambda: asyncio.Semaphore(max_requests_per_host))
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        slot = self.slots[request.url.host]
+        try:
+            await asyncio.wait_for(slot.acquire(), timeout=request.extensions.get("timeout", {}).get("pool"))
+        except asyncio.TimeoutError as e:
+            raise httpx.PoolTimeout(f"no slot for {request.url.host} available", request=request) from e
+        try:
+            response = await self.transport.handle_async_request(request)
+        except BaseException:
+            slot.release()
+            raise
+        if response.is_closed:
+            # the body was read by the transport already
+            slot.release()
+        else:
+            response.stream = _ReleasingStream(response.stream, slot.release)  # type: ignore[arg-type]
+        return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+def create_client(**kwargs: Any) -> httpx.AsyncClient:
+    """Create a client configured by [`HTTPClientSettings`][app.lib.settings.HTTPClientSettings].
+
+    HTTP/2 is only negotiated if `h2` is installed.
+
+    Args:
+        **kwargs: Passed through to `httpx.AsyncClient()`.
+
+    Returns:
+        The client.
+    """
+    http2 = settings.http_client.HTTP2 and importlib.util.find_spec("h2") is not None
+    transport = httpx.AsyncHTTPTransport(
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=settings.http_client.MAX_CONNECTIONS,
+            max_keepalive_connections=settings.http_client.MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.http_client.KEEPALIVE_EXPIRY,
+        ),
+    )
+    return httpx.AsyncClient(
+        transport=HostLimitedTransport(transport, settings.http_client.MAX_CONNECTIONS_PER_HOST),
+        timeout=httpx.Timeout(settings.http_client.TIMEOUT, connect=settings.http_client.CONNECT_TIMEOUT),
+        **kwargs,
+    )
+
+
+def get_client() -> httpx.AsyncClient:
+    """Get the shared client, created on first use if it isn't started yet.
+
+    Its connections are kept alive, so that e.g. consecutive messages to the same service reuse them.
+    """
+    global _client  # noqa: PLW0603
+    if _client is None or _client.is_closed:
+        _client = create_client()
+    return _client
+
+
+def provide_http_client() -> httpx.AsyncClient:
+    """Provide the shared client, e.g. to the plugins."""
+    return get_client()
+
+
+async def on_startup() -> None:
+    """Start the shared client, on app or worker startup."""
+    if settings.http_client.HTTP2 and importlib.util.find_spec("h2") is None:
+        await logger.awarning("HTTP/2 is enabled, but `h2` isn't installed, falling back to HTTP/1.1.")
+    get_client()
+
+
+async def on_shutdown() -> None:
+    """Close the connections of the shared client, on app or worker shutdown."""
+    global _client  # noqa: PLW0603
+    if _client is not None:
+        client, _client = _client, None
+        await client.aclose()
@@ -1,15 +1,30 @@
+import asyncio
+import time
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
 from uuid import UUID
 
+from app.lib import log, settings
+
 if TYPE_CHECKING:
+    from httpx import AsyncClient
+    from sqlalchemy.ext.asyncio import AsyncSession
+
     from app.domain.backlogs.models import Backlog
     from app.domain.projects.models import Project
 
-__all__ = ["BacklogPlugin", "ProjectPlugin"]
+__all__ = ["BacklogPlugin", "PluginDispatcher", "ProjectPlugin"]
+
+logger = log.get_logger()
 
 
 class BacklogPlugin(ABC):
+    db_session: "AsyncSession"
+    """Session of the request, to make changes in the transaction of the backlog change, e.g. add outbox messages."""
+    http_client: "AsyncClient"
+    """Shared HTTP client, to call other services."""
+
     @abstractmethod
     async def before_create(self, data: "Backlog | dict[str, Any]") -> "Backlog | dict[str, Any]":
         return data
@@ -36,6 +51,11 @@ class BacklogPlugin(ABC):
 
 
 class ProjectPlugin(ABC):
+    db_session: "AsyncSession"
+    """Session of the request, to make changes in the transaction of the project change, e.g. add outbox messages."""
+    http_client: "AsyncClient"
+    """Shared HTTP client, to call other services."""
+
     @abstractmethod
     async def before_create(self, data: "Project | dict[str, Any]") -> "Project | dict[str, Any]":
         return data
@@ -59,3 +79,97 @@ class ProjectPlugin(ABC):
     @abstractmethod
     async def after_delete(self, data: "Project") -> "Project":
         return data
+
+
+PluginT = TypeVar("PluginT", BacklogPlugin, ProjectPlugin)
+
+
+class PluginDispatcher(Generic[PluginT]):
+    """Run the hooks of the plugins registered to a service.
+
+    The before hooks run one after the other, as each gets the data returned by the previous one, and their errors
+    abort the change.  The after hooks are independent, so they run concurrently, and their errors are logged
+    instead, as the change is made already.  Each hook is cancelled after `API_PLUGIN_TIMEOUT` seconds, and its
+    latency is logged.
+    """
+
+    def __init__(self, plugins: Iterable[PluginT] = (), timeout: float | None = None) -> None:
+        self.plugins: list[PluginT] = list(plugins)
+        self.timeout = settings.api.PLUGIN_TIMEOUT if timeout is None else timeout
+
+    def __iter__(self) -> Iterator[PluginT]:
+        return iter(self.plugins)
+
+    async def _call(self, plugin: PluginT, hook: str, **kwargs: Any) -> tuple[Any, dict[str, Any] | None]:
+        """Run the `hook` of `plugin`, and return its result along with a copy of the `plugin_meta` of the result."""
+
+        async def call() -> tuple[Any, dict[str, Any] | None]:
+            result = await getattr(plugin, hook)(**kwargs)
+            # read off `plugin_meta` before yielding, as the concurrent hooks may replace it on the same object
+            meta = getattr(result, "plugin_meta", None)
+            return result, dict(meta) if isinstance(meta, dict) else None
+
+        start = time.perf_counter()
+        try:
+            return await asyncio.wait_for(call(), timeout=self.timeout)
+        finally:
+            await logger.adebug(
+                "plugin hook",
+                plugin=type(plugin).__name__,
+                hook=hook,
+                duration_ms=round((time.perf_counter() - start) * 1000, 3),
+            )
+
+    async def before_create(self, data: Any) -> Any:
+        for plugin in self.plugins:
+            data, _ = await self._call(plugin, "before_create", data=data)
+        return data
+
+    async def before_update(self, item_id: Any, data: Any) -> Any:
+        for plugin in self.plugins:
+            data, _ = await self._call(plugin, "before_update", item_id=item_id, data=data)
+        return data
+
+    async def before_delete(self, item_id: Any) -> None:
+        for plugin in self.plugins:
+            await self._call(plugin, "before_delete", item_id=item_id)
+
+    async def after_create(self, obj: Any) -> bool:
+        """Run the `after_create` hooks, see `_run_after`."""
+        return await self._run_after("after_create", obj)
+
+    async def after_update(self, obj: Any) -> bool:
+        """Run the `after_update` hooks, see `_run_after`."""
+        return await self._run_after("after_update", obj)
+
+    async def after_delete(self, obj: Any) -> None:
+        await self._run_after("after_delete", obj)
+
+    async def _run_after(self, hook: str, obj: Any) -> bool:
+        """Run the `hook` of each plugin concurrently, and merge the keys they set in the `plugin_meta` of `obj`.
+
+        The keys each plugin changed are read off the `plugin_meta` it returns once its hook is done, so that a plugin
+        replacing `plugin_meta` doesn't drop the keys set by the others, and their merge is set back on `obj` for the
+        service to write once.
+
+        Returns:
+            Whether the plugins changed `plugin_meta`.
+        """
+        # a copy, as the plugins may update `plugin_meta` in place
+        original = dict(obj.plugin_meta) if isinstance(obj.plugin_meta, dict) else {}
+        changes: dict[str, Any] = {}
+
+        async def run(plugin: PluginT) -> None:
+            _, meta = await self._call(plugin, hook, data=obj)
+            if meta is not None:
+                changes.update({key: value for key, value in meta.items() if original.get(key, ...) != value})
+
+        results = await asyncio.gather(*(run(plugin) for plugin in self.plugins), return_exceptions=True)
+        for plugin, result in zip(self.plugins, results, strict=True):
+            if isinstance(result, Exception):
+                await logger.aerror(
+                    "plugin hook failed", plugin=type(plugin).__name__, hook=hook, slug=obj.slug, error=repr(result)
+                )
+        if changes:
+            obj.plugin_meta = {**original, **changes}
+        return bool(changes)
@@ -1,17 +1,57 @@
 from __future__ import annotations
 
-import random
-import string
-from typing import TYPE_CHECKING, Any
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any, cast
 
+import msgspec
+from litestar.contrib.repository import RepositoryError
 from litestar.contrib.repository.handlers import on_app_init as _on_app_init
-from litestar.contrib.sqlalchemy.repository import ModelT, SQLAlchemyAsyncRepository
+from litestar.contrib.sqlalchemy.repository import ModelT
+from litestar.contrib.sqlalchemy.repository import SQLAlchemyAsyncRepository as _SQLAlchemyAsyncRepository
+from litestar.contrib.sqlalchemy.repository._util import wrap_sqlalchemy_exception
+from litestar.exceptions import ValidationException
+from sqlalchemy import (
+    Boolean,
+    PrimaryKeyConstraint,
+    UniqueConstraint,
+    func,
+    insert,
+    inspect,
+    literal,
+    literal_column,
+    or_,
+    over,
+    select,
+    tuple_,
+)
+from sqlalchemy.dialects import postgresql
 
+from app.lib.constants import DEFAULT_INSERT_BATCH_SIZE
+from app.lib.db.orm import AuditColumns, column_python_type, slug_suffix_sequence, unique_slug
+from app.lib.filters import ArrayFilter, LimitCursor, LimitOffset
 from app.utils import slugify
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
     from litestar.config.app import AppConfig
-__all__ = ["SQLAlchemyAsyncRepository", "SQLAlchemyAsyncSlugRepository", "on_app_init"]
+    from litestar.contrib.repository.filters import FilterTypes as BaseFilterTypes
+    from litestar.contrib.sqlalchemy.repository.types import SelectT
+    from sqlalchemy import ColumnElement, Select
+    from sqlalchemy.dialects.postgresql import Insert
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.orm import InstrumentedAttribute
+
+    from app.lib.filters import FilterTypes
+__all__ = [
+    "SQLAlchemyAsyncRepository",
+    "SQLAlchemyAsyncSlugRepository",
+    "StatementCache",
+    "StatementCacheInfo",
+    "on_app_init",
+    "statement_cache",
+]
 
 
 def on_app_init(app_config: "AppConfig") -> "AppConfig":
@@ -25,6 +65,414 @@ def on_app_init(app_config: "AppConfig") -> "AppConfig":
     return _on_app_init(app_config)
 
 
+@dataclass
+class StatementCacheInfo:
+    """Usage counters of a [`StatementCache`][app.lib.repository.StatementCache]."""
+
+    hits: int
+    misses: int
+    size: int
+
+
+class StatementCache:
+    """Memoizes the base `Select` statements of repositories and services.
+
+    `Select` objects are immutable, so a single instance can be shared by every request instead of rebuilding the
+    statement and its loader options each time.  SQLAlchemy memoizes the cache key of a statement on the instance,
+    and the compiled SQL is looked up by that key, so sharing the instance skips both the construction and the cache
+    key generation on the way to the compiled cache.
+    """
+
+    def __init__(self) -> None:
+        self._statements: dict[Hashable, Select] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, builder: Callable[[], Select]) -> Select:
+        """Get the statement stored for `key`, building it on first use.
+
+        Args:
+            key: Identifies the statement, e.g. the owning class and a profile name.
+            builder: Called without arguments to build the statement on a cache miss.
+
+        Returns:
+            The memoized statement.
+        """
+        statement = self._statements.get(key)
+        if statement is None:
+            self.misses += 1
+            statement = self._statements[key] = builder()
+        else:
+            self.hits += 1
+        return statement
+
+    def cache_info(self) -> StatementCacheInfo:
+        """Report the hit and miss counters."""
+        return StatementCacheInfo(hits=self.hits, misses=self.misses, size=len(self._statements))
+
+    def clear(self) -> None:
+        """Drop the memoized statements and reset the counters."""
+        self._statements.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+statement_cache = StatementCache()
+"""Process wide statement cache."""
+
+
+class SQLAlchemyAsyncRepository(_SQLAlchemyAsyncRepository[ModelT]):
+    """Extends the repository with single round trip collection counts, bulk inserts and upserts."""
+
+    def __init__(self, *, statement: Select[tuple[ModelT]] | None = None, session: AsyncSession, **kwargs: Any) -> None:
+        """Repository pattern for SQLAlchemy models.
+
+        Args:
+            statement: To facilitate customization of the underlying select query.  Defaults to the memoized
+                `select(model_type)`.
+            session: Session managing the unit-of-work for the operation.
+            **kwargs: Additional arguments.
+        """
+        if statement is None:
+            statement = statement_cache.get((type(self), "default"), lambda: select(self.model_type))
+        super().__init__(statement=statement, session=session, **kwargs)
+
+    async def insert_many(
+        self,
+        data: list[dict[str, Any]],
+        *,
+        batch_size: int = DEFAULT_INSERT_BATCH_SIZE,
+        return_models: bool = True,
+    ) -> list[Any]:
+        """Insert rows with multi-row `INSERT ... RETURNING` statements, bypassing the unit of work.
+
+        Rows are sent in chunks of `batch_size`, each chunk being a single statement.
+
+        Args:
+            data: Column values of the rows to insert, keyed by model attribute name.
+            batch_size: Maximum number of rows per statement.
+            return_models: Return the inserted instances.  When `False`, only the identifiers are returned and no
+                instances are built.
+
+        Raises:
+            RepositoryError: `batch_size` is not positive.
+
+        Returns:
+            The inserted instances, or their identifiers, in the order of `data`.
+        """
+        if batch_size < 1:
+            raise RepositoryError("Batch size must be positive")
+        returning = self.model_type if return_models else getattr(self.model_type, self.id_attribute)
+        statement = (
+            insert(self.model_type)
+            .returning(returning, sort_by_parameter_order=True)
+            .execution_options(insertmanyvalues_page_size=batch_size)
+        )
+        results: list[Any] = []
+        with wrap_sqlalchemy_exception():
+            for start in range(0, len(data), batch_size):
+                result = await self.session.execute(statement, data[start : start + batch_size])
+                batch = list(result.scalars())
+                if return_models:
+                    for instance in batch:
+                        self.session.expunge(instance)
+                results.extend(batch)
+        return results
+
+    async def upsert_many(
+        self,
+        data: list[dict[str, Any]],
+        match_fields: list[str] | str | None = None,
+        *,
+        batch_size: int = DEFAULT_INSERT_BATCH_SIZE,
+        return_models: bool = True,
+    ) -> list[Any]:
+        """Create or update rows with `INSERT ... ON CONFLICT (match_fields) DO UPDATE ... RETURNING` statements.
+
+        Rows with the same `match_fields` values are collapsed, the last one wins, as a statement can't update a row
+        twice.  Existing rows are updated with
+        the other supplied values.  When `match_fields` is not backed by a unique constraint, or the database is not
+        PostgreSQL, each row goes through `get_or_create` instead.
+
+        Args:
+            data: Column values of the rows, keyed by model attribute name.
+            match_fields: Attributes identifying an existing row.  Defaults to `match_fields` of the repository.
+            batch_size: Maximum number of rows per statement.
+            return_models: Return the instances.  When `False`, only the identifiers are returned.
+
+        Raises:
+            RepositoryError: No `match_fields` or `batch_size` is not positive.
+
+        Returns:
+            The created or updated instances, or their identifiers, in no particular order.
+        """
+        match_fields = self._get_match_fields(match_fields)
+        if not match_fields:
+            raise RepositoryError("Upsert requires match fields")
+        if batch_size < 1:
+            raise RepositoryError("Batch size must be positive")
+        if not self._supports_on_conflict(match_fields):
+            instances = [(await self.get_or_create(match_fields, **row))[0] for row in data]
+            return instances if return_models else [self.get_id_attribute_value(instance) for instance in instances]
+        unique_rows: dict[Any, dict[str, Any]] = {}
+        for position, row in enumerate(data):
+            match_values = tuple(row.get(field) for field in match_fields)
+            # NULLs never conflict, so those rows are always inserted
+            unique_rows[position if None in match_values else match_values] = row
+        # a multi-row VALUES clause needs the same keys on every row
+        groups: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+        for row in unique_rows.values():
+            groups.setdefault(tuple(sorted(row)), []).append(row)
+        returning = self.model_type if return_models else getattr(self.model_type, self.id_attribute)
+        results: list[Any] = []
+        with wrap_sqlalchemy_exception():
+            for keys, group in groups.items():
+                for start in range(0, len(group), batch_size):
+                    statement = self._on_conflict_statement(
+                        postgresql.Insert(self.model_type).values(group[start : start + batch_size]),
+                        match_fields,
+                        [key for key in keys if key not in match_fields],
+                    )
+                    result = await self.session.execute(
+                        statement.returning(returning).execution_options(populate_existing=True)
+                    )
+                    batch = list(result.scalars())
+                    if return_models:
+                        for instance in batch:
+                            self.session.expunge(instance)
+                    results.extend(batch)
+        return results
+
+    async def get_or_create(
+        self,
+        match_fields: list[str] | str | None = None,
+        upsert: bool = True,
+        **kwargs: Any,
+    ) -> tuple[ModelT, bool]:
+        """Get instance identified by `match_fields` or create it, with a single statement.
+
+        Compiles to `INSERT ... ON CONFLICT (match_fields) DO UPDATE ... RETURNING`.  When `match_fields` is not
+        backed by a unique constraint, or the database is not PostgreSQL, the select then insert implementation of
+        the base repository is used.
+
+        Args:
+            match_fields: Attributes identifying an existing row.  Defaults to `match_fields` of the repository.
+            upsert: Update an existing row with the other values in `kwargs`.
+            **kwargs: Column values of the instance.
+
+        Returns:
+            The instance and whether it was created.
+        """
+        match_fields = self._get_match_fields(match_fields)
+        if (
+            not match_fields
+            or any(kwargs.get(field) is None for field in match_fields)
+            or not self._supports_on_conflict(match_fields)
+        ):
+            return await super().get_or_create(match_fields, upsert, **kwargs)
+        update_fields = [key for key in kwargs if key not in match_fields] if upsert else []
+        statement = self._on_conflict_statement(
+            postgresql.Insert(self.model_type).values(**kwargs), match_fields, update_fields
+        )
+        # `xmax` is only set on row versions written by an update
+        returning_statement = statement.returning(
+            self.model_type, literal_column("xmax = 0", Boolean)
+        ).execution_options(populate_existing=True)
+        with wrap_sqlalchemy_exception():
+            instance, created = (await self.session.execute(returning_statement)).one()
+            self.session.expunge(instance)
+        return instance, created
+
+    def _get_match_fields(self, match_fields: list[str] | str | None) -> list[str]:
+        match_fields = match_fields if match_fields else self.match_fields
+        if isinstance(match_fields, str):
+            return [match_fields]
+        return list(match_fields or [])
+
+    def _supports_on_conflict(self, match_fields: list[str]) -> bool:
+        """Whether `match_fields` can be used as the conflict target of an `INSERT ... ON CONFLICT`."""
+        if self._dialect.name != "postgresql":
+            return False
+        mapper = inspect(self.model_type)
+        assert mapper is not None  # noqa: S101
+        if any(field not in mapper.column_attrs for field in match_fields):
+            return False
+        columns = {mapper.column_attrs[field].columns[0] for field in match_fields}
+        table = mapper.local_table
+        return any(
+            set(constraint.columns) == columns
+            for constraint in table.constraints
+            if isinstance(constraint, PrimaryKeyConstraint | UniqueConstraint)
+        ) or any(set(index.columns) == columns for index in table.indexes if index.unique)
+
+    def _on_conflict_statement(self, statement: Insert, match_fields: list[str], update_fields: list[str]) -> Insert:
+        """Add the `ON CONFLICT DO UPDATE` clause.
+
+        Without values to update, the match fields are set to themselves so that `RETURNING` includes existing rows.
+        """
+        mapper = inspect(self.model_type)
+        assert mapper is not None  # noqa: S101
+        primary_keys = {column.key for column in mapper.primary_key}
+        update_fields = [field for field in update_fields if field not in primary_keys and field != "created_at"]
+        set_: dict[str, Any] = {field: statement.excluded[field] for field in update_fields or match_fields}
+        if update_fields and AuditColumns in self.model_type.__mro__:
+            set_["updated_at"] = datetime.now(UTC)
+        return statement.on_conflict_do_update(index_elements=match_fields, set_=set_)
+
+    async def list_and_count(
+        self,
+        *filters: FilterTypes,
+        force_basic_query_mode: bool | None = None,
+        **kwargs: Any,
+    ) -> tuple[list[ModelT], int]:
+        """List records with total count.
+
+        By default, the rows and the total are fetched with one statement using `count(*) OVER ()`.
+
+        Args:
+            *filters: Types for specific filtering operations.
+            force_basic_query_mode: Issue a separate `count` and `list` statement instead of the window function.
+            **kwargs: Instance attribute value filters.
+
+        Returns:
+            List of instances and count of total collection, ignoring pagination.
+        """
+        if force_basic_query_mode or self._dialect.name in {"spanner", "spanner+spanner"}:
+            count = await self.count(*filters, **kwargs)
+            return await self.list(*filters, **kwargs), count
+        return await self._list_and_count_window(*filters, **kwargs)
+
+    async def _list_and_count_window(
+        self,
+        *filters: FilterTypes,
+        **kwargs: Any,
+    ) -> tuple[list[ModelT], int]:
+        """List records with the total count attached to each row by an analytical window function.
+
+        A page past the end of the collection returns no rows, and with them no total, so only in that case
+        the count is fetched with a second statement.
+
+        Args:
+            *filters: Types for specific filtering operations.
+            **kwargs: Instance attribute value filters.
+
+        Returns:
+            List of instances and count of total collection, ignoring pagination.
+        """
+        statement = kwargs.pop("statement", self.statement)
+        windowed = statement.add_columns(over(func.count()).label("total_count"))
+        windowed = self._apply_filters(*filters, statement=windowed)
+        windowed = self._filter_select_by_kwargs(windowed, **kwargs)
+        count = 0
+        instances: list[ModelT] = []
+        with wrap_sqlalchemy_exception():
+            result = await self._execute(windowed)
+            for instance, count_value in result:
+                self.session.expunge(instance)
+                instances.append(instance)
+                count = count_value
+        if not instances and any(isinstance(f, LimitOffset) and f.offset > 0 for f in filters):
+            count = await self.count(*filters, statement=statement, **kwargs)
+        return instances, count
+
+    def _apply_filters(self, *filters: FilterTypes, apply_pagination: bool = True, statement: SelectT) -> SelectT:
+        """Apply filters to a select statement.
+
+        Handles the application specific filters and passes the rest on to the base implementation.
+
+        Args:
+            *filters: filter types to apply to the query
+            apply_pagination: applies pagination filters if true
+            statement: select statement to apply filters
+
+        Returns:
+            The select with filters applied.
+        """
+        standard_filters = []
+        for filter_ in filters:
+            if isinstance(filter_, LimitCursor):
+                if apply_pagination:
+                    statement = self._apply_limit_cursor_pagination(filter_, statement=statement)
+            elif isinstance(filter_, ArrayFilter):
+                statement = self._filter_on_array_field(filter_, statement=statement)
+            else:
+                standard_filters.append(filter_)
+        return super()._apply_filters(*standard_filters, apply_pagination=apply_pagination, statement=statement)
+
+    def _filter_on_array_field(self, array_filter: ArrayFilter, statement: SelectT) -> SelectT:
+        if not array_filter.values:
+            return statement
+        field = getattr(self.model_type, array_filter.field_name)
+        operator = "@>" if array_filter.operator == "contains" else "&&"
+        return statement.where(field.bool_op(operator)(literal(array_filter.values, field.type)))
+
+    def _apply_limit_cursor_pagination(self, limit_cursor: LimitCursor, statement: SelectT) -> SelectT:
+        """Seek past the last row of the previous page instead of scanning an OFFSET.
+
+        The page is ordered on `(field, id)`, replacing any ordering of the base statement, so that the row value
+        comparison can be satisfied by an index on the sort column.  The rows with a `NULL` sort value, which no
+        comparison matches, are sorted last and paged through on the id alone.
+        """
+        field = getattr(self.model_type, limit_cursor.field_name)
+        id_field = getattr(self.model_type, self.id_attribute)
+        nullable = getattr(field.expression, "nullable", True)
+        sort_desc = limit_cursor.sort_order == "desc"
+        if limit_cursor.after is not None:
+            value, item_id = limit_cursor.after
+            item_id = self._coerce_cursor_value(id_field, item_id)
+            if value is None:
+                statement = statement.where(field.is_(None), id_field < item_id if sort_desc else id_field > item_id)
+            else:
+                keyset = tuple_(field, id_field)
+                after = tuple_(self._coerce_cursor_value(field, value), item_id)
+                seek = keyset < after if sort_desc else keyset > after
+                statement = statement.where(or_(seek, field.is_(None)) if nullable else seek)
+        field_order = field.desc() if sort_desc else field.asc()
+        return (
+            statement.order_by(None)
+            .order_by(
+                field_order.nulls_last() if nullable else field_order,
+                id_field.desc() if sort_desc else id_field.asc(),
+            )
+            .limit(limit_cursor.limit)
+        )
+
+    @staticmethod
+    def _coerce_cursor_value(field: InstrumentedAttribute[Any], value: Any) -> Any:
+        """Convert a JSON decoded cursor value back to the python type of the column it was taken from."""
+        python_type = column_python_type(field.type)
+        if python_type is None:
+            return value
+        try:
+            return msgspec.convert(value, python_type)
+        except msgspec.ValidationError as exc:
+            raise ValidationException(detail="Invalid pagination cursor") from exc
+
+    async def count(self, *filters: FilterTypes, **kwargs: Any) -> int:
+        """Get the count of records returned by a query.
+
+        Args:
+            *filters: Types for specific filtering operations.
+            **kwargs: Instance attribute value filters.
+
+        Returns:
+            Count of records returned by query, ignoring pagination.
+        """
+        return await super().count(*cast("tuple[BaseFilterTypes, ...]", filters), **kwargs)
+
+    async def list(self, *filters: FilterTypes, **kwargs: Any) -> list[ModelT]:
+        """Get a list of instances, optionally filtered.
+
+        Args:
+            *filters: Types for specific filtering operations.
+            **kwargs: Instance attribute value filters.
+
+        Returns:
+            The list of instances, after filtering applied.
+        """
+        return await super().list(*cast("tuple[BaseFilterTypes, ...]", filters), **kwargs)
+
+
 class SQLAlchemyAsyncSlugRepository(
     SQLAlchemyAsyncRepository[ModelT],
 ):
@@ -38,31 +486,32 @@ class SQLAlchemyAsyncSlugRepository(
         """Select record by slug value."""
         return await self.get_one_or_none(slug=slug)
 
-    async def get_available_slug(
+    def get_available_slug(
         self,
         value_to_slugify: str,
         **kwargs: Any,
-    ) -> str:
+    ) -> ColumnElement[str]:
         """Get a unique slug for the supplied value.
 
-        If the value is found to exist, a random 4 digit character is appended to the end.  There may be a better way to do this, but I wanted to limit the number of additional database calls.
+        The slug is a SQL expression, evaluated by the `INSERT` of the new instance, so that no extra query is needed.
+        A suffix from [`unique_slug`][app.lib.db.orm.unique_slug] is always appended, e.g. `"my-team-1000a"`, as
+        checking whether the slugified value is taken would race with concurrent inserts of the same value.
 
         Args:
             value_to_slugify (str): A string that should be converted to a unique slug.
             **kwargs: stuff
 
         Returns:
-            str: a unique slug for the supplied value.  This is safe for URLs and other unique identifiers.
+            A unique slug for the supplied value.  This is safe for URLs and other unique identifiers.
         """
-        slug = slugify(value_to_slugify)
-        if await self._is_slug_unique(slug):
-            return slug
-        random_string = "".join(random.choices(string.ascii_lowercase + string.digits, k=4))  # noqa: S311
-        return f"{slug}-{random_string}"
+        return unique_slug(f"{slugify(value_to_slugify)}-")
 
-    async def _is_slug_unique(
-        self,
-        slug: str,
-        **kwargs: Any,
-    ) -> bool:
-        return await self.get_one_or_none(slug=slug) is None
+    async def get_slug_suffixes(self, count: int) -> list[str]:
+        """Allocate `count` suffixes from [`slug_suffix_sequence`][app.lib.db.orm.slug_suffix_sequence] at once.
+
+        Used to make the slugs of rows inserted in bulk unique, as the `unique_slug` expression can't be sent as
+        a parameter of an `executemany`.
+        """
+        statement = select(func.to_hex(slug_suffix_sequence.next_value())).select_from(func.generate_series(1, count))
+        with wrap_sqlalchemy_exception():
+            return list(await self.session.scalars(statement))
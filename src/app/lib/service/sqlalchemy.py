@@ -7,29 +7,34 @@ should be a SQLAlchemy model.
 from __future__ import annotations
 
 import contextlib
+import functools
 from collections.abc import Sequence
-from typing import TYPE_CHECKING, Any, Generic, TypeAlias, TypeVar, cast, overload
-
-from litestar.contrib.repository.filters import (
-    FilterTypes,
-    LimitOffset,
-)
-from litestar.contrib.sqlalchemy.repository import ModelT, SQLAlchemyAsyncRepository
-from litestar.pagination import OffsetPagination
+from typing import TYPE_CHECKING, Any, Generic, Literal, TypeAlias, TypeVar, cast, overload
+
+import msgspec
+from litestar.contrib.sqlalchemy.repository import ModelT
+from litestar.exceptions import ValidationException
+from litestar.pagination import CursorPagination, OffsetPagination
 from pydantic import parse_obj_as
+from sqlalchemy import inspect
 
+from app.lib.constants import DEFAULT_INSERT_BATCH_SIZE
 from app.lib.db import async_session_factory
-from app.lib.db.orm import model_from_dict
+from app.lib.db.orm import column_python_type, model_from_dict
+from app.lib.filters import FilterTypes, LimitCursor, LimitOffset, encode_cursor
+from app.lib.repository import statement_cache
 
 from .generic import Service
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator
+    from collections.abc import AsyncIterator, Callable
 
     from pydantic import BaseModel
     from sqlalchemy import Select
     from sqlalchemy.ext.asyncio import AsyncSession
 
+    from app.lib.repository import SQLAlchemyAsyncRepository
+
 __all__ = ["SQLAlchemyAsyncRepositoryService"]
 
 SQLAlchemyAsyncRepoServiceT = TypeVar("SQLAlchemyAsyncRepoServiceT", bound="SQLAlchemyAsyncRepositoryService")
@@ -92,6 +97,105 @@ class SQLAlchemyAsyncRepositoryService(Service[ModelT], Generic[ModelT]):
         data = [(await self.to_model(datum, "create")) for datum in data]
         return await self.repository.add_many(data)
 
+    @overload
+    async def bulk_create(
+        self,
+        data: ModelDictListT | list[ModelT],
+        *,
+        batch_size: int = ...,
+        return_models: Literal[True] = ...,
+    ) -> list[ModelT]:
+        ...
+
+    @overload
+    async def bulk_create(
+        self,
+        data: ModelDictListT | list[ModelT],
+        *,
+        batch_size: int = ...,
+        return_models: Literal[False],
+    ) -> list[Any]:
+        ...
+
+    @overload
+    async def bulk_create(
+        self,
+        data: ModelDictListT | list[ModelT],
+        *,
+        batch_size: int = ...,
+        return_models: bool = ...,
+    ) -> list[ModelT] | list[Any]:
+        ...
+
+    async def bulk_create(
+        self,
+        data: ModelDictListT | list[ModelT],
+        *,
+        batch_size: int = DEFAULT_INSERT_BATCH_SIZE,
+        return_models: bool = True,
+    ) -> list[ModelT] | list[Any]:
+        """Create many records with chunked multi-row `INSERT ... RETURNING` statements.
+
+        Unlike `create_many`, rows are not passed through `to_model` or the unit of work.  They are validated and
+        completed with the values `to_model` would set by `to_insert_values` instead.
+
+        Args:
+            data: Representations to be created.
+            batch_size: Maximum number of rows per statement.
+            return_models: Return the created instances, otherwise only their identifiers.
+
+        Returns:
+            The created instances, or their identifiers, in the order of `data`.
+        """
+        return await self.repository.insert_many(
+            await self.to_insert_values(data), batch_size=batch_size, return_models=return_models
+        )
+
+    async def to_insert_values(self, data: ModelDictListT | list[ModelT]) -> list[dict[str, Any]]:
+        """Convert representations into validated insert parameters.
+
+        Services whose `to_model` sets column values on create, such as a slug, override this to set them too.
+
+        Args:
+            data: Representations to be created.
+
+        Returns:
+            Column values for each representation, keyed by attribute name.
+        """
+        return self.to_values(data, validate=True)
+
+    def to_values(self, data: ModelDictListT | list[ModelT], validate: bool = False) -> list[dict[str, Any]]:
+        """Convert representations into insert parameters in a single pass.
+
+        Keys that are not column attributes of the model and `None` values are dropped, the same as
+        `model_from_dict`, so that column defaults apply.
+
+        Args:
+            data: Representations to be converted.
+            validate: Convert the values of the dictionaries to the python types of their columns.
+
+        Raises:
+            ValidationException: A value can't be converted to the type of its column.
+
+        Returns:
+            Column values for each representation, keyed by attribute name.
+        """
+        values_type = _values_type(self.repository.model_type)
+        column_keys = values_type.__struct_fields__
+        if validate:
+            try:
+                data = [msgspec.convert(datum, values_type) if isinstance(datum, dict) else datum for datum in data]
+            except msgspec.ValidationError as exc:
+                raise ValidationException(detail=f"Invalid {self.repository.model_type.__name__}: {exc}") from exc
+        return [
+            {
+                key: value
+                for key in column_keys
+                if (value := datum.get(key) if isinstance(datum, dict) else getattr(datum, key, None)) is not None
+            }
+            for datum in data
+        ]
+
     async def update(self, item_id: Any, data: ModelT | dict[str, Any]) -> ModelT:
         """Wrap repository update operation.
 
@@ -157,11 +261,16 @@ class SQLAlchemyAsyncRepositoryService(Service[ModelT], Generic[ModelT]):
         """
         return await self.repository.get(item_id, **kwargs)
 
-    async def get_or_create(self, match_fields: list[str] | None = None, **kwargs: Any) -> tuple[ModelT, bool]:
+    async def get_or_create(
+        self, match_fields: list[str] | None = None, upsert: bool = True, **kwargs: Any
+    ) -> tuple[ModelT, bool]:
         """Wrap repository instance creation.
 
+        When `match_fields` is backed by a unique constraint, this is a single `INSERT ... ON CONFLICT` statement.
+
         Args:
             match_fields: a list of keys to use to match the existing model.  When empty, all fields are matched.
+            upsert: Update the existing model with the other values of `kwargs`.
             **kwargs: Keyword arguments for attribute based filtering.
 
         Returns:
@@ -169,8 +278,68 @@ class SQLAlchemyAsyncRepositoryService(Service[ModelT], Generic[ModelT]):
         """
         match_fields = match_fields if match_fields else self.match_fields
         validated_model = await self.to_model(kwargs, "create")
-        # todo: submit PR with repo enhancements
-        return await self.repository.get_or_create(**validated_model.to_dict())
+        return await self.repository.get_or_create(match_fields, upsert, **self.to_values([validated_model])[0])
+
+    @overload
+    async def upsert_many(
+        self,
+        data: ModelDictListT | list[ModelT],
+        match_fields: list[str] | None = None,
+        *,
+        batch_size: int = ...,
+        return_models: Literal[True] = ...,
+    ) -> list[ModelT]:
+        ...
+
+    @overload
+    async def upsert_many(
+        self,
+        data: ModelDictListT | list[ModelT],
+        match_fields: list[str] | None = None,
+        *,
+        batch_size: int = ...,
+        return_models: Literal[False],
+    ) -> list[Any]:
+        ...
+
+    @overload
+    async def upsert_many(
+        self,
+        data: ModelDictListT | list[ModelT],
+        match_fields: list[str] | None = None,
+        *,
+        batch_size: int = ...,
+        return_models: bool = ...,
+    ) -> list[ModelT] | list[Any]:
+        ...
+
+    async def upsert_many(
+        self,
+        data: ModelDictListT | list[ModelT],
+        match_fields: list[str] | None = None,
+        *,
+        batch_size: int = DEFAULT_INSERT_BATCH_SIZE,
+        return_models: bool = True,
+    ) -> list[ModelT] | list[Any]:
+        """Create or update many records with `INSERT ... ON CONFLICT (match_fields) DO UPDATE` statements.
+
+        As with `bulk_create`, rows are not passed through `to_model`.
+
+        Args:
+            data: Representations to be created or updated.
+            match_fields: Attributes identifying an existing record.  Defaults to `match_fields` of the service.
+            batch_size: Maximum number of rows per statement.
+            return_models: Return the instances, otherwise only their identifiers.
+
+        Returns:
+            The created or updated instances, or their identifiers.
+        """
+        return await self.repository.upsert_many(
+            self.to_values(data),
+            match_fields if match_fields else self.match_fields,
+            batch_size=batch_size,
+            return_models=return_models,
+        )
 
     async def get_one(self, **kwargs: Any) -> ModelT:
         """Wrap repository scalar operation.
@@ -232,18 +401,23 @@ class SQLAlchemyAsyncRepositoryService(Service[ModelT], Generic[ModelT]):
     async def list_and_count(
         self,
         *filters: FilterTypes,
+        force_basic_query_mode: bool | None = None,
         **kwargs: Any,
     ) -> tuple[list[ModelT], int]:
         """List of records and total count returned by query.
 
+        The rows and the total are returned by a single `count(*) OVER ()` statement unless
+        `force_basic_query_mode` is set.
+
         Args:
             *filters: arguments for filtering.
+            force_basic_query_mode: Use a separate count statement instead of the window function.
             **kwargs: Keyword arguments for filtering.
 
         Returns:
             List of instances and count of total collection, ignoring pagination.
         """
-        return await self.repository.list_and_count(*filters, **kwargs)
+        return await self.repository.list_and_count(*filters, force_basic_query_mode=force_basic_query_mode, **kwargs)
 
     @overload
     def to_dto(self, data: ModelT) -> ModelT:
@@ -280,6 +454,25 @@ class SQLAlchemyAsyncRepositoryService(Service[ModelT], Generic[ModelT]):
             total=total,
         )
 
+    def to_cursor_dto(self, data: Sequence[ModelT], *filters: FilterTypes) -> CursorPagination[str, ModelT]:
+        """Convert a collection paginated with a `LimitCursor` to a format expected by the DTO handler
+
+        Args:
+            data: The return from one of the service calls.
+            *filters: Collection route filters.
+
+        Returns:
+            The page of instances and the cursor of the next one.
+        """
+        limit_cursor = self.find_filter(LimitCursor, *filters)
+        if limit_cursor is None:
+            return CursorPagination(items=list(data), results_per_page=len(data), cursor=None)
+        return CursorPagination(
+            items=list(data),
+            results_per_page=limit_cursor.limit,
+            cursor=self.next_cursor(data, limit_cursor),
+        )
+
     @overload
     def to_schema(self, dto: type[ModelDTOT], data: ModelT) -> ModelDTOT:
         ...
@@ -347,6 +540,34 @@ class SQLAlchemyAsyncRepositoryService(Service[ModelT], Generic[ModelT]):
                     session=db_session,
                 )
 
+    @classmethod
+    def cached_statement(cls, profile: str, builder: Callable[[], Select]) -> Select:
+        """Get the memoized statement of this service for an options profile.
+
+        Args:
+            profile: Name of the statement variant, e.g. `"list"` or `"auth"`.
+            builder: Builds the statement on first use.
+
+        Returns:
+            The statement shared by every instance of the service.
+        """
+        return statement_cache.get((cls, profile), builder)
+
+    def next_cursor(self, data: Sequence[ModelT], limit_cursor: LimitCursor) -> str | None:
+        """Build the cursor that seeks past the last row of a page.
+
+        Args:
+            data: The rows of the current page.
+            limit_cursor: The cursor pagination filter used to fetch `data`.
+
+        Returns:
+            The opaque cursor for the next page, or `None` when `data` is the last page.
+        """
+        if not data or len(data) < limit_cursor.limit:
+            return None
+        last = data[-1]
+        return encode_cursor(getattr(last, limit_cursor.field_name), self.repository.get_id_attribute_value(last))
+
     @staticmethod
     def find_filter(filter_type: type[FilterTypeT], *filters: FilterTypes) -> FilterTypeT | None:
         """Get the filter specified by filter type from the filters.
@@ -374,3 +595,17 @@ class SQLAlchemyAsyncRepositoryService(Service[ModelT], Generic[ModelT]):
             The list of instances retrieved from the repository.
         """
         return await self.repository.list(*filters, **kwargs)
+
+
+@functools.cache
+def _values_type(model_type: type[Any]) -> type[msgspec.Struct]:
+    """Struct of the column attributes of `model_type`, all optional, used to validate insert parameters."""
+    mapper = inspect(model_type)
+    assert mapper is not None  # noqa: S101
+    return msgspec.defstruct(
+        f"{model_type.__name__}Values",
+        [
+            (key, (column_python_type(attr.columns[0].type) or Any) | None, None)  # type: ignore[operator]
+            for key, attr in mapper.column_attrs.items()
+        ],
+    )
@@ -81,6 +81,8 @@ class ServerSettings(BaseSettings):
     ZULIP_API_KEY: str = ""
     """Zulip admins. for zulip server"""
     ZULIP_ADMIN_EMAIL: list[str]
+    ZULIP_UPDATE_WINDOW: float = 5
+    """Seconds the updates of a backlog message are collected for, before they are sent to Zulip as one."""
 
 
 class AppSettings(BaseSettings):
@@ -173,6 +175,16 @@ class APISettings(BaseSettings):
 
     CACHE_EXPIRATION: int = 60
     """Default cache key expiration in seconds."""
+    CACHE_LOCAL_EXPIRATION: int = 60
+    """Max seconds a cached value is kept in process, in front of Redis."""
+    CACHE_LOCAL_MAX_BYTES: int = 64 * 1024 * 1024
+    """Max total size of the values cached in process."""
+    CACHE_LOCAL_SIZE: int = 4096
+    """Max number of values cached in process."""
+    CACHE_LOCK_TIMEOUT: int = 10
+    """Max seconds concurrent misses of a cached value wait for the one computing it."""
+    CACHE_STALE_EXPIRATION: int = 0
+    """Seconds an expired response is still served to concurrent requests, while one of them computes it again."""
     DB_SESSION_DEPENDENCY_KEY: str = "db_session"
     """Parameter name for SQLAlchemy session dependency injection."""
     DEFAULT_PAGINATION_LIMIT: int = 100
@@ -181,6 +193,20 @@ class APISettings(BaseSettings):
     """Key used for DTO field config in SQLAlchemy info dict."""
     HEALTH_PATH: str = "/health"
     """Route that the health check is served under."""
+    PLUGIN_TIMEOUT: float = 5
+    """Max seconds a plugin hook can run for, the after hooks exceeding it are cancelled and logged."""
+    TAGGED_CACHE_EXPIRATION: int = 600
+    """Expiration in seconds of the responses cached with tags, which are invalidated when their entities change."""
+    USER_CACHE_EXPIRATION: int = 60
+    """Seconds an authenticated user is cached in Redis."""
+    USER_CACHE_LOCAL_EXPIRATION: int = 5
+    """Seconds an authenticated user is cached in process.
+
+    Invalidation only reaches the local cache of the process that made the change, so this bounds how long other
+    processes can serve a stale user.
+    """
+    USER_CACHE_SIZE: int = 1024
+    """Max number of users cached in process."""
 
 
 class LogSettings(BaseSettings):
@@ -287,6 +313,20 @@ class HTTPClientSettings(BaseSettings):
     BACKOFF_MIN: float = 0
     EXPONENTIAL_BACKOFF_BASE: float = 2
     EXPONENTIAL_BACKOFF_MULTIPLIER: float = 1
+    TIMEOUT: float = 5
+    """Timeout to read, write, or get a connection from the pool, in seconds."""
+    CONNECT_TIMEOUT: float = 2
+    """Timeout to connect, in seconds."""
+    MAX_CONNECTIONS: int = 100
+    """Max number of connections of the shared client."""
+    MAX_CONNECTIONS_PER_HOST: int = 10
+    """Max number of concurrent requests to a host, so that a slow service can't take the whole pool."""
+    MAX_KEEPALIVE_CONNECTIONS: int = 20
+    """Max number of idle connections kept alive."""
+    KEEPALIVE_EXPIRY: float = 30
+    """Time idle connections are kept alive for, in seconds."""
+    HTTP2: bool = True
+    """Negotiate HTTP/2, which needs the `h2` package, installed by `httpx[http2]`."""
 
 
 class WorkerSettings(BaseSettings):
@@ -330,12 +370,38 @@ class WorkerSettings(BaseSettings):
 
     Default is set to 10.
     """
+    QUEUE_CONCURRENCY: dict[str, int] = {}
+    """Number of concurrent jobs of the worker of each queue, by queue name, overriding `CONCURRENCY`."""
+    PROCESSES: int = 1
+    """The number of worker processes to spawn, each running the workers of all the queues.
+
+    Default is set to 1, which runs them in the current process.
+    """
+    SHUTDOWN_TIMEOUT: float = 30
+    """Seconds the running jobs are given to finish on shutdown, before they are cancelled and retried."""
     WEB_ENABLED: bool = False
     """If true, the worker admin UI is launched on worker startup.."""
     WEB_PORT: int = 8081
     """Port to use for the worker web UI."""
     INIT_METHOD: Literal["integrated", "standalone"] = "integrated"
     """Initialization method for the worker process."""
+    ROLLUP_LAG: int = 60
+    """Age, in seconds, rows must reach before they are folded into the analytics rollups.
+
+    Rows are folded by creation time, so this must exceed the longest running write transaction.
+    """
+    OUTBOX_BATCH_SIZE: int = 50
+    """Number of outbox messages claimed and committed together by the delivery task."""
+    OUTBOX_MAX_ATTEMPTS: int = 10
+    """Max delivery attempts of an outbox message, it is kept for `OUTBOX_RETENTION` seconds after the last one."""
+    OUTBOX_RETRY_DELAY: float = 5.0
+    """Seconds to delay the first retry of an outbox message by, the delay doubles with each attempt."""
+    OUTBOX_RETRY_BACKOFF: float = 3600
+    """Max retry delay of an outbox message, in seconds."""
+    OUTBOX_RETENTION: int = 604800
+    """Time delivered outbox messages, and the ones given up on, are kept for, in seconds."""
+    OUTBOX_TIMEOUT: int = 300
+    """Max time the outbox delivery task can run for, in seconds."""
 
 
 class DatabaseSettings(BaseSettings):
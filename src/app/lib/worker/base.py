@@ -81,6 +81,26 @@ class Worker(saq.Worker):
 
     # same issue: https://github.com/samuelcolvin/arq/issues/182
     SIGNALS: list[Signals] = []
+    draining: bool = False
+
+    def _process(self, previous_task: asyncio.Task | None = None) -> None:
+        if self.draining:
+            if previous_task:
+                self.tasks.discard(previous_task)
+            return
+        super()._process(previous_task)
+
+    async def drain(self, timeout: float) -> None:
+        """Stop taking jobs, and stop the worker once the running ones are done.
+
+        The jobs still running after `timeout` seconds are cancelled, and retried.
+        """
+        self.draining = True
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while self.job_task_contexts and loop.time() < deadline:
+            await asyncio.sleep(0.1)
+        self.event.set()
 
     async def on_app_startup(self) -> None:
         """Attach the worker to the running event loop."""
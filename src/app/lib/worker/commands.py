@@ -2,7 +2,10 @@ from __future__ import annotations
 
 import asyncio
 import atexit
+import multiprocessing
+import signal
 import threading
+from multiprocessing.connection import wait
 from multiprocessing.util import _exit_function  # type: ignore[attr-defined]
 from typing import TYPE_CHECKING, Any
 
@@ -14,6 +17,8 @@ from .base import Queue, Worker
 
 if TYPE_CHECKING:
     from collections.abc import Awaitable, Callable, Collection
+    from multiprocessing.process import BaseProcess
+    from types import FrameType
 
     import saq
 
@@ -60,10 +65,72 @@ def create_worker_instance(
     )
 
 
-def run_worker() -> None:
-    """Run a worker."""
-    from app.domain import scheduled_tasks, tasks
+def run_worker(queue_names: Collection[str] | None = None, processes: int | None = None) -> None:
+    """Run the workers of the queues.
+
+    With more than one process, each one runs the workers of all the queues, and is restarted if it dies.  They are
+    stopped on `SIGINT` or `SIGTERM`, once their running jobs are done.
+
+    Args:
+        queue_names: Names of the queues to run the workers of.  Defaults to all the queues.
+        processes: Number of worker processes.  Defaults to `WORKER_PROCESSES`.
+    """
+    from app.lib.worker import queues
+
+    queue_names = list(queue_names or queues)
+    if unknown := set(queue_names) - set(queues):
+        raise ValueError(f"Unknown queues: {', '.join(sorted(unknown))}")
+    processes = processes or settings.worker.PROCESSES
+    if processes <= 1:
+        _run_workers(queue_names)
+        return
+
+    _supervise(queue_names, processes)
+
+
+def _supervise(queue_names: Collection[str], processes: int) -> None:
+    """Run the workers of the queues in `processes` child processes, restarting the ones that die."""
     from app.lib import log
+
+    logger = log.get_logger()
+    logger.info("Starting worker processes", processes=processes, queues=queue_names)
+    stopping = False
+
+    def stop(signum: int, frame: FrameType | None) -> None:
+        nonlocal stopping
+        stopping = True
+
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, stop)
+    children: list[BaseProcess | None] = [None] * processes
+    try:
+        while not stopping:
+            for i, child in enumerate(children):
+                if child is None or not child.is_alive():
+                    if child is not None:
+                        logger.warning("Worker process died, restarting", pid=child.pid, exitcode=child.exitcode)
+                    process = multiprocessing.Process(target=_run_workers, args=(queue_names,), name=f"worker-{i}")
+                    process.start()
+                    children[i] = process
+            wait([child.sentinel for child in children if child is not None], timeout=1)
+    finally:
+        logger.info("Stopping worker processes")
+        for child in children:
+            if child is not None and child.is_alive():
+                child.terminate()
+        # the processes cancel the jobs still running after the shutdown timeout, and then run the shutdown hooks
+        for child in children:
+            if child is not None:
+                child.join(settings.worker.SHUTDOWN_TIMEOUT + 10)
+                if child.is_alive():
+                    logger.warning("Worker process didn't stop, killing it", pid=child.pid)
+                    child.kill()
+
+
+def _run_workers(queue_names: Collection[str]) -> None:
+    """Run the workers of the queues in the current process, until it gets `SIGINT` or `SIGTERM`."""
+    from app.domain import scheduled_tasks, tasks
+    from app.lib import http_client, log
     from app.lib.log.worker import after_process as after_logging_process
     from app.lib.log.worker import before_process as before_logging_process
     from app.lib.log.worker import on_shutdown as shutdown_logging_process
@@ -74,28 +141,42 @@ def run_worker() -> None:
         atexit.unregister(_exit_function)
     logger = log.get_logger()
     logger.info("Starting working pool")
+
+    async def startup(ctx: dict[str, Any]) -> None:
+        await startup_logging_process(ctx)
+        await http_client.on_startup()
+
+    async def shutdown(ctx: dict[str, Any]) -> None:
+        await http_client.on_shutdown()
+        await shutdown_logging_process(ctx)
+
     loop = _create_event_loop()
     worker_instances: list[Worker] = [
         create_worker_instance(
             queue=queue,
             tasks=tasks.get(queue, []),
             scheduled_tasks=scheduled_tasks.get(queue, []),
-            startup=startup_logging_process,
-            shutdown=shutdown_logging_process,
+            startup=startup,
+            shutdown=shutdown,
             after_process=after_logging_process,
             before_process=before_logging_process,
+            concurrency=settings.worker.QUEUE_CONCURRENCY.get(queue.name),
         )
-        for queue in queues.values()
+        for name, queue in queues.items()
+        if name in queue_names
     ]
-    try:
-        for i, worker_instance in enumerate(worker_instances):
-            if i < len(worker_instances) - 1:
-                loop.create_task(worker_instance.start())
-            else:
-                loop.run_until_complete(worker_instance.start())
-    except KeyboardInterrupt:
+    draining: set[asyncio.Task] = set()
+
+    def drain() -> None:
+        logger.info("Draining working pool")
         for worker_instance in worker_instances:
-            loop.run_until_complete(worker_instance.stop())
+            task = loop.create_task(worker_instance.drain(settings.worker.SHUTDOWN_TIMEOUT))
+            draining.add(task)
+            task.add_done_callback(draining.discard)
+
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, drain)
+    loop.run_until_complete(asyncio.gather(*(worker_instance.start() for worker_instance in worker_instances)))
 
 
 def _create_event_loop() -> asyncio.AbstractEventLoop:
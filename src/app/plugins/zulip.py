@@ -1,25 +1,34 @@
 import json
 import logging
+import time
 from typing import Any
 from uuid import UUID
 
 import httpx
+from saq import Status
+from sqlalchemy import func, update
 
 from app.domain.backlogs.models import Backlog
+from app.domain.outbox import services as outbox
+from app.domain.outbox.models import OutboxMessage
 from app.domain.projects.models import Project
+from app.lib import db, http_client, settings, worker
 from app.lib.plugin import BacklogPlugin, ProjectPlugin
 from app.lib.settings import server
 
-__all__ = ["ZulipBacklogPlugin"]
+__all__ = ["ZulipBacklogPlugin", "update_backlog_message"]
 logger = logging.getLogger(__name__)
 backlog_topic: str = "📑 [BACKLOG] "
 
+SEND_BACKLOG_MESSAGE = "zulip.send_backlog_message"
+UPDATE_BACKLOG_MESSAGE = "zulip.update_backlog_message"
+
 
 def log_info(message: str) -> None:
     return logger.info(message)
 
 
-async def send_msg(backlog_data: "Backlog | dict[str, Any]") -> Any:
+async def send_msg(backlog_data: "Backlog | dict[str, Any]", client: httpx.AsyncClient | None = None) -> Any:
     log_info("sending message to zulip")
     url = f"{server.ZULIP_API_URL}{server.ZULIP_SEND_MESSAGE_URL}"
     auth = httpx.BasicAuth(server.ZULIP_EMAIL_ADDRESS, server.ZULIP_API_KEY)
@@ -27,7 +36,7 @@ async def send_msg(backlog_data: "Backlog | dict[str, Any]") -> Any:
     content: str
     stream_name: str
     if isinstance(backlog_data, Backlog):
-        content = f"{backlog_data.status} {backlog_data.priority} {backlog_data.progress} **[{backlog_data.slug}]** {backlog_data.title}  **:time::{backlog_data.due_date.strftime('%d-%m-%Y')}** @**{backlog_data.assignee_name}** {backlog_data.category}"
+        content = backlog_content(backlog_data)
         stream_name = f"📌PRJ/{backlog_data.project_name}"
     elif isinstance(backlog_data, dict):
         content = f"{backlog_data['status']} {backlog_data['priority']} {backlog_data['progress']} **[{backlog_data['slug']}]** {backlog_data['title']}  **:time::{backlog_data['due_date'].strftime('%d-%m-%Y')}** @**{backlog_data['assignee_name']}** {backlog_data['category']}"
@@ -39,14 +48,13 @@ async def send_msg(backlog_data: "Backlog | dict[str, Any]") -> Any:
         "topic": backlog_topic,
         "content": content,
     }
-    async with httpx.AsyncClient(timeout=1) as client:
-        response = await client.post(url, auth=auth, data=data)
-        if response.status_code == 200:
-            return dict(response.json())
-        raise httpx.HTTPError(f"{response.status_code}, {response.text}")
+    response = await (client or http_client.get_client()).post(url, auth=auth, data=data)
+    if response.status_code == 200:
+        return dict(response.json())
+    raise httpx.HTTPError(f"{response.status_code}, {response.text}")
 
 
-async def update_message(msg_id: int, content: str) -> dict[str, Any]:
+async def update_message(msg_id: int, content: str, client: httpx.AsyncClient | None = None) -> dict[str, Any]:
     log_info("updaing message")
     url: str = f"{server.ZULIP_API_URL}{server.ZULIP_SEND_MESSAGE_URL}/{msg_id}"
     auth = httpx.BasicAuth(server.ZULIP_EMAIL_ADDRESS, server.ZULIP_API_KEY)
@@ -59,14 +67,85 @@ async def update_message(msg_id: int, content: str) -> dict[str, Any]:
         "content": content,
     }
 
-    async with httpx.AsyncClient(timeout=1) as client:
-        response = await client.patch(url, auth=auth, data=data)
-        if response.status_code == 200:
-            return dict(response.json())
-        raise httpx.HTTPError(f"{response.status_code}, {response.text}")
+    response = await (client or http_client.get_client()).patch(url, auth=auth, data=data)
+    if response.status_code == 200:
+        return dict(response.json())
+    raise httpx.HTTPError(f"{response.status_code}, {response.text}")
+
+
+def backlog_content(backlog: "Backlog") -> str:
+    return f"{backlog.status} {backlog.priority} {backlog.progress} **[{backlog.slug}]** {backlog.title}  **:time::{backlog.due_date.strftime('%d-%m-%Y')}** @**{backlog.assignee_name}** {backlog.category}"
+
+
+@outbox.handler(SEND_BACKLOG_MESSAGE)
+async def deliver_backlog_message(message: OutboxMessage) -> None:
+    """Send the message of a new backlog and store its id in the backlog `plugin_meta`."""
+    backlog_id = UUID(message.payload["backlog_id"])
+    async with db.session() as session:
+        backlog = await session.get(Backlog, backlog_id)
+    # the backlog may have been deleted since, or its message sent by an attempt that failed to be marked delivered
+    if backlog is None or backlog.plugin_meta.get("msg_id"):
+        return
+    response = await send_msg(backlog)
+    if response["result"] != "success":
+        raise httpx.HTTPError(str(response))
+    log_info("successfully sent message to zulip")
+    async with db.session() as session:
+        await session.execute(
+            update(Backlog)
+            .where(Backlog.id == backlog_id)
+            .values(plugin_meta=Backlog.plugin_meta.op("||")(func.jsonb_build_object("msg_id", response["id"])))
+        )
+        await session.commit()
+
+
+@outbox.handler(UPDATE_BACKLOG_MESSAGE)
+async def deliver_backlog_message_update(message: OutboxMessage) -> None:
+    """Schedule the update of the message of a backlog, coalesced with the other updates of the backlog.
+
+    The `update_backlog_message` job is keyed by backlog, and runs `SERVER_ZULIP_UPDATE_WINDOW` seconds after it is enqueued,
+    so that the updates made until it runs are dropped by the queue, and sent as one.  The updates made while it runs
+    are retried, as it may have read the backlog before they were committed.
+    """
+    backlog_id = message.payload["backlog_id"]
+    key = f"{UPDATE_BACKLOG_MESSAGE}:{backlog_id}"
+    queue = worker.queues["background-tasks"]
+    job = await queue.enqueue(
+        "update_backlog_message",
+        key=key,
+        scheduled=int(time.time() + server.ZULIP_UPDATE_WINDOW),
+        retries=settings.worker.OUTBOX_MAX_ATTEMPTS,
+        retry_delay=settings.worker.OUTBOX_RETRY_DELAY,
+        retry_backoff=settings.worker.OUTBOX_RETRY_BACKOFF,
+        backlog_id=backlog_id,
+    )
+    if job is None and (pending := await queue.job(key)) is not None and pending.status == Status.ACTIVE:
+        raise RuntimeError(f"message of backlog {backlog_id} being updated")
+
+
+async def update_backlog_message(_: dict, *, backlog_id: str) -> None:
+    """Update the message of a backlog to its current state, so that coalesced or retried updates send the latest."""
+    async with db.session() as session:
+        backlog = await session.get(Backlog, UUID(backlog_id))
+        if backlog is None or "zulip_bot" not in backlog.plugin_meta:
+            return
+        msg_id = backlog.plugin_meta.get("msg_id")
+        if not msg_id:
+            # retried until the message of the backlog is sent
+            raise LookupError(f"message of backlog {backlog.slug} not sent yet")
+        content = backlog_content(backlog)
+    response = await update_message(msg_id=msg_id, content=content)
+    if response.get("result") != "success":
+        raise httpx.HTTPError(str(response))
+    log_info(f"successfully sent message to zulip {response}")
 
 
 class ZulipBacklogPlugin(BacklogPlugin):
+    """Post the backlogs to the stream of their project, and keep the messages up to date.
+
+    The messages are sent through the outbox, so that Zulip never holds the backlog changes.
+    """
+
     def __init__(self, zulip_bot: str = "pipo") -> None:
         self.zulip_bot: str = zulip_bot
         return
@@ -81,16 +160,12 @@ class ZulipBacklogPlugin(BacklogPlugin):
 
     async def after_create(self, data: "Backlog") -> "Backlog":
         log_info(self.zulip_bot)
-        try:
-            response = await send_msg(data)
-            if response["result"] != "success":
-                log_info(response)
-            else:
-                log_info("successfully sent message to zulip")
-                data.plugin_meta = {"msg_id": response["id"]}
-
-        except (httpx.ConnectTimeout, httpx.ReadTimeout, httpx.ConnectError, httpx.HTTPError) as e:
-            log_info(f"failed to send message to zulip: {e!s}")
+        outbox.add_message(
+            self.db_session,
+            SEND_BACKLOG_MESSAGE,
+            {"backlog_id": str(data.id)},
+            key=f"{SEND_BACKLOG_MESSAGE}:{data.id}",
+        )
         return data
 
     async def before_update(self, item_id: str, data: "Backlog | dict[str, Any]") -> "Backlog | dict[str, Any]":
@@ -99,18 +174,7 @@ class ZulipBacklogPlugin(BacklogPlugin):
     async def after_update(self, data: "Backlog") -> "Backlog":
         log_info(self.zulip_bot)
         data = await super().after_update(data)
-        content: str = f"{data.status} {data.priority} {data.progress} **[{data.slug}]** {data.title}  **:time::{data.due_date.strftime('%d-%m-%Y')}** @**{data.assignee_name}** {data.category}"
-        try:
-            msg_id = data.plugin_meta.get("msg_id")
-            if msg_id:
-                response: dict[str, Any] | None = await update_message(msg_id=msg_id, content=content)
-            if response:
-                if response.get("result") != "success":
-                    log_info(str(response))
-                else:
-                    log_info(f"successfully sent message to zulip {response}")
-        except (httpx.ConnectTimeout, httpx.ReadTimeout, httpx.ConnectError, httpx.HTTPError) as e:
-            log_info(f"failed to update message: {e!s}")
+        outbox.add_message(self.db_session, UPDATE_BACKLOG_MESSAGE, {"backlog_id": str(data.id)})
         return data
 
     async def before_delete(self, item_id: UUID) -> "UUID":
@@ -129,6 +193,7 @@ async def create_stream(
     description: str,
     principals: list[str],
     is_pinned: bool | None = False,
+    client: httpx.AsyncClient | None = None,
 ) -> dict[str, str]:
     log_info("creating zulip stream")
     url: str = f"{server.ZULIP_API_URL}{server.ZULIP_CREATE_STREAM_URL}"
@@ -141,12 +206,11 @@ async def create_stream(
         "invite_only": True,
         "history_public_to_subscribers": True,
     }
-    async with httpx.AsyncClient(timeout=1) as client:
-        response = await client.post(url, auth=auth, data=data)
-        log_info(str(response))
-        if response.status_code == 200:
-            return dict(response.json())
-        raise httpx.HTTPError(f"{response.status_code}, {response.text}")
+    response = await (client or http_client.get_client()).post(url, auth=auth, data=data)
+    log_info(str(response))
+    if response.status_code == 200:
+        return dict(response.json())
+    raise httpx.HTTPError(f"{response.status_code}, {response.text}")
 
 
 class ZulipProjectPlugin(ProjectPlugin):
@@ -171,7 +235,7 @@ class ZulipProjectPlugin(ProjectPlugin):
             email = "" if data.owner.email is None else data.owner.email
             principals.append(email)
             log_info(str(principals))
-            response = await create_stream(data.name, data.description, principals, data.pin)
+            response = await create_stream(data.name, data.description, principals, data.pin, client=self.http_client)
             if response["result"] != "success":
                 log_info(str(response))
             else:
@@ -14,10 +14,11 @@ from sqlalchemy.engine import URL
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.pool import NullPool
 
+from app.domain.accounts.cache import user_cache
 from app.domain.accounts.models import User
 from app.domain.security import auth
 from app.domain.teams.models import Team
-from app.lib import db, worker
+from app.lib import cache, db, worker
 
 if TYPE_CHECKING:
     from collections import abc
@@ -221,9 +222,16 @@ def _patch_db(
 def _patch_redis(app: "Litestar", redis: Redis, monkeypatch: pytest.MonkeyPatch) -> None:
     cache_config = app.response_cache_config
     assert cache_config is not None
-    monkeypatch.setattr(app.stores.get(cache_config.store), "_redis", redis)
+    monkeypatch.setattr(cache, "redis", redis)
+    monkeypatch.setattr(user_cache, "redis", redis)
+    # the stores register their scripts with the client they are created with
+    response_cache_store = cache.single_flight_store_factory(cache_config.store)
+    monkeypatch.setattr(cache, "response_cache_store", response_cache_store)
+    app.stores.register(cache_config.store, response_cache_store, allow_override=True)
     for queue in worker.queues.values():
         monkeypatch.setattr(queue, "redis", redis)
+        # the queues register their scripts with the client of the first job they enqueue
+        monkeypatch.setattr(queue, "_enqueue_script", None)
 
 
 @pytest.fixture(name="client")
@@ -1,7 +1,13 @@
+from datetime import UTC, datetime
 from typing import TYPE_CHECKING
+from uuid import UUID
+
+from app.domain.backlogs.models import Backlog
+from app.domain.projects.models import Project
 
 if TYPE_CHECKING:
     from httpx import AsyncClient
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 
 async def test_update_user_no_auth(client: "AsyncClient") -> None:
@@ -73,6 +79,59 @@ async def test_user_update(client: "AsyncClient", superuser_token_headers: dict[
     assert response.json()["name"] == "Name Changed"
 
 
+async def test_user_update_invalidates_cached_responses(
+    client: "AsyncClient", superuser_token_headers: dict[str, str], sessionmaker: "async_sessionmaker[AsyncSession]"
+) -> None:
+    """Test that the cached backlogs showing a user are invalidated once it is renamed."""
+    user_id = UUID("5ef29f3c-3560-4d15-ba6b-a2e5c721e4d2")
+    today = datetime.now(UTC).date()
+    async with sessionmaker() as session:
+        project = Project(
+            slug="owned",
+            name="Owned",
+            description="",
+            repo_urls=[],
+            labels=[],
+            documents=[],
+            plugin_meta={},
+            owner_id=user_id,
+        )
+        session.add(project)
+        await session.flush()
+        backlog = Backlog(
+            title="Assigned",
+            slug="assigned",
+            project_slug="owned",
+            sprint_number=1,
+            est_days=1,
+            beg_date=today,
+            end_date=today,
+            due_date=today,
+            labels=[],
+            plugin_meta={},
+            assignee_id=user_id,
+            owner_id=user_id,
+        )
+        session.add(backlog)
+        await session.commit()
+
+    paths = [f"/api/backlogs/detail/{backlog.id}", "/api/backlogs/slug/assigned", "/api/backlogs"]
+    for path in paths:
+        response = await client.get(path, headers=superuser_token_headers)
+        assert response.status_code == 200
+        assert "Example User" in response.text
+
+    response = await client.patch(
+        f"/api/users/{user_id}", json={"name": "Name Changed"}, headers=superuser_token_headers
+    )
+    assert response.status_code == 200
+    for path in paths:
+        response = await client.get(path, headers=superuser_token_headers)
+        assert response.status_code == 200
+        assert "Example User" not in response.text
+        assert "Name Changed" in response.text
+
+
 async def test_accounts_delete(client: "AsyncClient", superuser_token_headers: dict[str, str]) -> None:
     response = await client.delete(
         "/api/users/5ef29f3c-3560-4d15-ba6b-a2e5c721e4d2",
@@ -0,0 +1,128 @@
+"""Tests of the analytics rollups and sprint queries, replayed from the backlog audit."""
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy import select
+
+from app.domain.analytics.models import SprintRollup, WeeklyRollup
+from app.domain.analytics.queries import analytics_queries
+from app.domain.analytics.tasks import fold_rollups
+from app.domain.backlogs.models import Backlog, BacklogAudit, StatusEnum
+from app.domain.backlogs.models import Service as BacklogService
+from app.domain.projects.models import Project
+from app.lib import settings
+from app.lib.aiosql import AiosqlQueryManager
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+
+async def test_fold_rollups(sessionmaker: "async_sessionmaker[AsyncSession]", monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that completions are folded at the sprint and points they were made at, and reopening takes them back."""
+    monkeypatch.setattr(settings.worker, "ROLLUP_LAG", 0)
+    async with sessionmaker() as session, BacklogService.new(session) as backlogs_service:
+        session.add(Project(slug="fold", name="Fold", description="", repo_urls=[], plugin_meta={}))
+        await session.flush()
+        backlog = await backlogs_service.create(
+            {"title": "Fold", "project_slug": "fold", "sprint_number": 1, "est_days": 1, "points": 5}
+        )
+        await backlogs_service.update(backlog.id, {"status": StatusEnum.completed})
+        await backlogs_service.update(backlog.id, {"status": StatusEnum.started})
+        await backlogs_service.update(backlog.id, {"sprint_number": 2, "points": 8})
+        await backlogs_service.update(backlog.id, {"status": StatusEnum.completed})
+        await session.commit()
+
+    await fold_rollups({})
+
+    async with sessionmaker() as session:
+        completed = await session.execute(
+            select(SprintRollup.sprint_number, SprintRollup.value)
+            .where(SprintRollup.series == "backlogs-completed", SprintRollup.project_slug == "fold")
+            .order_by(SprintRollup.sprint_number)
+        )
+        assert [tuple(row) for row in completed.all()] == [(1, 0.0), (2, 1.0)]
+        burned = await session.scalars(
+            select(WeeklyRollup.value).where(WeeklyRollup.series == "points-burned", WeeklyRollup.dimension == "fold")
+        )
+        assert sum(burned) == 8
+        created = await session.scalar(
+            select(SprintRollup.value).where(
+                SprintRollup.series == "backlogs-created", SprintRollup.project_slug == "fold"
+            )
+        )
+        assert created == 1
+
+
+async def test_sprint_burn_and_velocity(sessionmaker: "async_sessionmaker[AsyncSession]") -> None:
+    """Test that the sprint burn replays the changes into and out of completed, and the velocity the statuses."""
+    now = datetime.now(UTC)
+    today = now.date()
+    async with sessionmaker() as session:
+        session.add(Project(slug="burn", name="Burn", description="", repo_urls=[], plugin_meta={}))
+        await session.flush()
+        reopened, completed, next_sprint = (
+            Backlog(
+                title=title,
+                slug=f"burn-{title}",
+                project_slug="burn",
+                sprint_number=sprint_number,
+                points=points,
+                status=status,
+                est_days=5,
+                beg_date=today - timedelta(days=3),
+                due_date=today + timedelta(days=2),
+                created_at=now - timedelta(days=3),
+            )
+            for title, sprint_number, points, status in (
+                ("reopened", 1, 3, StatusEnum.started),
+                ("completed", 1, 5, StatusEnum.completed),
+                ("next", 2, 2, StatusEnum.new),
+            )
+        )
+        session.add_all([reopened, completed, next_sprint])
+        await session.flush()
+        session.add_all(
+            BacklogAudit(
+                backlog_id=backlog.id,
+                field_name="status",
+                old_value=old_value,
+                new_value=new_value,
+                project_slug="burn",
+                sprint_number=1,
+                points=backlog.points,
+                created_at=now - timedelta(days=days_ago),
+            )
+            for backlog, old_value, new_value, days_ago in (
+                (reopened, StatusEnum.started, StatusEnum.completed, 2),
+                (reopened, StatusEnum.completed, StatusEnum.started, 1),
+                (completed, StatusEnum.started, StatusEnum.completed, 1),
+                # not a change into or out of completed
+                (completed, StatusEnum.new, StatusEnum.started, 2),
+            )
+        )
+        await session.flush()
+
+        async with AiosqlQueryManager.from_session(analytics_queries, session) as queries:
+            burn = await queries.select(
+                "sprint_burn", project_slug="burn", sprint_number=1, completed=StatusEnum.completed.value
+            )
+            velocity = await queries.select(
+                "project_velocity", project_slug="burn", completed=StatusEnum.completed.value
+            )
+        await session.rollback()
+
+    assert [row["day"] for row in burn] == [today + timedelta(days=days) for days in range(-3, 3)]
+    assert [(row["scope"], row["completed"], row["remaining"]) for row in burn] == [
+        (8, 0, 8),
+        (8, 3, 5),
+        (8, 5, 3),
+        (8, 5, 3),
+        (None, None, None),
+        (None, None, None),
+    ]
+    assert [row["ideal"] for row in burn] == [8.0, 6.4, 4.8, 3.2, 1.6, 0.0]
+    assert [(row["sprint_number"], row["committed"], row["completed"], row["average"]) for row in velocity] == [
+        (1, 8, 5, 5.0),
+        (2, 2, 0, 2.5),
+    ]
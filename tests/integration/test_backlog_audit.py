@@ -0,0 +1,105 @@
+"""Benchmark of the time the `BacklogAudit` change capture adds to backlog updates."""
+import timeit
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import event, func, select
+from sqlalchemy.orm import Session
+
+from app.domain.backlogs.models import (
+    Backlog,
+    BacklogAudit,
+    PriorityEnum,
+    ProgressEnum,
+    Repository,
+    StatusEnum,
+    insert_backlog_audits,
+    record_backlog_audits,
+)
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+ROW_COUNT = 200
+REPEAT = 5
+MAX_OVERHEAD = 0.05
+"""Bound of the share of the update time spent recording and inserting the audit rows.
+
+The rows are inserted with one statement per transaction, so the updates take no extra round trip, but a transaction
+updating a single backlog still takes one more at commit.  Measured on a local Postgres 18, the audit takes 3 to 4% of
+the time of updates committed every `ROW_COUNT` rows.
+"""
+STATES = [
+    (StatusEnum.started, ProgressEnum.a_third, PriorityEnum.hi),
+    (StatusEnum.new, ProgressEnum.empty, PriorityEnum.med),
+]
+
+
+def _raw_backlogs(prefix: str) -> list[Backlog]:
+    today = datetime.now(UTC).date()
+    return [
+        Backlog(
+            title=f"{prefix}-{i}",
+            slug=f"{prefix}-{i}",
+            sprint_number=1,
+            est_days=1,
+            beg_date=today,
+            end_date=today,
+            due_date=today,
+            plugin_meta={},
+        )
+        for i in range(ROW_COUNT)
+    ]
+
+
+@contextmanager
+def _timed_listeners(*listeners: tuple[str, Callable[..., None]]) -> Iterator[list[float]]:
+    """Time the calls of the given `Session` event listeners, the elapsed times are appended to the yielded list."""
+    elapsed: list[float] = []
+
+    def timed(listener: Callable[..., None]) -> Callable[..., None]:
+        def wrapper(*args: Any) -> None:
+            start = timeit.default_timer()
+            try:
+                listener(*args)
+            finally:
+                elapsed.append(timeit.default_timer() - start)
+
+        return wrapper
+
+    wrappers = [(identifier, listener, timed(listener)) for identifier, listener in listeners]
+    for identifier, listener, wrapper in wrappers:
+        event.remove(Session, identifier, listener)
+        event.listen(Session, identifier, wrapper)
+    try:
+        yield elapsed
+    finally:
+        for identifier, listener, wrapper in wrappers:
+            event.remove(Session, identifier, wrapper)
+            event.listen(Session, identifier, listener)
+
+
+async def test_backlog_audit_benchmark(sessionmaker: "async_sessionmaker[AsyncSession]") -> None:
+    async with sessionmaker() as session:
+        repository = Repository(session=session)
+        backlogs = await repository.add_many(_raw_backlogs("audited"))
+        await session.commit()
+
+        update_elapsed = 0.0
+        with _timed_listeners(
+            ("after_flush", record_backlog_audits), ("before_commit", insert_backlog_audits)
+        ) as audit_elapsed:
+            for round_number in range(REPEAT):
+                status, progress, priority = STATES[round_number % len(STATES)]
+                start = timeit.default_timer()
+                for backlog in backlogs:
+                    backlog.status, backlog.progress, backlog.priority = status, progress, priority
+                    await repository.update(backlog)
+                await session.commit()
+                update_elapsed += timeit.default_timer() - start
+
+        assert await session.scalar(select(func.count()).select_from(BacklogAudit)) == 3 * ROW_COUNT * REPEAT
+
+    assert sum(audit_elapsed) < update_elapsed * MAX_OVERHEAD
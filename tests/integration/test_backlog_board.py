@@ -0,0 +1,77 @@
+"""Benchmark of the memory used to list backlogs as ORM instances against the `list_board` projection.
+
+Run with `pytest tests/integration/test_backlog_board.py -s` to see the peaks.
+"""
+import tracemalloc
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+
+from app.domain.accounts.models import User
+from app.domain.backlogs.models import Backlog, BoardItem, Repository
+from app.domain.projects.models import Project
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+ROW_COUNT = 2000
+
+
+async def _peak(list_backlogs: Callable[[], Awaitable[list[Any]]]) -> tuple[list[Any], int]:
+    tracemalloc.start()
+    try:
+        results = await list_backlogs()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return results, peak
+
+
+async def test_backlog_board_benchmark(sessionmaker: "async_sessionmaker[AsyncSession]") -> None:
+    today = datetime.now(UTC).date()
+    async with sessionmaker() as session:
+        assignee, owner = User(email="assignee@example.com", name="Assignee"), User(
+            email="owner@example.com", name="Owner"
+        )
+        project = Project(slug="board", name="Board", description="", repo_urls=[], plugin_meta={})
+        session.add_all([assignee, owner, project])
+        await session.flush()
+        session.add_all(
+            Backlog(
+                title=f"board-{i}",
+                slug=f"board-{i}",
+                sprint_number=i % 5,
+                est_days=1,
+                beg_date=today,
+                end_date=today,
+                due_date=today,
+                labels=["backend"],
+                plugin_meta={},
+                project_slug=project.slug,
+                assignee_id=assignee.id,
+                owner_id=owner.id,
+            )
+            for i in range(ROW_COUNT)
+        )
+        await session.commit()
+        session.expunge_all()
+
+        repository = Repository(session=session)
+        # warm up the compiled statement caches, so that they aren't counted in either peak
+        await repository.list(project_slug=project.slug)
+        await repository.list_board(project_slug=project.slug)
+
+        backlogs, orm_peak = await _peak(lambda: repository.list(project_slug=project.slug))
+        board, board_peak = await _peak(lambda: repository.list_board(project_slug=project.slug))
+
+        assert len(backlogs) == len(board) == ROW_COUNT
+        assert all(isinstance(item, BoardItem) for item in board)
+        assert {(item.assignee_name, item.owner_name, item.project_name) for item in board} == {
+            ("Assignee", "Owner", "Board")
+        }
+        await session.rollback()
+
+    print(  # noqa: T201
+        f"\nlist peak: {orm_peak / 1024:.0f} KiB, list_board peak: {board_peak / 1024:.0f} KiB "
+        f"for {ROW_COUNT} rows ({orm_peak / board_peak:.1f}x)"
+    )
@@ -0,0 +1,42 @@
+"""Tests of the backlog search, by full text and by trigram similarity."""
+from typing import TYPE_CHECKING
+
+from app.domain.backlogs.models import Service
+from app.lib.filters import LimitOffset
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+
+async def test_search(sessionmaker: "async_sessionmaker[AsyncSession]") -> None:
+    """Test that both search paths rank the matches and return headlines whose only markup is the highlighting."""
+    async with sessionmaker() as session, Service.new(session) as service:
+        await service.bulk_create(
+            [
+                {
+                    "title": "Deploy <script>alert(1)</script> pipeline",
+                    "description": "Deploying the API & the <b>workers</b>",
+                    "sprint_number": 1,
+                    "est_days": 1,
+                },
+                {"title": "Release notes", "description": "Written once deployed", "sprint_number": 1, "est_days": 1},
+                {"title": "Unrelated", "description": "Nothing to see", "sprint_number": 1, "est_days": 1},
+            ]
+        )
+        page = LimitOffset(limit=10, offset=0)
+
+        hits = await service.search("deploy", page)
+        assert [hit.title for hit in hits] == ["Deploy <script>alert(1)</script> pipeline", "Release notes"]
+        assert hits[0].rank > hits[1].rank
+        assert "<mark>Deploy</mark>" in hits[0].headline
+        assert "<script>" not in hits[0].headline
+        assert "&lt;script&gt;" in hits[0].headline
+        assert "&amp;" in hits[0].headline
+        assert "<b>" not in hits[0].headline
+        assert await service.search('"release notes" -deployed', page) == []
+
+        hits = await service.search("dep", page)
+        assert [hit.title for hit in hits] == ["Deploy <script>alert(1)</script> pipeline"]
+        assert hits[0].headline == "Deploy &lt;script&gt;alert(1)&lt;/script&gt; pipeline"
+        assert await service.search("  ", page) == []
+        await session.rollback()
@@ -0,0 +1,64 @@
+"""Tests of the backlog transitions, updating and auditing the backlog in a single statement."""
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy import select
+
+from app.domain.backlogs.models import BacklogAudit, PriorityEnum, ProgressEnum, Service, StatusEnum, TransitionField
+from app.domain.projects.models import Project
+from app.lib.plugin import PluginDispatcher
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+
+async def test_transition(sessionmaker: "async_sessionmaker[AsyncSession]", monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that transitions are clamped, that the progress sets the status, and that the changes are audited."""
+    monkeypatch.setattr(Service, "plugins", PluginDispatcher())
+    async with sessionmaker() as session, Service.new(session) as service:
+        session.add(Project(slug="steps", name="Steps", description="", repo_urls=[], plugin_meta={}))
+        await session.flush()
+        backlog = await service.create(
+            {"title": "Steps", "project_slug": "steps", "sprint_number": 2, "est_days": 1, "points": 3}
+        )
+
+        steps: list[tuple[TransitionField, int, ProgressEnum, StatusEnum]] = [
+            ("progress", 1, ProgressEnum.a_third, StatusEnum.started),
+            ("progress", 5, ProgressEnum.full, StatusEnum.checked_in),
+            ("progress", -10, ProgressEnum.empty, StatusEnum.started),
+        ]
+        for field, delta, progress, status in steps:
+            transitioned = await service.transition(backlog.slug, field, delta)
+            assert transitioned is not None
+            assert (transitioned.progress, transitioned.status) == (progress, status)
+        transitioned = await service.transition(backlog.slug, "priority", 5)
+        assert transitioned is not None
+        assert transitioned.priority == PriorityEnum.hi
+        # already at the last member, so nothing changes nor is audited
+        transitioned = await service.transition(backlog.slug, "priority", 1)
+        assert transitioned is not None
+        assert transitioned.priority == PriorityEnum.hi
+        assert await service.transition("missing", "status", 1) is None
+
+        audits = await session.execute(
+            select(
+                BacklogAudit.field_name,
+                BacklogAudit.old_value,
+                BacklogAudit.new_value,
+                BacklogAudit.project_slug,
+                BacklogAudit.sprint_number,
+                BacklogAudit.points,
+            )
+            .where(BacklogAudit.backlog_id == backlog.id)
+            .order_by(BacklogAudit.created_at, BacklogAudit.field_name)
+        )
+        assert [tuple(row) for row in audits.all()] == [
+            ("progress", ProgressEnum.empty, ProgressEnum.a_third, "steps", 2, 3),
+            ("status", StatusEnum.new, StatusEnum.started, "steps", 2, 3),
+            ("progress", ProgressEnum.a_third, ProgressEnum.full, "steps", 2, 3),
+            ("status", StatusEnum.started, StatusEnum.checked_in, "steps", 2, 3),
+            ("progress", ProgressEnum.full, ProgressEnum.empty, "steps", 2, 3),
+            ("status", StatusEnum.checked_in, StatusEnum.started, "steps", 2, 3),
+            ("priority", PriorityEnum.med, PriorityEnum.hi, "steps", 2, 3),
+        ]
+        await session.rollback()
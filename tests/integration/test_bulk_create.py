@@ -0,0 +1,67 @@
+"""Tests of the `INSERT ... RETURNING` `bulk_create` path, and its benchmark against the unit of work `create_many`."""
+import timeit
+from datetime import UTC, date, datetime, timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+from litestar.exceptions import ValidationException
+
+from app.domain.backlogs.models import Service as BacklogService
+from app.domain.tags.services import TagService
+from app.domain.teams.services import TeamService
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+ROW_COUNT = 5000
+
+
+def _raw_tags(prefix: str) -> list[dict[str, str]]:
+    return [{"name": f"{prefix}-{i}", "description": f"Benchmark tag {i}"} for i in range(ROW_COUNT)]
+
+
+@pytest.mark.parametrize("return_models", [True, False])
+async def test_bulk_create_benchmark(sessionmaker: "async_sessionmaker[AsyncSession]", return_models: bool) -> None:
+    async with TagService.new(sessionmaker()) as tags_service:
+        start = timeit.default_timer()
+        created = await tags_service.create_many(_raw_tags("orm"))
+        orm_elapsed = timeit.default_timer() - start
+
+        start = timeit.default_timer()
+        bulk_created = await tags_service.bulk_create(_raw_tags("bulk"), return_models=return_models)
+        bulk_elapsed = timeit.default_timer() - start
+
+        assert len(created) == len(bulk_created) == ROW_COUNT
+        assert await tags_service.count() == 2 * ROW_COUNT
+        await tags_service.repository.session.rollback()
+
+    assert bulk_elapsed < orm_elapsed
+
+
+async def test_bulk_create_sets_model_defaults(sessionmaker: "async_sessionmaker[AsyncSession]") -> None:
+    today = datetime.now(UTC).date()
+    async with sessionmaker() as session, TeamService.new(session) as teams_service:
+        teams = await teams_service.bulk_create(
+            [{"name": "Bulk Team"}, {"name": "Bulk Team"}, {"name": "Slugged", "slug": "slugged"}]
+        )
+        assert teams[0].slug.startswith("bulk-team-")
+        assert teams[1].slug.startswith("bulk-team-")
+        assert teams[0].slug != teams[1].slug
+        assert teams[2].slug == "slugged"
+
+    async with sessionmaker() as session, BacklogService.new(session) as backlogs_service:
+        backlogs = await backlogs_service.bulk_create(
+            [
+                {"title": "First", "sprint_number": 1, "est_days": 2, "beg_date": today.isoformat()},
+                {"title": "Second", "sprint_number": 2, "est_days": 1, "beg_date": date(2023, 7, 1)},
+            ]
+        )
+        assert [backlog.slug.rsplit("-", 1)[0] for backlog in backlogs] == ["None-S1", "None-S2"]
+        assert [backlog.due_date for backlog in backlogs] == [today + timedelta(days=2), date(2023, 7, 2)]
+
+
+async def test_bulk_create_validates_values(sessionmaker: "async_sessionmaker[AsyncSession]") -> None:
+    async with sessionmaker() as session, TagService.new(session) as tags_service:
+        with pytest.raises(ValidationException):
+            await tags_service.bulk_create([{"name": "valid"}, {"name": 1}])
+        assert await tags_service.count() == 0
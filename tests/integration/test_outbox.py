@@ -0,0 +1,103 @@
+"""Tests of the transactional outbox, from the messages added in a change to their delivery."""
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy import select, update
+
+from app.domain.outbox import services
+from app.domain.outbox.models import OutboxMessage
+from app.domain.outbox.tasks import deliver_outbox
+from app.lib import db, settings
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+
+async def test_add_message(sessionmaker: "async_sessionmaker[AsyncSession]") -> None:
+    """Test that the messages are inserted once the session commits, once per key, and dropped when it rolls back."""
+    async with sessionmaker() as session:
+        services.add_message(session, "test.topic", {"n": 1}, key="test:1")
+        services.add_message(session, "test.topic", {"n": 2})
+        assert session.info[db.base.AFTER_COMMIT_SESSION_KEY] == [services.enqueue_delivery]
+        assert await session.scalar(select(OutboxMessage.id)) is None
+        await session.commit()
+        assert services.OUTBOX_SESSION_KEY not in session.info
+
+        services.add_message(session, "test.topic", {"n": 3}, key="test:1")
+        await session.commit()
+
+        services.add_message(session, "test.topic", {"n": 4})
+        await session.rollback()
+        assert services.OUTBOX_SESSION_KEY not in session.info
+        await session.commit()
+
+        payloads = await session.scalars(
+            select(OutboxMessage.payload).order_by(OutboxMessage.payload["n"].as_integer())
+        )
+        assert payloads.all() == [{"n": 1}, {"n": 2}]
+
+
+async def test_deliver_outbox(
+    sessionmaker: "async_sessionmaker[AsyncSession]", monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that the messages are delivered without holding their lock, retried with a backoff, then given up on."""
+    monkeypatch.setattr(settings.worker, "OUTBOX_MAX_ATTEMPTS", 3)
+    monkeypatch.setattr(settings.worker, "OUTBOX_RETRY_DELAY", 60)
+    monkeypatch.setattr(settings.worker, "OUTBOX_RETRY_BACKOFF", 90)
+    results: dict[str, list[Exception | None]] = {
+        "test:flaky": [ConnectionError("down"), None],
+        "test:down": [ConnectionError("down")] * 3,
+    }
+
+    async def deliver(message: OutboxMessage) -> None:
+        async with sessionmaker() as session:
+            # the message isn't locked by the delivery task
+            await session.execute(
+                select(OutboxMessage.id).where(OutboxMessage.id == message.id).with_for_update(nowait=True)
+            )
+        if error := results[message.key].pop(0):
+            raise error
+
+    monkeypatch.setitem(services.handlers, "test.topic", deliver)
+    async with sessionmaker() as session:
+        services.add_message(session, "test.topic", {}, key="test:flaky")
+        services.add_message(session, "test.topic", {}, key="test:down")
+        await session.commit()
+
+    async def deliver_all() -> dict[str, OutboxMessage]:
+        await deliver_outbox({})
+        async with sessionmaker() as session:
+            messages = {message.key: message for message in await session.scalars(select(OutboxMessage))}
+        async with sessionmaker() as session:
+            # make the retries available right away
+            await session.execute(update(OutboxMessage).values(available_at=datetime.now(UTC)))
+            await session.commit()
+        return messages
+
+    start = datetime.now(UTC)
+    messages = await deliver_all()
+    for message in messages.values():
+        assert (message.attempts, message.delivered_at, message.last_error) == (1, None, "ConnectionError('down')")
+        assert start + timedelta(seconds=60) <= message.available_at <= datetime.now(UTC) + timedelta(seconds=60)
+
+    start = datetime.now(UTC)
+    messages = await deliver_all()
+    assert messages["test:flaky"].attempts == 2
+    assert messages["test:flaky"].delivered_at is not None
+    assert messages["test:flaky"].last_error is None
+    assert messages["test:down"].attempts == 2
+    # the delay doubles, up to the backoff
+    assert start + timedelta(seconds=90) <= messages["test:down"].available_at
+    assert messages["test:down"].available_at <= datetime.now(UTC) + timedelta(seconds=90)
+
+    messages = await deliver_all()
+    assert messages["test:down"].attempts == 3
+    assert messages["test:down"].delivered_at is None
+    # given up on
+    messages = await deliver_all()
+    assert messages["test:down"].attempts == 3
+    assert results["test:down"] == []
+
+    monkeypatch.setattr(settings.worker, "OUTBOX_RETENTION", 0)
+    assert await deliver_all() == {}
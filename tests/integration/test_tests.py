@@ -8,10 +8,11 @@ from app.lib import db
 
 if TYPE_CHECKING:
     from litestar import Litestar
-    from litestar.stores.redis import RedisStore
     from redis.asyncio import Redis as AsyncRedis
     from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
 
+    from app.lib.cache import SingleFlightStore
+
 
 def test_cache_on_app(app: "Litestar", redis: "AsyncRedis") -> None:
     """Test that the app's cache is patched.
@@ -20,7 +21,8 @@ def test_cache_on_app(app: "Litestar", redis: "AsyncRedis") -> None:
         app: The test Litestar instance
         redis: The test Redis client instance.
     """
-    assert cast("RedisStore", app.stores.get("response_cache"))._redis is redis
+    store = cast("SingleFlightStore", app.stores.get("response_cache"))
+    assert store.store.backend._redis is redis
 
 
 def test_engine_on_app(app: "Litestar", engine: "AsyncEngine") -> None:
@@ -0,0 +1,76 @@
+"""Tests of the debounced updates of the Zulip backlog messages."""
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock
+
+import pytest
+from saq import Status
+
+from app.domain.backlogs.models import Backlog
+from app.domain.outbox.models import OutboxMessage
+from app.lib import worker
+from app.plugins import zulip
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+
+async def test_deliver_backlog_message_update() -> None:
+    """Test that updates are dropped while the update job is queued, and retried while it runs."""
+    queue = worker.queues["background-tasks"]
+    message = OutboxMessage(topic=zulip.UPDATE_BACKLOG_MESSAGE, key="update", payload={"backlog_id": "backlog"})
+
+    await zulip.deliver_backlog_message_update(message)
+    # coalesced with the queued update
+    await zulip.deliver_backlog_message_update(message)
+    job = await queue.job(f"{zulip.UPDATE_BACKLOG_MESSAGE}:backlog")
+    assert job is not None
+    assert (job.function, job.kwargs, job.status) == (
+        "update_backlog_message",
+        {"backlog_id": "backlog"},
+        Status.QUEUED,
+    )
+    assert job.scheduled > datetime.now(UTC).timestamp()
+    assert await queue.count("incomplete") == 1
+
+    # the running job may have read the backlog before the update committed
+    await job.update(status=Status.ACTIVE)
+    with pytest.raises(RuntimeError):
+        await zulip.deliver_backlog_message_update(message)
+    assert await queue.count("incomplete") == 1
+
+
+async def test_update_backlog_message(
+    sessionmaker: "async_sessionmaker[AsyncSession]", monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that the message is updated to the latest content, and retried until the message is sent."""
+    update_message = AsyncMock(return_value={"result": "success"})
+    monkeypatch.setattr(zulip, "update_message", update_message)
+    today = datetime.now(UTC).date()
+    async with sessionmaker() as session:
+        backlog = Backlog(
+            title="Zulip",
+            slug="zulip",
+            sprint_number=1,
+            est_days=1,
+            beg_date=today,
+            end_date=today,
+            due_date=today,
+            plugin_meta={"zulip_bot": "pipo"},
+        )
+        session.add(backlog)
+        await session.commit()
+
+    with pytest.raises(LookupError):
+        await zulip.update_backlog_message({}, backlog_id=str(backlog.id))
+    update_message.assert_not_awaited()
+
+    async with sessionmaker() as session:
+        backlog = await session.merge(backlog)
+        backlog.plugin_meta = {"zulip_bot": "pipo", "msg_id": 42}
+        backlog.title = "Zulip, renamed"
+        await session.commit()
+        content = zulip.backlog_content(backlog)
+    await zulip.update_backlog_message({}, backlog_id=str(backlog.id))
+    update_message.assert_awaited_once_with(msg_id=42, content=content)
+    assert "Zulip, renamed" in content
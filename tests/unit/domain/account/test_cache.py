@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.accounts.cache import USER_CACHE_IDS_SESSION_KEY, UserCache
+from app.lib import cache, db
+
+if TYPE_CHECKING:
+    import pytest
+
+
+async def test_user_cache_invalidate_after_commit(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that users are invalidated right away and once the session commits, in every process."""
+    redis = MagicMock(mget=AsyncMock(return_value=[b"other@example.com"]), delete=AsyncMock())
+    publish = AsyncMock()
+    monkeypatch.setattr(cache, "publish_local_invalidation", publish)
+    user_cache = UserCache(redis, namespace="test:users", expiration=60, local_expiration=5, maxsize=10)
+    user_id = uuid4()
+    user_cache.local.set("user@example.com", {"id": str(user_id)})
+    session = MagicMock(spec=AsyncSession, info={})
+
+    await user_cache.invalidate(user_id, session=session)
+    await user_cache.invalidate(user_id, session=session)
+
+    assert cache.local_caches["test:users"] is user_cache.local
+    assert user_cache.local.get("user@example.com") is None
+    publish.assert_any_await("test:users", ["other@example.com", "user@example.com"])
+    callbacks = session.info[db.base.AFTER_COMMIT_SESSION_KEY]
+    assert len(callbacks) == 1
+    assert session.info[USER_CACHE_IDS_SESSION_KEY] == {user_id}
+
+    redis.delete.reset_mock()
+    await callbacks[0]()
+    redis.delete.assert_awaited_once()
+    assert USER_CACHE_IDS_SESSION_KEY not in session.info
@@ -1,7 +1,9 @@
 from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, MagicMock
 
 from litestar.config.response_cache import default_cache_key_builder
 from litestar.testing import RequestFactory
+from redis.exceptions import ConnectionError as RedisConnectionError
 
 from app.lib import cache, settings
 
@@ -14,3 +16,58 @@ def test_cache_key_builder(monkeypatch: "pytest.MonkeyPatch") -> None:
     request = RequestFactory().get("/test")
     default_cache_key = default_cache_key_builder(request)
     assert cache.cache_key_builder(request) == f"the-slug:{default_cache_key}"
+
+
+def test_lru_cache_evicts_least_recently_used_and_expired() -> None:
+    now = 0.0
+    lru: cache.LRUCache[str, int] = cache.LRUCache(maxsize=2, expiration=5, timer=lambda: now)
+    lru.set("a", 1)
+    lru.set("b", 2)
+    assert lru.get("a") == 1
+    lru.set("c", 3)
+    assert lru.get("b") is None
+    assert dict(lru.items()) == {"a": 1, "c": 3}
+
+    now = 5.0
+    assert lru.get("a") is None
+    assert len(lru) == 1
+
+
+def test_tagged_cache_key_builder(monkeypatch: "pytest.MonkeyPatch") -> None:
+    monkeypatch.setattr(settings.AppSettings, "slug", "the-slug")
+    request = RequestFactory().get("/api/backlogs/slug/a#b", path_params={"slug": "a#b"})
+    key = cache.tagged_cache_key_builder("backlogs", "backlog:{slug}")(request)
+    assert key == f"#backlogs,{cache.entity_tag('backlog', 'a#b')}#{cache.cache_key_builder(request)}"
+    assert cache._split_tags(key) == (cache.cache_key_builder(request), ["backlogs", "backlog:a%23b"])
+    assert cache._split_tags("the-slug:/api/backlogs") == ("the-slug:/api/backlogs", [])
+
+    request = RequestFactory().get("/api/stats", path_params={"project_slug": "a:b", "sprint_number": "3"})
+    key = cache.tagged_cache_key_builder("sprint:{project_slug}:{sprint_number}")(request)
+    assert cache._split_tags(key)[1] == [cache.entity_tag("sprint", "a:b", 3)] == ["sprint:a%3Ab:3"]
+
+
+def test_lru_cache_max_bytes_and_entry_expiration() -> None:
+    now = 0.0
+    lru: cache.LRUCache[str, bytes] = cache.LRUCache(maxsize=10, expiration=60, timer=lambda: now, max_bytes=4)
+    lru.set("a", b"aa", expiration=1)
+    lru.set("b", b"bb")
+    lru.set("c", b"c")
+    assert lru.get("a") is None
+    assert lru.size == 3
+    lru.set("d", b"too large")
+    assert lru.get("d") is None
+
+    now = 30.0
+    assert lru.get("b") == b"bb"
+    now = 60.0
+    assert lru.get("b") is None
+    assert lru.size == 1
+
+
+async def test_invalidate_response_cache_redis_error(monkeypatch: "pytest.MonkeyPatch") -> None:
+    invalidate = AsyncMock(side_effect=RedisConnectionError)
+    monkeypatch.setattr(cache.response_cache_store, "invalidate", invalidate)
+    session = MagicMock(info={})
+    await cache.invalidate_response_cache(session, "backlogs", "backlog:a")
+    invalidate.assert_awaited_once_with("backlogs", "backlog:a")
+    assert session.info[cache.RESPONSE_CACHE_TAGS_SESSION_KEY] == {"backlogs", "backlog:a"}
@@ -1,21 +1,36 @@
 # pylint: disable=protected-access
 from __future__ import annotations
 
+import asyncio
 import random
+from datetime import UTC, datetime
 from typing import TYPE_CHECKING
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 from litestar.constants import SCOPE_STATE_NAMESPACE
 from litestar.contrib.sqlalchemy.plugins.init.config.common import SESSION_SCOPE_KEY
+from sqlalchemy import create_engine, insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column
 
 from app.lib import db
+from app.lib.db.orm import AuditColumns
 
 if TYPE_CHECKING:
     from litestar import Litestar
     from litestar.types import HTTPResponseStartEvent, HTTPScope
 
 
+class Base(DeclarativeBase):
+    pass
+
+
+class Note(Base, AuditColumns):
+    __tablename__ = "note"
+    id: Mapped[int] = mapped_column(primary_key=True)
+    text: Mapped[str]
+
+
 async def test_before_send_handler_success_response(
     app: Litestar, http_response_start: HTTPResponseStartEvent, http_scope: HTTPScope
 ) -> None:
@@ -40,3 +55,46 @@ async def test_before_send_handler_error_response(
     http_response_start["status"] = random.randint(300, 599)  # noqa: S311
     await db.before_send_handler(http_response_start, http_scope)
     mock_session.rollback.assert_awaited_once()
+
+
+async def test_before_send_handler_after_commit(
+    app: Litestar, http_response_start: HTTPResponseStartEvent, http_scope: HTTPScope
+) -> None:
+    """Test that the after commit callbacks run once the session commits, and are dropped when it rolls back."""
+    for status, awaited in ((200, True), (500, False)):
+        mock_session = MagicMock(spec=AsyncSession, info={})
+        http_scope["state"].setdefault(SCOPE_STATE_NAMESPACE, {}).update({SESSION_SCOPE_KEY: mock_session})
+        callback = AsyncMock()
+        # registered twice, e.g. by two changes notifying the same way, but awaited once
+        db.after_commit(mock_session, callback)
+        db.after_commit(mock_session, callback)
+        http_response_start["status"] = status
+        await db.before_send_handler(http_response_start, http_scope)
+        await asyncio.sleep(0)
+        assert callback.await_count == awaited
+        assert not mock_session.info
+
+
+def test_audit_columns() -> None:
+    """Test that audit columns are stamped when the rows are written, not when the model is imported."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    backdated = datetime(2020, 1, 1, tzinfo=UTC)
+    with Session(engine) as session:
+        note, old_note = Note(text="new"), Note(text="old", created_at=backdated)
+        session.add_all([note, old_note])
+        before = datetime.now(UTC)
+        session.flush()
+        assert note.created_at >= before
+        assert note.updated_at >= before
+        assert old_note.created_at == backdated
+
+        created_at = note.created_at
+        note.text = "edited"
+        session.flush()
+        assert note.created_at == created_at
+        assert note.updated_at > created_at
+
+        before = datetime.now(UTC)
+        inserted = session.scalars(insert(Note).returning(Note), [{"text": "core"}]).one()
+        assert inserted.created_at >= before
@@ -83,6 +83,14 @@ def test_order_by(
     assert filter_(field_name, sort_order) == OrderBy(field_name=field_name, sort_order=sort_order)
 
 
+def test_label_filter() -> None:
+    assert dependencies.provide_label_filter(["ui", "bug"], "all") == dependencies.ArrayFilter(
+        field_name="labels", values=["ui", "bug"], operator="contains"
+    )
+    assert dependencies.provide_label_filter(["ui"], "any").operator == "overlaps"
+    assert dependencies.provide_label_filter(None, "all").values == []
+
+
 def test_limit_offset_pagination() -> None:
     assert dependencies.provide_limit_offset_pagination(10, 100) == LimitOffset(100, 900)
 
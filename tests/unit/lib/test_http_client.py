@@ -0,0 +1,56 @@
+import asyncio
+from collections.abc import AsyncIterator
+
+import httpx
+import pytest
+
+from app.lib import http_client
+
+
+class _Body(httpx.AsyncByteStream):
+    """Streamed response body, which a real transport would read from the connection."""
+
+    def __init__(self, content: bytes) -> None:
+        self.content = content
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        yield self.content
+
+
+async def test_host_limited_transport() -> None:
+    """Test that the concurrent requests are limited per host, until their responses are closed."""
+    in_flight: dict[str, int] = {}
+    peaks: dict[str, int] = {}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        in_flight[host] = in_flight.get(host, 0) + 1
+        peaks[host] = max(peaks.get(host, 0), in_flight[host])
+        await asyncio.sleep(0.01)
+        in_flight[host] -= 1
+        return httpx.Response(200, stream=_Body(host.encode()))
+
+    transport = http_client.HostLimitedTransport(httpx.MockTransport(handler), max_requests_per_host=2)
+    async with httpx.AsyncClient(transport=transport) as client:
+        responses = await asyncio.gather(
+            *(client.get(f"https://{host}/") for host in ["a.example.com"] * 5 + ["b.example.com"] * 3)
+        )
+        assert [response.text for response in responses] == ["a.example.com"] * 5 + ["b.example.com"] * 3
+        assert peaks == {"a.example.com": 2, "b.example.com": 2}
+
+        async with client.stream("GET", "https://a.example.com/"), client.stream("GET", "https://a.example.com/"):
+            with pytest.raises(httpx.PoolTimeout):
+                await client.get("https://a.example.com/", timeout=httpx.Timeout(1, pool=0.01))
+            assert (await client.get("https://b.example.com/")).status_code == 200
+        assert (await client.get("https://a.example.com/")).status_code == 200
+
+
+async def test_shared_client_lifecycle() -> None:
+    """Test that the shared client is reused until shutdown, and recreated after."""
+    await http_client.on_startup()
+    client = http_client.get_client()
+    assert http_client.provide_http_client() is client
+    await http_client.on_shutdown()
+    assert client.is_closed
+    assert http_client.get_client() is not client
+    await http_client.on_shutdown()
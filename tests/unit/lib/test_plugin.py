@@ -0,0 +1,86 @@
+import asyncio
+import time
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from app.lib.plugin import BacklogPlugin, PluginDispatcher
+
+
+class _Plugin(BacklogPlugin):
+    def __init__(
+        self,
+        meta: dict[str, Any] | None = None,
+        delay: float = 0,
+        error: Exception | None = None,
+        in_place: bool = False,
+    ) -> None:
+        self.meta = meta
+        self.delay = delay
+        self.error = error
+        self.in_place = in_place
+
+    async def before_create(self, data: Any) -> Any:
+        return {**data, "seen": [*data.get("seen", []), self.meta]}
+
+    async def after_create(self, data: Any) -> Any:
+        await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        if self.meta is not None and self.in_place:
+            data.plugin_meta.update(self.meta)
+        elif self.meta is not None:
+            # replaces plugin_meta, which must not drop the keys set by the other plugins
+            data.plugin_meta = self.meta
+        return data
+
+    async def before_update(self, item_id: str, data: Any) -> Any:
+        return data
+
+    async def after_update(self, data: Any) -> Any:
+        return data
+
+    async def before_delete(self, item_id: Any) -> Any:
+        raise ValueError(item_id)
+
+    async def after_delete(self, data: Any) -> Any:
+        return data
+
+
+async def test_plugin_dispatcher_after_hooks() -> None:
+    """Test that the after hooks run concurrently, isolated, and that their `plugin_meta` changes are merged."""
+    dispatcher = PluginDispatcher(
+        [
+            _Plugin({"zulip_bot": "pipo", "msg_id": 1}, delay=0.05),
+            _Plugin({"zulip_bot": "pipo", "issue": 2}, delay=0.05),
+            _Plugin(error=RuntimeError("boom")),
+            _Plugin({"late": True}, delay=1),
+        ],
+        timeout=0.2,
+    )
+    obj = SimpleNamespace(slug="slug", plugin_meta={"zulip_bot": "pipo"})
+    start = time.perf_counter()
+    assert await dispatcher.after_create(obj)
+    assert time.perf_counter() - start < 0.5
+    assert obj.plugin_meta == {"zulip_bot": "pipo", "msg_id": 1, "issue": 2}
+
+    obj = SimpleNamespace(slug="slug", plugin_meta={})
+    assert not await dispatcher.after_update(obj)
+    assert obj.plugin_meta == {}
+
+
+async def test_plugin_dispatcher_after_hooks_in_place() -> None:
+    """Test that the `plugin_meta` changes made in place are detected, so that the service writes them."""
+    dispatcher = PluginDispatcher([_Plugin({"msg_id": 1}, in_place=True)])
+    obj = SimpleNamespace(slug="slug", plugin_meta={"zulip_bot": "pipo"})
+    assert await dispatcher.after_create(obj)
+    assert obj.plugin_meta == {"zulip_bot": "pipo", "msg_id": 1}
+
+
+async def test_plugin_dispatcher_before_hooks() -> None:
+    """Test that the before hooks run in order, each getting the data of the previous one, and raise."""
+    dispatcher = PluginDispatcher([_Plugin({"a": 1}), _Plugin({"b": 2})])
+    assert await dispatcher.before_create({}) == {"seen": [{"a": 1}, {"b": 2}]}
+    with pytest.raises(ValueError):
+        await dispatcher.before_delete("id")
@@ -0,0 +1,278 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, cast
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from litestar.contrib.repository.filters import LimitOffset
+from litestar.contrib.sqlalchemy.base import CommonTableAttributes
+from litestar.contrib.sqlalchemy.types import DateTimeUTC
+from litestar.exceptions import ValidationException
+from sqlalchemy import ARRAY, String, insert, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+from app.lib.filters import ArrayFilter, LimitCursor, decode_cursor, encode_cursor
+from app.lib.repository import (
+    SQLAlchemyAsyncRepository,
+    SQLAlchemyAsyncSlugRepository,
+    StatementCache,
+    StatementCacheInfo,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from sqlalchemy import ClauseElement
+    from sqlalchemy.engine import Dialect
+
+# untyped in SQLAlchemy
+_dialect = cast("Callable[[], Dialect]", postgresql.dialect)()
+
+
+class Base(CommonTableAttributes, DeclarativeBase):
+    pass
+
+
+class Widget(Base):
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str]
+    labels: Mapped[list[str] | None] = mapped_column(ARRAY(String))
+    created_at: Mapped[datetime | None] = mapped_column(DateTimeUTC(timezone=True))
+
+
+class WidgetRepository(SQLAlchemyAsyncRepository[Widget]):
+    model_type = Widget
+
+
+def _mock_session(*results: object) -> MagicMock:
+    session = MagicMock(spec=AsyncSession)
+    session.bind = MagicMock()
+    session.bind.dialect.name = "postgresql"
+    session.execute = AsyncMock(side_effect=list(results))
+    return session
+
+
+async def test_list_and_count_uses_single_window_statement() -> None:
+    widgets = [Widget(id=1, name="a"), Widget(id=2, name="b")]
+    session = _mock_session([(widgets[0], 7), (widgets[1], 7)])
+    repo = WidgetRepository(session=session)
+
+    results, total = await repo.list_and_count(LimitOffset(limit=2, offset=0))
+
+    assert results == widgets
+    assert total == 7
+    session.execute.assert_awaited_once()
+    statement = str(session.execute.await_args.args[0])
+    assert "count(*) OVER ()" in statement
+
+
+async def test_list_and_count_counts_separately_for_empty_page() -> None:
+    count_result = MagicMock()
+    count_result.scalar_one.return_value = 4
+    session = _mock_session([], count_result)
+    repo = WidgetRepository(session=session)
+
+    results, total = await repo.list_and_count(LimitOffset(limit=2, offset=10))
+
+    assert results == []
+    assert total == 4
+    assert session.execute.await_count == 2
+
+
+async def test_list_and_count_basic_query_mode() -> None:
+    count_result = MagicMock()
+    count_result.scalar_one.return_value = 1
+    list_result = MagicMock()
+    list_result.scalars.return_value = [Widget(id=1, name="a")]
+    session = _mock_session(count_result, list_result)
+    repo = WidgetRepository(session=session)
+
+    results, total = await repo.list_and_count(force_basic_query_mode=True)
+
+    assert len(results) == 1
+    assert total == 1
+    assert "OVER" not in str(session.execute.await_args_list[0].args[0])
+
+
+async def test_list_by_cursor_seeks_past_keyset() -> None:
+    list_result = MagicMock()
+    list_result.scalars.return_value = [Widget(id=1, name="a")]
+    session = _mock_session(list_result)
+    repo = WidgetRepository(session=session)
+    value, item_id = decode_cursor(encode_cursor("b", 2))
+
+    results = await repo.list(LimitCursor(limit=1, field_name="name", after=(value, item_id)))
+
+    assert len(results) == 1
+    statement = str(session.execute.await_args.args[0])
+    assert "(widget.name, widget.id) < (" in statement
+    assert "ORDER BY widget.name DESC, widget.id DESC" in statement
+
+
+async def test_list_by_cursor_restores_datetime_values() -> None:
+    list_result = MagicMock()
+    list_result.scalars.return_value = []
+    session = _mock_session(list_result)
+    repo = WidgetRepository(session=session)
+    created_at = datetime(2023, 7, 1, 12, 30, tzinfo=UTC)
+    value, item_id = decode_cursor(encode_cursor(created_at, 2))
+
+    await repo.list(LimitCursor(limit=1, after=(value, item_id)))
+
+    params = session.execute.await_args.args[0].compile().params
+    assert created_at in params.values()
+
+
+async def test_list_by_cursor_pages_through_null_values() -> None:
+    session = _mock_session(MagicMock(), MagicMock())
+    repo = WidgetRepository(session=session)
+
+    await repo.list(LimitCursor(limit=1, after=decode_cursor(encode_cursor(datetime.now(UTC), 2))))
+    await repo.list(LimitCursor(limit=1, after=decode_cursor(encode_cursor(None, 2))))
+
+    with_value, with_null = (str(call.args[0]) for call in session.execute.await_args_list)
+    assert "(widget.created_at, widget.id) < (" in with_value
+    assert "OR widget.created_at IS NULL" in with_value
+    assert "ORDER BY widget.created_at DESC NULLS LAST, widget.id DESC" in with_value
+    assert "widget.created_at IS NULL AND widget.id < " in with_null
+
+
+async def test_list_by_cursor_rejects_invalid_values() -> None:
+    repo = WidgetRepository(session=_mock_session())
+
+    with pytest.raises(ValidationException):
+        await repo.list(LimitCursor(limit=1, after=("not a date", 2)))
+
+
+async def test_insert_many_sends_one_statement_per_batch() -> None:
+    results = []
+    for ids in ([1, 2], [3, 4], [5]):
+        result = MagicMock()
+        result.scalars.return_value = ids
+        results.append(result)
+    session = _mock_session(*results)
+    repo = WidgetRepository(session=session)
+
+    ids = await repo.insert_many([{"name": str(i)} for i in range(5)], batch_size=2, return_models=False)
+
+    assert ids == [1, 2, 3, 4, 5]
+    assert session.execute.await_count == 3
+    assert [len(call.args[1]) for call in session.execute.await_args_list] == [2, 2, 1]
+    session.expunge.assert_not_called()
+
+
+class Gadget(Base):
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(unique=True)
+    label: Mapped[str | None]
+
+
+class GadgetRepository(SQLAlchemyAsyncRepository[Gadget]):
+    model_type = Gadget
+    match_fields = ["name"]
+
+
+async def test_get_or_create_uses_on_conflict() -> None:
+    result = MagicMock()
+    result.one.return_value = (Gadget(id=1, name="a"), False)
+    session = _mock_session(result)
+    repo = GadgetRepository(session=session)
+
+    instance, created = await repo.get_or_create(name="a", label="b")
+
+    assert instance.name == "a"
+    assert created is False
+    call = session.execute.await_args
+    assert call is not None
+    statement = str(cast("ClauseElement", call.args[0]).compile(dialect=_dialect))
+    assert "ON CONFLICT (name) DO UPDATE SET label = excluded.label" in statement
+    assert "RETURNING" in statement
+
+
+async def test_upsert_many_collapses_duplicate_matches() -> None:
+    result = MagicMock()
+    result.scalars.return_value = [1, 2]
+    session = _mock_session(result)
+    repo = GadgetRepository(session=session)
+
+    ids = await repo.upsert_many([{"name": "a"}, {"name": "b"}, {"name": "a"}], return_models=False)
+
+    assert ids == [1, 2]
+    call = session.execute.await_args
+    assert call is not None
+    statement = cast("ClauseElement", call.args[0]).compile(dialect=_dialect)
+    assert "ON CONFLICT (name) DO UPDATE SET name = excluded.name" in str(statement)
+    assert sorted(value for key, value in statement.params.items() if key.startswith("name")) == ["a", "b"]
+
+
+async def test_get_or_create_without_unique_match_fields_selects_first() -> None:
+    existing = MagicMock()
+    existing.scalar_one_or_none.return_value = Widget(id=1, name="a")
+    session = _mock_session(existing)
+    repo = WidgetRepository(session=session)
+
+    instance, created = await repo.get_or_create(match_fields=["name"], upsert=False, name="a")
+
+    assert instance.id == 1
+    assert created is False
+    assert "ON CONFLICT" not in str(session.execute.await_args.args[0])
+
+
+async def test_list_by_array_filter() -> None:
+    result = MagicMock()
+    result.scalars.return_value = []
+    session = _mock_session(result, result, result)
+    repo = WidgetRepository(session=session)
+
+    await repo.list(ArrayFilter("labels", ["a", "b"]))
+    await repo.list(ArrayFilter("labels", ["a", "b"], "overlaps"))
+    await repo.list(ArrayFilter("labels", []))
+
+    statements = [
+        str(cast("ClauseElement", call.args[0]).compile(dialect=_dialect)) for call in session.execute.await_args_list
+    ]
+    assert "WHERE widget.labels @> %(param_1)s::VARCHAR[]" in statements[0]
+    assert "WHERE widget.labels && %(param_1)s::VARCHAR[]" in statements[1]
+    assert "WHERE" not in statements[2]
+
+
+def test_statement_cache_counts_hits_and_misses() -> None:
+    cache = StatementCache()
+
+    first = cache.get("widgets", lambda: select(Widget))
+    second = cache.get("widgets", lambda: select(Widget).where(Widget.id == 1))
+
+    assert first is second
+    assert cache.cache_info() == StatementCacheInfo(hits=1, misses=1, size=1)
+    cache.clear()
+    assert cache.cache_info() == StatementCacheInfo(hits=0, misses=0, size=0)
+
+
+def test_default_statement_is_shared() -> None:
+    assert WidgetRepository(session=_mock_session()).statement is WidgetRepository(session=_mock_session()).statement
+
+
+class Sprocket(Base):
+    id: Mapped[int] = mapped_column(primary_key=True)
+    slug: Mapped[str] = mapped_column(unique=True)
+
+
+class SprocketRepository(SQLAlchemyAsyncSlugRepository[Sprocket]):
+    model_type = Sprocket
+
+
+def test_get_available_slug_is_evaluated_by_the_insert() -> None:
+    session = _mock_session()
+    repo = SprocketRepository(session=session)
+
+    slug = repo.get_available_slug("My Sprocket")
+
+    session.execute.assert_not_called()
+    statement = str(insert(Sprocket).values(slug=slug).compile(dialect=_dialect))
+    assert "to_hex(nextval('slug_suffix_seq'))" in statement
+    assert str(slug.compile(dialect=_dialect, compile_kwargs={"literal_binds": True})) == (
+        "'my-sprocket-' || to_hex(nextval('slug_suffix_seq'))"
+    )
@@ -1,6 +1,9 @@
 """Tests for the SAQ async worker functionality."""
 from __future__ import annotations
 
+import asyncio
+
+import saq
 from asyncpg.pgproto import pgproto
 from pydantic import BaseModel
 
@@ -26,3 +29,23 @@ def test_worker_decoder_handles_pydantic_models() -> None:
     pydantic_model = Model(a="a", b=1, c=2.34)
     encoded = worker.encoder.encode(pydantic_model)
     assert encoded == b'{"a":"a","b":1,"c":2.34}'
+
+
+async def test_worker_drain() -> None:
+    """Test that a draining worker takes no more jobs, and stops once its running jobs are done."""
+    worker_instance = worker.Worker(worker.queues["background-tasks"], functions=[])
+    job = saq.Job(function="job")
+    worker_instance.job_task_contexts[job] = {"task": asyncio.create_task(asyncio.sleep(0)), "aborted": False}
+    drain = asyncio.create_task(worker_instance.drain(timeout=1))
+    await asyncio.sleep(0.2)
+    assert not worker_instance.event.is_set()
+    worker_instance._process()
+    assert not worker_instance.tasks
+    worker_instance.job_task_contexts.clear()
+    await asyncio.wait_for(drain, timeout=1)
+    assert worker_instance.event.is_set()
+
+    # the jobs still running after the timeout are left to be cancelled
+    worker_instance.job_task_contexts[job] = {"task": asyncio.create_task(asyncio.sleep(0)), "aborted": False}
+    await asyncio.wait_for(worker_instance.drain(timeout=0.1), timeout=1)
+    assert worker_instance.event.is_set()